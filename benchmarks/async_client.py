@@ -0,0 +1,87 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark publishing many workspaces with the asynchronous client.
+
+A local stand-in server answers every request of the Structurizr API after a fixed
+latency. Run with `python benchmarks/async_client.py`.
+"""
+
+
+import asyncio
+import uuid
+
+from common import report, stand_in_server, timed
+
+from structurizr import (
+    AsyncStructurizrClient,
+    StructurizrClient,
+    StructurizrClientSettings,
+    Workspace,
+)
+from structurizr.api import gather_limited
+
+
+LATENCY = 0.01
+
+
+def main(workspaces: int = 150, limit: int = 10):
+    """Compare publishing workspaces one after another and concurrently."""
+
+    def publish_sequentially(clients):
+        for client in clients:
+            with client.lock():
+                client.put_workspace(
+                    Workspace(name="Local", description="", id=client.workspace_id)
+                )
+
+    async def publish(client: AsyncStructurizrClient):
+        async with client.lock():
+            await client.put_workspace(
+                Workspace(name="Local", description="", id=client.workspace_id)
+            )
+
+    def publish_concurrently(clients):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(
+                gather_limited((publish(client) for client in clients), limit=limit)
+            )
+        finally:
+            loop.close()
+
+    with stand_in_server(LATENCY) as url:
+        settings = [
+            StructurizrClientSettings(
+                url=url,
+                workspace_id=workspace_id,
+                api_key=uuid.uuid4(),
+                api_secret=uuid.uuid4(),
+                workspace_archive_location=None,
+            )
+            for workspace_id in range(1, workspaces + 1)
+        ]
+        # Each client creates its own connection pool and SSL context, which is
+        # costly, so the clients are created outside of the timed section.
+        clients = [StructurizrClient(settings=s) for s in settings]
+        baseline, _ = timed(lambda: publish_sequentially(clients))
+        clients = [AsyncStructurizrClient(settings=s) for s in settings]
+        improved, _ = timed(lambda: publish_concurrently(clients))
+    report(f"Publish {workspaces} workspaces (limit {limit})", baseline, improved)
+
+
+if __name__ == "__main__":
+    main()
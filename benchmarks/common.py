@@ -0,0 +1,194 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide helpers shared by the benchmark scripts."""
+
+
+import os
+import random
+import shutil
+import ssl
+import subprocess
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from typing import Callable, Iterator, Tuple, Type, TypeVar
+
+from structurizr import Workspace
+
+
+__all__ = ("build_landscape", "timed", "report", "stand_in_server")
+
+
+T = TypeVar("T")
+
+
+def build_landscape(
+    systems: int,
+    containers: int = 0,
+    relationships: int = 0,
+    *,
+    seed: int = 42,
+) -> Workspace:
+    """
+    Build a synthetic workspace for benchmarking.
+
+    Args:
+        systems (int): The number of software systems to create.
+        containers (int): The number of containers to create in each system.
+        relationships (int): The number of random relationships between containers
+            (or between systems, if there are no containers).
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        Workspace: A new workspace with a populated model and no views.
+
+    """
+    rng = random.Random(seed)
+    workspace = Workspace(name="Benchmark", description="A synthetic landscape.")
+    model = workspace.model
+    elements = []
+    for i in range(systems):
+        system = model.add_software_system(name=f"System {i}")
+        if containers:
+            for j in range(containers):
+                elements.append(system.add_container(name=f"Container {i}.{j}"))
+        else:
+            elements.append(system)
+    for i in range(relationships):
+        source, destination = rng.sample(elements, 2)
+        source.uses(destination, f"Uses {i}")
+    return workspace
+
+
+def timed(func: Callable[[], T], repeat: int = 1) -> Tuple[float, T]:
+    """Return the best wall-clock time in seconds of calling `func` and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(label: str, baseline: float, improved: float) -> None:
+    """Print a single line comparing a baseline timing with an improved one."""
+    speedup = baseline / improved if improved else float("inf")
+    print(
+        f"{label:<48} baseline {baseline:9.4f} s   "
+        f"improved {improved:9.4f} s   speed-up {speedup:8.1f}x"
+    )
+
+
+SUCCESS = b'{"success": true, "message": "OK"}'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answer Structurizr API requests after a fixed latency."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def _respond(self, content: bytes) -> None:
+        """Send a successful JSON response after the latency."""
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):  # noqa: N802
+        """Return an empty workspace."""
+        workspace_id = int(self.path.rsplit("/", 1)[1])
+        workspace = Workspace(name="Remote", description="", id=workspace_id)
+        self._respond(workspace.dumps().encode("utf-8"))
+
+    def do_PUT(self):  # noqa: N802
+        """Accept a workspace or a lock."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond(SUCCESS)
+
+    def do_DELETE(self):  # noqa: N802
+        """Accept an unlock."""
+        self._respond(SUCCESS)
+
+    def log_message(self, *args) -> None:
+        """Suppress logging of requests."""
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Serve the stand-in API, accepting many connections at once."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@contextmanager
+def stand_in_server(
+    latency: float = 0.0,
+    *,
+    tls: bool = False,
+    handler: Type[StandInHandler] = StandInHandler,
+) -> Iterator[str]:
+    """
+    Run a local stand-in of the Structurizr API in a thread and yield its URL.
+
+    Args:
+        latency (float): The number of seconds to wait before each response.
+        tls (bool): Whether to serve HTTPS with a self-signed certificate, which is
+            trusted through the `SSL_CERT_FILE` environment variable while the
+            server runs. This requires the `openssl` command.
+        handler (type): The request handler, a subclass of `StandInHandler`.
+
+    """
+    handler = type("Handler", (handler,), {"latency": latency})
+    server = StandInServer(("127.0.0.1", 0), handler)
+    with TemporaryDirectory() as tmpdir:
+        scheme = "http"
+        previous = os.environ.get("SSL_CERT_FILE")
+        if tls:
+            if shutil.which("openssl") is None:
+                raise RuntimeError("Serving HTTPS requires the `openssl` command.")
+            cert = Path(tmpdir) / "cert.pem"
+            key = Path(tmpdir) / "key.pem"
+            command = "openssl req -x509 -newkey rsa:2048 -nodes -days 1"
+            subprocess.run(
+                command.split()
+                + ["-keyout", str(key), "-out", str(cert), "-subj", "/CN=localhost"]
+                + ["-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            context.load_cert_chain(cert, key)
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+            os.environ["SSL_CERT_FILE"] = str(cert)
+            scheme = "https"
+        Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            yield f"{scheme}://127.0.0.1:{server.server_port}"
+        finally:
+            server.shutdown()
+            server.server_close()
+            if previous is None:
+                os.environ.pop("SSL_CERT_FILE", None)
+            else:
+                os.environ["SSL_CERT_FILE"] = previous
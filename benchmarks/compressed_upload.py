@@ -0,0 +1,83 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark uploading a large workspace with and without compression.
+
+A local stand-in server counts the bytes of each upload and delays its response as
+if the body had crossed a link of limited bandwidth, like a VPN. Run with
+`python benchmarks/compressed_upload.py [megabits per second]`.
+"""
+
+
+import sys
+import uuid
+
+from common import StandInHandler, build_landscape, report, stand_in_server, timed
+
+from structurizr import StructurizrClient, StructurizrClientSettings
+from structurizr.api.base_structurizr_client import zstandard
+
+
+class BandwidthHandler(StandInHandler):
+    """Record the size of uploads and delay them according to a bandwidth."""
+
+    bandwidth = 20e6
+    received = []
+
+    def do_PUT(self):  # noqa: N802
+        """Accept a workspace after its transfer time."""
+        size = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(size)
+        self.received.append(size)
+        self.latency = size * 8 / self.bandwidth
+        self._respond(b'{"success": true, "message": "OK"}')
+
+
+def main(megabits: float = 20.0):
+    """Compare uploads without compression, with gzip, and with zstd."""
+    workspace = build_landscape(4000, 3, 12000)
+    workspace.id = 1
+    BandwidthHandler.bandwidth = megabits * 1e6
+    encodings = ["gzip"] + (["zstd"] if zstandard is not None else [])
+    with stand_in_server(handler=BandwidthHandler) as url:
+
+        def upload(encoding):
+            settings = StructurizrClientSettings(
+                url=url,
+                workspace_id=1,
+                api_key=uuid.uuid4(),
+                api_secret=uuid.uuid4(),
+                workspace_archive_location=None,
+                request_encoding=encoding,
+            )
+            client = StructurizrClient(settings=settings)
+            client.merge_from_remote = False
+            duration, _ = timed(lambda: client.put_workspace(workspace), repeat=3)
+            client.close()
+            return duration, BandwidthHandler.received[-1]
+
+        baseline, plain_size = upload(None)
+        for encoding in encodings:
+            improved, size = upload(encoding)
+            report(f"Upload at {megabits:g} Mbit/s with {encoding}", baseline, improved)
+            print(
+                f"Bytes on the wire: {plain_size:,} uncompressed, {size:,} with "
+                f"{encoding} ({plain_size / size:.1f}x smaller)"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:]))
@@ -0,0 +1,44 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark serializing a workspace directly rather than via `WorkspaceIO.from_orm`.
+
+Run with `python benchmarks/direct_dump.py`.
+"""
+
+
+from common import build_landscape, report, timed
+
+from structurizr import WorkspaceIO
+
+
+def main(systems: int = 1000, containers: int = 10, relationships: int = 20000):
+    """Compare both ways of serializing a synthetic workspace."""
+    workspace = build_landscape(systems, containers, relationships)
+    view = workspace.views.create_system_landscape_view(
+        key="landscape", description="All systems."
+    )
+    view.add_all_elements()
+
+    baseline, expected = timed(lambda: WorkspaceIO.from_orm(workspace).json(), repeat=3)
+    improved, actual = timed(lambda: WorkspaceIO.json_from_orm(workspace), repeat=3)
+    assert actual == expected
+    size = len(actual) / 2 ** 20
+    report(f"Workspace.dumps ({size:.1f} MiB)", baseline, improved)
+
+
+if __name__ == "__main__":
+    main()
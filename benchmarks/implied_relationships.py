@@ -0,0 +1,114 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark creating implied relationships.
+
+Compare the strategy with cached ancestors and an index of relationships by their
+ends against the previous implementation. That recomputed the ancestors and scanned
+the outgoing relationships of every candidate source, which is costly for elements
+with many relationships. Both the incremental strategy and a single pass over the
+whole model are measured.
+
+Run with `python benchmarks/implied_relationships.py`.
+"""
+
+
+import random
+from itertools import product
+
+from common import build_landscape, report, timed
+
+from structurizr.model.implied_relationship_strategies import (
+    _clone_relationship,
+    create_implied_relationships_unless_same_exists,
+)
+from structurizr.model.software_system import SoftwareSystem
+
+
+def get_ancestors(element):
+    """Return the ancestors of an element, including itself, without caching."""
+    result = []
+    current = element
+    while current is not None:
+        result.append(current)
+        current = (
+            None
+            if isinstance(current, SoftwareSystem)
+            else getattr(current, "parent", None)
+        )
+    return result
+
+
+def legacy_strategy(relationship):
+    """Reproduce the previous `create_implied_relationships_unless_same_exists`."""
+    pairs = product(
+        get_ancestors(relationship.source), get_ancestors(relationship.destination)
+    )
+    for new_source, new_destination in pairs:
+        if (
+            new_source is new_destination
+            or new_source in get_ancestors(new_destination)
+            or new_destination in get_ancestors(new_source)
+        ):
+            continue
+        if not any(
+            r.destination is new_destination
+            and r.description == relationship.description
+            for r in new_source.get_efferent_relationships()
+        ):
+            _clone_relationship(relationship, new_source, new_destination)
+
+
+def build(strategy, systems, containers, relationships, seed=42):
+    """Build a landscape and choose random pairs of containers to relate."""
+    rng = random.Random(seed)
+    model = build_landscape(systems, containers).model
+    model.implied_relationship_strategy = strategy
+    elements = sorted(
+        (c for s in model.software_systems for c in s.containers),
+        key=lambda c: c.name,
+    )
+    pairs = [rng.sample(elements, 2) for _ in range(relationships)]
+    return model, [(s, d, f"Uses {i % 10}") for i, (s, d) in enumerate(pairs)]
+
+
+def main(systems: int = 20, containers: int = 5, relationships: int = 20000):
+    """Time adding relationships with the old and the new strategy."""
+
+    def run(strategy, batch=False):
+        model, pairs = build(strategy, systems, containers, relationships)
+
+        def add():
+            for source, destination, description in pairs:
+                source.uses(
+                    destination, description, create_implied_relationships=not batch
+                )
+            if batch:
+                model.create_implied_relationships()
+            return len(model.get_relationships())
+
+        return timed(add)
+
+    baseline, expected = run(legacy_strategy)
+    improved, actual = run(create_implied_relationships_unless_same_exists)
+    assert actual == expected
+    report(f"{relationships} relationships, incremental", baseline, improved)
+    improved, _ = run(create_implied_relationships_unless_same_exists, batch=True)
+    report(f"{relationships} relationships, single pass", baseline, improved)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark replicating element relationships to deployment instances.
+
+Compare the previous implementation, which scanned all model elements for instances
+in the same environment every time an instance was added, with the index of
+instances by environment and element, both per instance and for a whole
+environment at once with `Model.replicate_element_relationships`.
+
+Run with `python benchmarks/instance_replication.py [nodes]`.
+"""
+
+
+import sys
+
+from common import build_landscape, report, timed
+
+from structurizr.model.static_structure_element_instance import (
+    StaticStructureElementInstance,
+)
+
+
+def replicate_by_scan(instance):
+    """Replicate relationships as before, scanning the model for instances."""
+    element_instances = {
+        e
+        for e in instance.model.get_elements()
+        if isinstance(e, StaticStructureElementInstance)
+        and e.environment == instance.environment
+    }
+    for other_instance in element_instances:
+        other_element = other_instance.element
+        for relationship in instance.element.relationships:
+            if relationship.destination is other_element:
+                instance.add_relationship(
+                    destination=other_instance,
+                    description=relationship.description,
+                    technology=relationship.technology,
+                    interaction_style=relationship.interaction_style,
+                    linked_relationship_id=relationship.id,
+                ).tags.clear()
+        for relationship in other_element.relationships:
+            if relationship.destination is instance.element:
+                other_instance.add_relationship(
+                    destination=instance,
+                    description=relationship.description,
+                    technology=relationship.technology,
+                    interaction_style=relationship.interaction_style,
+                    linked_relationship_id=relationship.id,
+                ).tags.clear()
+
+
+def deploy(nodes: int, mode: str) -> int:
+    """Deploy every container of a landscape once per node and replicate."""
+    workspace = build_landscape(systems=120, containers=5, relationships=600)
+    model = workspace.model
+    containers = [c for s in model.software_systems for c in s.containers]
+    for i in range(nodes):
+        node = model.add_deployment_node(f"Node {i}", environment="Production")
+        for container in containers:
+            instance = node.add_container(
+                container, replicate_relationships=mode == "incremental"
+            )
+            if mode == "scan":
+                replicate_by_scan(instance)
+    if mode == "batch":
+        model.replicate_element_relationships("Production")
+    return len(model.get_relationships())
+
+
+def main(nodes: int = 5) -> None:
+    """Run the benchmark for a number of deployment nodes of 600 instances each."""
+    label = f"replicate {nodes * 600} instances"
+    baseline, expected = timed(lambda: deploy(nodes, "scan"))
+    incremental, actual = timed(lambda: deploy(nodes, "incremental"))
+    assert actual == expected
+    report(f"{label} (incremental)", baseline, incremental)
+    batch, actual = timed(lambda: deploy(nodes, "batch"))
+    assert actual == expected
+    report(f"{label} (batch)", baseline, batch)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,56 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark writing and reading a workspace with each installed JSON backend.
+
+The standard library `json` module serves as the baseline.
+
+Run with `python benchmarks/json_backends.py`.
+"""
+
+
+from common import build_landscape, report, timed
+
+from structurizr import Workspace, WorkspaceIO
+from structurizr.json_backend import JSON_BACKENDS, set_json_backend
+
+
+def main(systems: int = 1000, containers: int = 10, relationships: int = 20000):
+    """Compare the JSON backends on a synthetic workspace."""
+    workspace = build_landscape(systems, containers, relationships)
+    view = workspace.views.create_system_landscape_view(
+        key="landscape", description="All systems."
+    )
+    view.add_all_elements()
+
+    timings = {}
+    for name, backend in JSON_BACKENDS.items():
+        if not backend.available:
+            continue
+        set_json_backend(name)
+        dump, content = timed(
+            lambda: WorkspaceIO.json_bytes_from_orm(workspace), repeat=3
+        )
+        load, _ = timed(lambda: Workspace.loads(content, validate=False), repeat=3)
+        timings[name] = dump, load
+    baseline_dump, baseline_load = timings.pop("json")
+    for name, (dump, load) in timings.items():
+        report(f"{name}: WorkspaceIO.json_bytes_from_orm", baseline_dump, dump)
+        report(f"{name}: Workspace.loads", baseline_load, load)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark reading a single view of a parsed workspace with many views.
+
+Run with `python benchmarks/lazy_views.py`.
+"""
+
+
+from common import build_landscape, report, timed
+
+from structurizr import Workspace, WorkspaceIO
+
+
+def main(systems: int = 200, containers: int = 5, relationships: int = 2000):
+    """Compare loading a workspace eagerly and lazily to read a single view."""
+    workspace = build_landscape(systems, containers, relationships)
+    for system in workspace.model.software_systems:
+        landscape_view = workspace.views.create_system_landscape_view(
+            key=f"landscape-{system.id}", description=""
+        )
+        landscape_view.add_all_software_systems()
+        container_view = workspace.views.create_container_view(
+            key=f"containers-{system.id}", description="", software_system=system
+        )
+        container_view.add_all_containers()
+    key = next(iter(workspace.views.container_views)).key
+    workspace_io = WorkspaceIO.parse_raw(workspace.dumps())
+
+    def load(lazy: bool):
+        return Workspace.hydrate(workspace_io, lazy=lazy).views[key]
+
+    baseline, expected = timed(lambda: load(False), repeat=3)
+    improved, actual = timed(lambda: load(True), repeat=3)
+    assert len(actual.element_views) == len(expected.element_views)
+    views = len(workspace.views.views)
+    report(f"Hydrate and read one of {views} views", baseline, improved)
+
+
+if __name__ == "__main__":
+    main()
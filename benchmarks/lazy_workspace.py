@@ -0,0 +1,68 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark the time to first access of a large workspace loaded lazily.
+
+Run with `python benchmarks/lazy_workspace.py`. Increase the number of systems to
+approach larger files, for example, `python benchmarks/lazy_workspace.py 3600`
+writes a workspace of roughly 200 MB.
+"""
+
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from common import build_landscape, report, timed
+
+from structurizr import Workspace
+
+
+def main(systems: int = 800, containers: int = 5, relationships: int = 8000):
+    """Compare loading a workspace eagerly and lazily to read a part of it."""
+    workspace = build_landscape(systems, containers, relationships)
+    for system in workspace.model.software_systems:
+        landscape_view = workspace.views.create_system_landscape_view(
+            key=f"landscape-{system.id}", description=""
+        )
+        landscape_view.add_all_software_systems()
+        container_view = workspace.views.create_container_view(
+            key=f"containers-{system.id}", description="", software_system=system
+        )
+        container_view.add_all_containers()
+    element_id = next(iter(workspace.model.software_systems)).id
+
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "workspace.json"
+        workspace.dump(path)
+        size = path.stat().st_size / 2 ** 20
+
+        def first_element(lazy: bool):
+            return Workspace.load(path, lazy=lazy).model.get_element(element_id)
+
+        def styles(lazy: bool):
+            return Workspace.load(path, lazy=lazy).views.configuration.styles
+
+        baseline, _ = timed(lambda: first_element(False))
+        improved, _ = timed(lambda: first_element(True))
+        report(f"Time to first element ({size:.0f} MiB)", baseline, improved)
+        baseline, _ = timed(lambda: styles(False))
+        improved, _ = timed(lambda: styles(True))
+        report(f"Time to view styles ({size:.0f} MiB)", baseline, improved)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,84 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark many workspaces sharing one connection pool.
+
+A local HTTPS stand-in server answers every request of the Structurizr API. Run with
+`python benchmarks/multi_workspace.py`, which requires the `openssl` command.
+"""
+
+
+import uuid
+
+from common import report, stand_in_server, timed
+
+from structurizr import (
+    MultiWorkspaceClient,
+    StructurizrClient,
+    StructurizrClientSettings,
+    Workspace,
+)
+
+
+def main(workspaces: int = 150):
+    """Compare one client per workspace with clients sharing a connection pool."""
+
+    def get_separately(settings):
+        for workspace_settings in settings:
+            client = StructurizrClient(settings=workspace_settings)
+            client.get_workspace()
+            client.close()
+
+    def get_shared(settings):
+        with MultiWorkspaceClient() as clients:
+            clients.get_workspaces(settings)
+
+    def put_separately(settings):
+        for workspace_settings in settings:
+            client = StructurizrClient(settings=workspace_settings)
+            with client.lock():
+                client.put_workspace(
+                    Workspace(name="Local", description="", id=client.workspace_id)
+                )
+
+    def put_shared(settings):
+        with MultiWorkspaceClient() as clients:
+            clients.put_workspaces(
+                (s, Workspace(name="Local", description="", id=s.workspace_id))
+                for s in settings
+            )
+
+    with stand_in_server(tls=True) as url:
+        settings = [
+            StructurizrClientSettings(
+                url=url,
+                workspace_id=workspace_id,
+                api_key=uuid.uuid4(),
+                api_secret=uuid.uuid4(),
+                workspace_archive_location=None,
+            )
+            for workspace_id in range(1, workspaces + 1)
+        ]
+        baseline, _ = timed(lambda: get_separately(settings))
+        improved, _ = timed(lambda: get_shared(settings))
+        report(f"Get {workspaces} workspaces over HTTPS", baseline, improved)
+        baseline, _ = timed(lambda: put_separately(settings))
+        improved, _ = timed(lambda: put_shared(settings))
+        report(f"Lock and put {workspaces} workspaces over HTTPS", baseline, improved)
+
+
+if __name__ == "__main__":
+    main()
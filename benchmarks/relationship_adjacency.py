@@ -0,0 +1,56 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark the per-element relationship queries of the model.
+
+Compare the adjacency-backed `Element.get_efferent_relationships` and friends with a
+full scan over all relationships in the model, which is what they used to do.
+
+Run with `python benchmarks/relationship_adjacency.py`.
+"""
+
+
+from common import build_landscape, report, timed
+
+
+def main(systems: int = 400, containers: int = 5, relationships: int = 8000) -> None:
+    """Time relationship queries for every element in a synthetic model."""
+    model = build_landscape(systems, containers, relationships).model
+    elements = list(model.get_elements())
+
+    def scan():
+        return sum(
+            1
+            for element in elements
+            for r in model.get_relationships()
+            if element is r.source or element is r.destination
+        )
+
+    def adjacency():
+        return sum(1 for element in elements for _ in element.get_relationships())
+
+    baseline, expected = timed(scan)
+    improved, actual = timed(adjacency)
+    assert expected == actual
+    report(
+        f"{len(elements)} elements x {relationships} relationships",
+        baseline,
+        improved,
+    )
+
+
+if __name__ == "__main__":
+    main()
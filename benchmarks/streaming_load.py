@@ -0,0 +1,70 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark the peak memory of loading a workspace with and without streaming.
+
+Requires the optional `ijson` package. Each variant is measured in a fresh
+interpreter so that the measurements do not influence each other.
+
+Run with `python benchmarks/streaming_load.py`.
+"""
+
+
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from common import build_landscape, timed
+
+from structurizr import Workspace
+
+
+def measure(filename: str, stream: bool) -> None:
+    """Load the workspace and print the elapsed time and the peak memory."""
+    tracemalloc.start()
+    elapsed, _ = timed(lambda: Workspace.load(filename, stream=stream))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    label = "streaming" if stream else "default"
+    print(f"{label:<10} {elapsed:8.2f} s   peak memory {peak / 2 ** 20:9.1f} MiB")
+
+
+def main(systems: int = 1000, containers: int = 10, relationships: int = 20000):
+    """Write a synthetic workspace to disk and compare both ways of loading it."""
+    workspace = build_landscape(systems, containers, relationships)
+    view = workspace.views.create_system_landscape_view(
+        key="landscape", description="All systems."
+    )
+    view.add_all_elements()
+    with tempfile.TemporaryDirectory() as directory:
+        for suffix in (".json", ".json.gz"):
+            filename = Path(directory, f"workspace{suffix}")
+            workspace.dump(filename)
+            size = filename.stat().st_size / 2 ** 20
+            print(f"{filename.name} ({size:.1f} MiB)")
+            for stream in ("", "stream"):
+                subprocess.run(
+                    [sys.executable, __file__, str(filename), stream], check=True
+                )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(sys.argv[1], stream=len(sys.argv) > 2 and sys.argv[2] == "stream")
+    else:
+        main()
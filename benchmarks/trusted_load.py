@@ -0,0 +1,57 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark loading a trusted workspace without pydantic validation.
+
+Run with `python benchmarks/trusted_load.py`.
+"""
+
+
+import json
+
+from common import build_landscape, report, timed
+
+from structurizr import Workspace, WorkspaceIO
+
+
+def main(systems: int = 1000, containers: int = 10, relationships: int = 20000):
+    """Compare the validated and the trusted path of `Workspace.loads`."""
+    workspace = build_landscape(systems, containers, relationships)
+    view = workspace.views.create_system_landscape_view(
+        key="landscape", description="All systems."
+    )
+    view.add_all_elements()
+    content = workspace.dumps()
+    size = len(content) / 2 ** 20
+    obj = json.loads(content)
+
+    baseline, _ = timed(lambda: WorkspaceIO.parse_obj(obj), repeat=3)
+    improved, _ = timed(lambda: WorkspaceIO.parse_obj_trusted(obj), repeat=3)
+    report("WorkspaceIO from parsed JSON", baseline, improved)
+
+    baseline, _ = timed(lambda: Workspace.loads(content), repeat=3)
+    improved, _ = timed(
+        lambda: Workspace.loads(content, validate=False), repeat=3
+    )
+    report(f"Workspace.loads ({size:.1f} MiB)", baseline, improved)
+    print(
+        f"{'throughput':<48} baseline {size / baseline:7.2f} MiB/s "
+        f"improved {size / improved:7.2f} MiB/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark publishing many workspaces of which only a few changed.
+
+A local stand-in server answers every request of the Structurizr API. Run with
+`python benchmarks/unchanged_upload.py`.
+"""
+
+
+import uuid
+from tempfile import TemporaryDirectory
+
+from common import build_landscape, report, stand_in_server, timed
+
+from structurizr import MultiWorkspaceClient, StructurizrClientSettings
+from structurizr.api import WorkspaceCache
+
+
+def main(workspaces: int = 50, changed: int = 5):
+    """Compare publishing with and without skipping unchanged workspaces."""
+    with stand_in_server(latency=0.02) as url, TemporaryDirectory() as tmpdir:
+        pairs = []
+        for workspace_id in range(1, workspaces + 1):
+            settings = StructurizrClientSettings(
+                url=url,
+                workspace_id=workspace_id,
+                api_key=uuid.uuid4(),
+                api_secret=uuid.uuid4(),
+                workspace_archive_location=None,
+            )
+            workspace = build_landscape(200, 2, 400, seed=workspace_id)
+            workspace.id = workspace_id
+            pairs.append((settings, workspace))
+        cache = WorkspaceCache(tmpdir)
+        with MultiWorkspaceClient(cache=cache) as clients:
+            # Publish once to record the fingerprints.
+            clients.put_workspaces(pairs)
+        for _, workspace in pairs[:changed]:
+            workspace.description = "Changed"
+
+        def publish(cache):
+            with MultiWorkspaceClient(cache=cache) as clients:
+                return clients.put_workspaces(pairs)
+
+        baseline, _ = timed(lambda: publish(None))
+        improved, uploaded = timed(lambda: publish(cache))
+        report(
+            f"Publish {workspaces} workspaces, {changed} changed", baseline, improved
+        )
+        print(f"Uploaded {uploaded} workspaces with fingerprints")
+
+
+if __name__ == "__main__":
+    main()
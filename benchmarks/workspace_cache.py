@@ -0,0 +1,89 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark repeatedly fetching an unchanged workspace with and without a cache.
+
+A local stand-in server answers conditional requests. Run with
+`python benchmarks/workspace_cache.py`.
+"""
+
+
+import hashlib
+import uuid
+from tempfile import TemporaryDirectory
+
+from common import StandInHandler, build_landscape, report, stand_in_server, timed
+
+from structurizr import StructurizrClient, StructurizrClientSettings
+from structurizr.api import WorkspaceCache
+
+
+class ConditionalHandler(StandInHandler):
+    """Serve a large workspace, honouring the `If-None-Match` header."""
+
+    content = build_landscape(2000, 2, 4000).dumps().encode("utf-8")
+    etag = f'"{hashlib.sha256(content).hexdigest()}"'
+
+    def do_GET(self):  # noqa: N802
+        """Return the workspace unless the client has the current revision."""
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.content)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(self.content)
+
+
+def main(fetches: int = 10):
+    """Compare fetching an unchanged workspace with and without a cache."""
+
+    def fetch(client):
+        for _ in range(fetches):
+            client.get_workspace()
+
+    with stand_in_server(handler=ConditionalHandler) as url:
+        settings = StructurizrClientSettings(
+            url=url,
+            workspace_id=1,
+            api_key=uuid.uuid4(),
+            api_secret=uuid.uuid4(),
+            workspace_archive_location=None,
+        )
+        plain = StructurizrClient(settings=settings)
+        baseline, _ = timed(lambda: fetch(plain))
+        with TemporaryDirectory() as tmpdir:
+            cache = WorkspaceCache(tmpdir)
+            cached = StructurizrClient(settings=settings, cache=cache)
+            improved, _ = timed(lambda: fetch(cached))
+        report(
+            f"Fetch an unchanged {len(ConditionalHandler.content) >> 20} MiB "
+            f"workspace {fetches} times",
+            baseline,
+            improved,
+        )
+        print(f"Cache hits {cache.hits}, misses {cache.misses}")
+        plain.close()
+        cached.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,8 @@ __email__ = "midnighter@posteo.net"
 from .helpers import show_versions
 from .workspace import Workspace, WorkspaceIO
 from .api import (
+    AsyncStructurizrClient,
+    MultiWorkspaceClient,
     StructurizrClient,
     StructurizrClientException,
     StructurizrClientSettings,
@@ -20,3 +20,6 @@ from .api_response import APIResponse
 from .structurizr_client_exception import StructurizrClientException
 from .structurizr_client_settings import StructurizrClientSettings
 from .structurizr_client import StructurizrClient
+from .async_structurizr_client import AsyncStructurizrClient, gather_limited
+from .multi_workspace_client import MultiWorkspaceClient
+from .workspace_cache import WorkspaceCache
@@ -0,0 +1,237 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide an asynchronous Structurizr client."""
+
+import asyncio
+from typing import Awaitable, Iterable, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from ..workspace import Workspace
+from .base_structurizr_client import BaseStructurizrClient
+from .structurizr_client_exception import StructurizrClientException
+from .structurizr_client_settings import StructurizrClientSettings
+from .workspace_cache import WorkspaceCache
+
+
+__all__ = ("AsyncStructurizrClient", "gather_limited")
+
+
+T = TypeVar("T")
+
+
+class AsyncStructurizrClient(BaseStructurizrClient):
+    """
+    Define an asynchronous Structurizr client.
+
+    Works like the `StructurizrClient`, signing requests in the same way and with
+    the same lock semantics, but its methods are coroutines such that operations on
+    many workspaces can run concurrently, for example, with `gather_limited`.
+
+    Attributes:
+        url (str): The Structurizr API URL.
+        workspace_id (int): The Structurizr workspace identifier.
+        api_key (str): The Structurizr workspace API key.
+        api_secret (str): The Structurizr workspace API secret.
+        user (str): A string identifying the user (e.g. an e-mail address or username).
+        agent (str): A string identifying the agent (e.g. 'structurizr-java/1.2.0').
+        workspace_archive_location (pathlib.Path): A directory for archiving downloaded
+            workspaces, or None to suppress archiving.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: StructurizrClientSettings,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[WorkspaceCache] = None,
+        **kwargs,
+    ):
+        """
+        Initialize an asynchronous Structurizr client.
+
+        Keyword Args:
+            settings (StructurizrClientSettings): The client configuration.
+            http_client (httpx.AsyncClient, optional): An HTTP client to send requests
+                with, for example, to share its connection pool with other clients.
+                It is not closed by this client. By default, a new one is created.
+            cache (WorkspaceCache, optional): A cache of downloaded workspaces,
+                which may be shared with other clients.
+
+        """
+        super().__init__(settings=settings, cache=cache, **kwargs)
+        self._owns_client = http_client is None
+        self._client = httpx.AsyncClient() if http_client is None else http_client
+
+    def lock(self) -> "_AsyncWorkspaceLock":
+        """Provide an asynchronous context manager for locking a workspace."""
+        return _AsyncWorkspaceLock(self)
+
+    async def close(self) -> None:
+        """Close the connection pool, unless it was passed in as `http_client`."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def get_workspace(self) -> Workspace:
+        """
+        Retrieve a Structurizr workspace from the API.
+
+        If the client has a cache, the same workspace instance is returned for as
+        long as the remote workspace is unchanged, so please treat it as read-only.
+
+        Returns:
+            Workspace: A workspace instance that represents the online state.
+
+        Raises:
+            httpx.HTTPError: If anything goes wrong in connecting to the API.
+
+        """
+        response = await self._client.send(self._build_get_workspace_request())
+        return self._load_workspace(response)
+
+    async def put_workspace(
+        self,
+        workspace: Workspace,
+        *,
+        force: bool = False,
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        """
+        Update the remote Structurizr workspace with the given instance.
+
+        If the client has a cache, the upload is skipped when the workspace is
+        unchanged since its last upload by any client using the same cache. Volatile
+        fields, such as the last modified date, are ignored in the comparison.
+
+        Args:
+            workspace (Workspace): The new workspace to update with.
+            force (bool, optional): Whether to upload an unchanged workspace anyway,
+                for example, because the remote workspace was modified by others.
+            fingerprint (str, optional): The fingerprint of the workspace, if it
+                was already computed with `fingerprint`.
+
+        Returns:
+            bool: `True` if the workspace was uploaded, `False` if it was unchanged.
+
+        Raises:
+            httpx.HTTPError: If anything goes wrong in connecting to the API.
+
+        """
+        assert workspace.id == self.workspace_id
+
+        if fingerprint is None:
+            fingerprint = self.fingerprint(workspace)
+        if not force and self.is_unchanged(fingerprint):
+            return False
+        if self.merge_from_remote:
+            self._merge_remote_workspace(workspace, await self.get_workspace())
+        response = await self._client.send(self._build_put_workspace_request(workspace))
+        self._check_put_workspace_response(response)
+        self._record_upload(fingerprint)
+        return True
+
+    async def _lock_workspace(self) -> Tuple[bool, bool]:
+        """
+        Lock the Structurizr workspace.
+
+        Returns:
+            bool: `True` if lock succeeeded
+            bool: `True` if on paid plan
+        """
+        response = await self._client.send(self._build_lock_request("PUT"))
+        return self._parse_lock_response(response)
+
+    async def lock_workspace(self) -> bool:
+        """
+        Lock the Structurizr workspace.
+
+        Returns:
+            bool: `True` if the workspace could be locked, `False` otherwise.
+
+        Note that free plan Structurizr licences do not support locking, so this
+        will fail but continue anyway.
+        """
+        return self._is_locked(*await self._lock_workspace())
+
+    async def unlock_workspace(self) -> bool:
+        """
+        Unlock the Structurizr workspace.
+
+        Returns:
+            bool: `True` if the workspace could be unlocked, `False` otherwise.
+
+        """
+        response = await self._client.send(self._build_lock_request("DELETE"))
+        return self._parse_unlock_response(response)
+
+
+class _AsyncWorkspaceLock:
+    """Lock a remote workspace for the duration of an asynchronous context."""
+
+    def __init__(self, client: AsyncStructurizrClient, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._client = client
+        self._locked = False
+
+    async def __aenter__(self) -> AsyncStructurizrClient:
+        client = self._client
+        self._locked, paid_plan = await client._lock_workspace()
+        if paid_plan and not self._locked:
+            raise StructurizrClientException(
+                f"Failed to lock the Structurizr workspace {client.workspace_id}."
+            )
+        return client
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        client = self._client
+        is_successful = await client.unlock_workspace() if self._locked else True
+        await client.close()
+        if not is_successful:
+            raise StructurizrClientException(
+                f"Failed to unlock the Structurizr workspace {client.workspace_id}."
+            )
+
+
+async def gather_limited(
+    operations: Iterable[Awaitable[T]], *, limit: Optional[int] = 10
+) -> List[T]:
+    """
+    Run many operations concurrently, but at most `limit` at a time.
+
+    Args:
+        operations (iterable): The awaitables to run, for example, calls of
+            `AsyncStructurizrClient.put_workspace` for many workspaces.
+        limit (int, optional): The maximum number of operations that run at the
+            same time, or `None` for no limit.
+
+    Returns:
+        list: The results of the operations in the order they were given.
+
+    Raises:
+        Exception: The first exception raised by any operation.
+
+    """
+    if limit is None:
+        return list(await asyncio.gather(*operations))
+    if limit < 1:
+        raise ValueError(f"The limit must be positive, not {limit}.")
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(operation: Awaitable[T]) -> T:
+        async with semaphore:
+            return await operation
+
+    return list(await asyncio.gather(*(run(operation) for operation in operations)))
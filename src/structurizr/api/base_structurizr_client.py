@@ -0,0 +1,457 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide the parts of a Structurizr client that do not depend on the transport."""
+
+
+import gzip
+import hashlib
+import hmac
+import json
+import logging
+from base64 import b64encode
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import unquote_plus
+
+import httpx
+
+
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+from ..json_backend import loads as json_loads
+from ..workspace import Workspace, WorkspaceIO
+from .api_response import APIResponse
+from .structurizr_client_exception import StructurizrClientException
+from .structurizr_client_settings import StructurizrClientSettings
+from .workspace_cache import WorkspaceCache
+
+
+__all__ = ("BaseStructurizrClient",)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Fields that change with every upload or are set by the server.
+VOLATILE_FIELDS = (
+    "revision",
+    "thumbnail",
+    "last_modified_date",
+    "last_modified_user",
+    "last_modified_agent",
+)
+
+# Collections that are held in sets, whose order differs between processes, by their
+# JSON keys. The configuration, for example, the styles, is ordered instead.
+UNORDERED_COLLECTIONS = frozenset(
+    (
+        "people",
+        "softwareSystems",
+        "deploymentNodes",
+        "containers",
+        "components",
+        "codeElements",
+        "children",
+        "containerInstances",
+        "softwareSystemInstances",
+        "infrastructureNodes",
+        "healthChecks",
+        "perspectives",
+        "relationships",
+        "elements",
+        "vertices",
+    )
+)
+
+
+class BaseStructurizrClient:
+    """
+    Define the common parts of the Structurizr clients.
+
+    Builds and signs the requests to the Structurizr API and interprets its
+    responses, while sending requests is left to the subclasses, which use an
+    `httpx` client as `_client`. Requests carry absolute URLs and their own
+    headers, such that one `httpx` client can be shared by many workspaces.
+
+    Attributes:
+        url (str): The Structurizr API URL.
+        workspace_id (int): The Structurizr workspace identifier.
+        api_key (str): The Structurizr workspace API key.
+        api_secret (str): The Structurizr workspace API secret.
+        user (str): A string identifying the user (e.g. an e-mail address or username).
+        agent (str): A string identifying the agent (e.g. 'structurizr-java/1.2.0').
+        workspace_archive_location (pathlib.Path): A directory for archiving downloaded
+            workspaces, or None to suppress archiving.
+        request_encoding (str): The compression of uploaded workspaces, 'gzip' or
+            'zstd', or None.
+        cache (WorkspaceCache): A cache of downloaded workspaces, or None.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: StructurizrClientSettings,
+        cache: Optional[WorkspaceCache] = None,
+        **kwargs,
+    ):
+        """
+        Initialize a Structurizr client.
+
+        Keyword Args:
+            settings (StructurizrClientSettings): The client configuration.
+            cache (WorkspaceCache, optional): A cache of downloaded workspaces.
+
+        """
+        super().__init__(**kwargs)
+        self.url = str(settings.url)
+        self.workspace_id = settings.workspace_id
+        self.api_key = str(settings.api_key)
+        self.api_secret = str(settings.api_secret)
+        self.user = settings.user
+        self.agent = settings.agent
+        self.workspace_archive_location = settings.workspace_archive_location
+        self.request_encoding = getattr(settings, "request_encoding", None)
+        if self.request_encoding == "zstd" and zstandard is None:
+            raise ImportError(
+                "The request encoding 'zstd' requires the package 'zstandard'."
+            )
+        self.merge_from_remote = True
+        self.cache = cache
+        self._workspace_url = f"{self.url.rstrip('/')}/workspace/{self.workspace_id}"
+        self._lock_url = f"{self._workspace_url}/lock"
+        self._params = {
+            "user": settings.user,
+            "agent": settings.agent,
+        }
+        self._headers = {"User-Agent": self.agent}
+        self._application_json = "application/json; charset=UTF-8"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the client."""
+        return (
+            f"{type(self).__name__}(url={self.url}, workspace_id={self.workspace_id})"
+        )
+
+    def _build_get_workspace_request(self) -> httpx.Request:
+        """Build a signed request for retrieving the workspace."""
+        request = self._client.build_request(
+            "GET", self._workspace_url, headers=self._headers
+        )
+        if self.cache is not None:
+            request.headers.update(self.cache.get_validators(self.workspace_id))
+        request.headers.update(self._add_headers(request))
+        return request
+
+    def _load_workspace(self, response: httpx.Response) -> Workspace:
+        """Load the workspace from the response to a retrieval request."""
+        if response.status_code == 304 and self.cache is not None:
+            workspace = self.cache.get_workspace(self.workspace_id)
+            if workspace is not None:
+                return workspace
+        if response.status_code != 200:
+            raise StructurizrClientException(
+                f"Failed to retrieve the Structurizr workspace {self.workspace_id}.\n"
+                f"Response {response.status_code} - {response.reason_phrase}"
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(response.text)
+        self._archive_workspace(response.content)
+        if self.cache is None:
+            return Workspace.loads(response.content)
+        return self.cache.add_workspace(
+            self.workspace_id,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    @staticmethod
+    def _merge_remote_workspace(
+        workspace: Workspace, remote_workspace: Workspace
+    ) -> None:
+        """Copy the layout of the remote workspace into the given one."""
+        if remote_workspace:
+            workspace.views.copy_layout_information_from(remote_workspace.views)
+            # TODO:
+            # workspace.views.configuration.copy_configuration_from(remote_workspace.views.configuration)
+
+    def fingerprint(self, workspace: Workspace) -> Optional[str]:
+        """
+        Return the fingerprint of a workspace if unchanged uploads can be skipped.
+
+        Returns:
+            str: The SHA-256 digest of the workspace content, or `None` if the client
+                has no cache to compare it with.
+
+        """
+        if self.cache is None:
+            return None
+        return self._workspace_fingerprint(workspace)
+
+    def is_unchanged(self, fingerprint: Optional[str]) -> bool:
+        """Return whether a workspace with the fingerprint was uploaded last."""
+        if fingerprint is None:
+            return False
+        if self.cache.get_fingerprint(self.workspace_id) != fingerprint:
+            return False
+        logger.info(
+            f"Skipping the upload of the unchanged workspace {self.workspace_id}."
+        )
+        return True
+
+    def _record_upload(self, fingerprint: Optional[str]) -> None:
+        """Remember the fingerprint of a successfully uploaded workspace."""
+        if fingerprint is not None:
+            self.cache.set_fingerprint(self.workspace_id, fingerprint)
+
+    @staticmethod
+    def _workspace_fingerprint(workspace: Workspace) -> str:
+        """
+        Return the SHA-256 digest of the canonical JSON of a workspace.
+
+        The fields in `VOLATILE_FIELDS` are left out, and the collections in
+        `UNORDERED_COLLECTIONS` are sorted. The canonical JSON is always written by
+        the standard library, such that the fingerprint does not depend on the
+        installed JSON libraries.
+
+        """
+        workspace_json = WorkspaceIO.json_bytes_from_orm(
+            workspace, update=dict.fromkeys(VOLATILE_FIELDS)
+        )
+        canonical = _canonical(json_loads(workspace_json))
+        return hashlib.sha256(_canonical_json(canonical).encode("utf-8")).hexdigest()
+
+    def _build_put_workspace_request(self, workspace: Workspace) -> httpx.Request:
+        """Build a signed request for updating the remote workspace."""
+        workspace_json = WorkspaceIO.json_bytes_from_orm(
+            workspace,
+            update={
+                "thumbnail": None,
+                "last_modified_date": datetime.now(timezone.utc),
+                "last_modified_agent": self.agent,
+                "last_modified_user": self.user,
+            },
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(workspace_json.decode("utf-8"))
+        headers = self._headers
+        if self.request_encoding is not None:
+            # The content hash in the signature covers the compressed body.
+            workspace_json = self._compress(workspace_json)
+            headers = {**headers, "Content-Encoding": self.request_encoding}
+        request = self._client.build_request(
+            method="PUT",
+            url=self._workspace_url,
+            content=workspace_json,
+            headers=headers,
+        )
+        request.headers.update(
+            self._add_headers(
+                request,
+                content=workspace_json,
+                content_type=self._application_json,
+            )
+        )
+        return request
+
+    def _compress(self, content: bytes) -> bytes:
+        """Compress a request body with the configured encoding."""
+        if self.request_encoding == "zstd":
+            return zstandard.ZstdCompressor().compress(content)
+        # The highest level takes several times longer for a few percent less.
+        return gzip.compress(content, compresslevel=6)
+
+    def _check_put_workspace_response(self, response: httpx.Response) -> None:
+        """Raise an exception if updating the remote workspace failed."""
+        if response.status_code != 200:
+            body = json_loads(response.content)
+            raise StructurizrClientException(
+                f"Failed to update the Structurizr workspace {self.workspace_id}.\n"
+                f"HTTP Status {response.status_code} - {response.reason_phrase}\n"
+                f"Error message: {body.get('message', '')}"
+            )
+
+    def _build_lock_request(self, method: str) -> httpx.Request:
+        """Build a signed request for locking ('PUT') or unlocking ('DELETE')."""
+        request = self._client.build_request(
+            method, self._lock_url, params=self._params, headers=self._headers
+        )
+        request.headers.update(self._add_headers(request))
+        return request
+
+    def _parse_lock_response(self, response: httpx.Response) -> Tuple[bool, bool]:
+        """
+        Interpret the response to a lock request.
+
+        Returns:
+            bool: `True` if lock succeeeded
+            bool: `True` if on paid plan
+        """
+        response.raise_for_status()
+        response = APIResponse.parse_raw(response.content)
+        logger.debug("%r", response)
+        paid_plan = self._paid_plan(response)
+        if not response.success:
+            logger.warning(
+                f"Failed to lock workspace {self.workspace_id}. {response.message}"
+            )
+            if not paid_plan:
+                logger.warning("Locking not supoprted on free plan.  Ignoring.")
+        return response.success, paid_plan
+
+    @staticmethod
+    def _is_locked(success: bool, paid_plan: bool) -> bool:
+        """Return whether a lock request counts as successful."""
+        # Free plans can't lock so ignore.
+        return success or not paid_plan
+
+    def _parse_unlock_response(self, response: httpx.Response) -> bool:
+        """Return whether the workspace was unlocked according to the response."""
+        response.raise_for_status()
+        response = APIResponse.parse_raw(response.content)
+        success = response.success
+        if not response.success:
+            logger.warning(
+                f"Failed to unlock workspace {self.workspace_id}. {response.message}"
+            )
+            if not self._paid_plan(response):
+                logger.warning("Unlocking not supported on free plan.  Ignoring.")
+                success = True
+        return success
+
+    def _add_headers(
+        self,
+        request: httpx.Request,
+        content: Union[str, bytes] = b"",
+        content_type: str = "",
+    ) -> Dict[str, str]:
+        """
+        Prepare the Structurizr specific headers.
+
+        Args:
+            request (httpx.Request): The request to create headers for.
+            content (str or bytes): The workspace definition as (UTF-8 encoded) JSON.
+            content_type (str): The content MIME-type (e.g. 'application/json').
+
+        Returns:
+            dict: Items in the dictionary define headers and their values.
+
+        """
+        method = request.method
+        url_path = request.url.raw_path.decode("ascii")
+        definition_md5 = self._md5(content)
+        nonce = self._number_once()
+        message_digest = self._message_digest(
+            method,
+            unquote_plus(url_path),
+            definition_md5,
+            content_type,
+            nonce,
+        )
+        logger.debug("The message digest:\n%s", message_digest)
+        message_hash = self._base64_str(self._hmac_hex(self.api_secret, message_digest))
+        logger.debug("The hashed message digest: %r.", message_hash)
+        headers = {
+            "X-Authorization": f"{self.api_key}:{message_hash}",
+            "Nonce": nonce,
+        }
+        if method == "PUT":
+            headers["Content-MD5"] = self._base64_str(definition_md5)
+            headers["Content-Type"] = content_type
+        return headers
+
+    def _archive_workspace(self, json: bytes) -> None:
+        """Store the workspace."""
+        if self.workspace_archive_location is None:
+            return
+        location = self._create_archive_filename()
+        logger.debug(
+            f"Archiving workspace {self.workspace_id} to"
+            f" '{self.workspace_archive_location}'."
+        )
+        with gzip.open(location, mode="wb") as handle:
+            handle.write(json)
+
+    def _create_archive_filename(self) -> Path:
+        """Generate a filename for a workspace archive."""
+        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        return self.workspace_archive_location.joinpath(
+            f"structurizr-{self.workspace_id}-{timestamp}.json.gz"
+        )
+
+    @staticmethod
+    def _number_once() -> str:
+        """Return the number of milliseconds since the epoch."""
+        return str(
+            int((datetime.utcnow() - datetime(1970, 1, 1)) / timedelta(milliseconds=1))
+        )
+
+    @staticmethod
+    def _hmac_hex(secret: str, digest: str) -> str:
+        """Hash the given digest using HMAC+SHA256 and return the hex string."""
+        return hmac.new(
+            secret.encode("utf-8"), digest.encode("utf-8"), "sha256"
+        ).hexdigest()
+
+    @staticmethod
+    def _md5(content: Union[str, bytes]) -> str:
+        """Return the MD5 hash of the given string or UTF-8 encoded bytes."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return hashlib.md5(content).hexdigest()
+
+    @staticmethod
+    def _base64_str(content: str) -> str:
+        """Return the base64 encoded string."""
+        return b64encode(content.encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def _message_digest(
+        http_verb: str,
+        uri_path: str,
+        definition_md5: str,
+        content_type: str,
+        nonce: str,
+    ) -> str:
+        """Assemble the complete message digest."""
+        return f"{http_verb}\n{uri_path}\n{definition_md5}\n{content_type}\n{nonce}\n"
+
+    @staticmethod
+    def _paid_plan(response: APIResponse) -> bool:
+        return "free plan" not in response.message.lower()
+
+
+def _canonical(obj: Any, key: Optional[str] = None) -> Any:
+    """Sort the unordered collections in a JSON object by their canonical JSON."""
+    if key == "configuration":
+        return obj
+    if isinstance(obj, dict):
+        return {name: _canonical(value, name) for name, value in obj.items()}
+    if isinstance(obj, list):
+        items = [_canonical(value) for value in obj]
+        if key in UNORDERED_COLLECTIONS:
+            items.sort(key=_canonical_json)
+        return items
+    return obj
+
+
+def _canonical_json(obj: Any) -> str:
+    """Return the JSON of an object with sorted keys, as written by `json.dumps`."""
+    return json.dumps(obj, sort_keys=True)
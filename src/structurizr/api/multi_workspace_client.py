@@ -0,0 +1,178 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a Structurizr client for many workspaces sharing a connection pool."""
+
+
+import ssl
+from typing import Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from ..workspace import Workspace
+from .structurizr_client import StructurizrClient
+from .structurizr_client_settings import StructurizrClientSettings
+from .workspace_cache import WorkspaceCache
+
+
+__all__ = ("MultiWorkspaceClient",)
+
+
+KEEPALIVE_EXPIRY = 5.0
+
+
+class MultiWorkspaceClient:
+    """
+    Define a Structurizr client for many workspaces that share one connection pool.
+
+    Every `StructurizrClient` owns a connection pool, so talking to many workspaces
+    with one client each means as many pools, SSL contexts and TLS handshakes. The
+    clients created by this facade instead send their requests through a single
+    pool, such that requests to the same host reuse kept-alive connections.
+
+    Examples:
+        >>> with MultiWorkspaceClient() as clients:
+        ...     workspaces = clients.get_workspaces(settings)
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = KEEPALIVE_EXPIRY,
+        verify: Union[bool, str, ssl.SSLContext] = True,
+        cache: Optional[WorkspaceCache] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize a client for many workspaces.
+
+        Keyword Args:
+            max_connections (int, optional): The maximum number of concurrent
+                connections, or `None` for no limit.
+            max_keepalive_connections (int, optional): The maximum number of idle
+                connections that are kept alive, or `None` for no limit.
+            keepalive_expiry (float, optional): The number of seconds after which
+                idle connections are closed, or `None` to keep them open. Other
+                values than the default require httpx 0.18 or later.
+            verify (bool, str, or ssl.SSLContext): Whether to verify the
+                certificates of the servers, a CA bundle to verify them with, or an
+                SSL context, for example, for an on-premises installation.
+            cache (WorkspaceCache, optional): A cache of downloaded workspaces that
+                is shared by the clients of all workspaces.
+
+        """
+        super().__init__(**kwargs)
+        self._client = httpx.Client(
+            limits=self._limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            verify=verify,
+        )
+        self.cache = cache
+
+    @staticmethod
+    def _limits(
+        max_connections: Optional[int],
+        max_keepalive_connections: Optional[int],
+        keepalive_expiry: Optional[float],
+    ) -> httpx.Limits:
+        """Return the connection pool limits supported by the installed httpx."""
+        try:
+            return httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+        except TypeError:
+            # Before version 0.18, httpx closes idle connections after five seconds.
+            if keepalive_expiry != KEEPALIVE_EXPIRY:
+                raise ValueError(
+                    "Configuring the keep-alive expiry requires httpx 0.18 or later."
+                ) from None
+            return httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+
+    def __enter__(self) -> "MultiWorkspaceClient":
+        """Enter a context that closes the connection pool on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the connection pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        self._client.close()
+
+    def get_client(self, settings: StructurizrClientSettings) -> StructurizrClient:
+        """Return a client for a single workspace that uses the shared pool."""
+        return StructurizrClient(
+            settings=settings, http_client=self._client, cache=self.cache
+        )
+
+    def get_workspaces(
+        self, settings: Iterable[StructurizrClientSettings]
+    ) -> List[Workspace]:
+        """
+        Retrieve many Structurizr workspaces from the API.
+
+        Args:
+            settings (iterable): The settings of each workspace.
+
+        Returns:
+            list: The workspaces in the order of their settings.
+
+        """
+        return [self.get_client(item).get_workspace() for item in settings]
+
+    def put_workspaces(
+        self,
+        workspaces: Iterable[Tuple[StructurizrClientSettings, Workspace]],
+        *,
+        lock: bool = True,
+    ) -> int:
+        """
+        Update many remote Structurizr workspaces.
+
+        Args:
+            workspaces (iterable): Pairs of the settings of a remote workspace and
+                the workspace to update it with.
+            lock (bool, optional): Whether to lock each remote workspace while
+                updating it, like with `StructurizrClient.lock`.
+
+        Returns:
+            int: The number of uploaded workspaces, which excludes those skipped as
+                unchanged if there is a cache.
+
+        """
+        uploaded = 0
+        for settings, workspace in workspaces:
+            client = self.get_client(settings)
+            # Avoid locking workspaces whose upload would be skipped.
+            fingerprint = client.fingerprint(workspace)
+            if client.is_unchanged(fingerprint):
+                continue
+            uploaded += 1
+            if lock:
+                with client.lock():
+                    client.put_workspace(workspace, force=True, fingerprint=fingerprint)
+            else:
+                client.put_workspace(workspace, force=True, fingerprint=fingerprint)
+        return uploaded
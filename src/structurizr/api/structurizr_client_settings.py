@@ -28,7 +28,7 @@ try:
 except ModuleNotFoundError:
     from importlib_metadata import version
 
-from pydantic import UUID4, BaseSettings, DirectoryPath, Field, HttpUrl
+from pydantic import UUID4, BaseSettings, DirectoryPath, Field, HttpUrl, validator
 
 
 __all__ = ("StructurizrClientSettings",)
@@ -51,6 +51,8 @@ if hostname:
 
 AGENT = f"structurizr-python/{version('structurizr-python')}"
 
+REQUEST_ENCODINGS = ("gzip", "zstd")
+
 
 class StructurizrClientSettings(BaseSettings):
     """
@@ -65,6 +67,8 @@ class StructurizrClientSettings(BaseSettings):
         agent (str): A string identifying the agent (e.g. 'structurizr-java/1.2.0').
         workspace_archive_location (pathlib.Path): A directory for archiving downloaded
             workspaces.
+        request_encoding (str): The compression of uploaded workspaces, 'gzip' or
+            'zstd', or None to upload them uncompressed.
 
     """
 
@@ -105,6 +109,23 @@ class StructurizrClientSettings(BaseSettings):
         description="A directory for archiving downloaded workspaces, or None to "
         "suppress archiving.",
     )
+    request_encoding: Optional[str] = Field(
+        default=None,
+        env="STRUCTURIZR_REQUEST_ENCODING",
+        description="The compression of uploaded workspaces, 'gzip' or 'zstd' "
+        "(requires the package 'zstandard'), or None to upload them uncompressed. "
+        "The server must accept compressed request bodies.",
+    )
+
+    @validator("request_encoding")
+    def check_request_encoding(cls, encoding: Optional[str]) -> Optional[str]:
+        """Ensure that the request encoding is supported."""
+        if encoding is not None and encoding not in REQUEST_ENCODINGS:
+            raise ValueError(
+                f"Unknown request encoding '{encoding}'. Please choose one of "
+                f"{', '.join(REQUEST_ENCODINGS)}."
+            )
+        return encoding
 
     class Config:
         """Configure the Structurizr client settings."""
@@ -0,0 +1,252 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide an on-disk cache of downloaded workspaces."""
+
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from ..workspace import Workspace
+
+
+__all__ = ("WorkspaceCache",)
+
+
+logger = logging.getLogger(__name__)
+
+
+class WorkspaceCache:
+    """
+    Cache downloaded workspaces on disk, evicting the least recently used ones.
+
+    The latest download of each workspace is stored under its ID and the SHA-256
+    digest of its content, together with the validators (`ETag` and
+    `Last-Modified`) that the server sent, such that clients can make conditional
+    requests. Workspaces that were hydrated by this cache are also kept in memory,
+    such that fetching an unchanged workspace again skips parsing it. Moreover, the
+    fingerprint of the last upload of each workspace is stored, such that clients
+    can skip uploading unchanged workspaces.
+
+    Attributes:
+        directory (pathlib.Path): The directory containing the cached files.
+        max_size (int): The maximum total size of the cached content in bytes.
+        hits (int): The number of fetches that were served from the cache, because
+            the server reported the workspace as not modified or sent identical
+            content.
+        misses (int): The number of fetches that returned new content.
+
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], *, max_size: int = 256 * 2 ** 20, **kwargs
+    ) -> None:
+        """
+        Initialize a workspace cache, creating its directory if necessary.
+
+        Args:
+            directory (str or pathlib.Path): The directory for the cached files.
+            max_size (int, optional): The maximum total size of the cached content
+                in bytes, 256 MiB by default.
+
+        """
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Hydrated workspaces with the digest of their content, by workspace ID.
+        self._workspaces: Dict[int, Tuple[str, Workspace]] = {}
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cache."""
+        return (
+            f"{type(self).__name__}(directory={self.directory}, hits={self.hits}, "
+            f"misses={self.misses})"
+        )
+
+    def get_validators(self, workspace_id: int) -> Dict[str, str]:
+        """Return the headers of a conditional request for a cached workspace."""
+        metadata = self._read_metadata(workspace_id)
+        if metadata is None:
+            return {}
+        headers = {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+        return headers
+
+    def get_workspace(self, workspace_id: int) -> Optional[Workspace]:
+        """
+        Return the cached workspace after the server reported it as not modified.
+
+        Returns:
+            Workspace: The cached workspace or `None` if it is no longer cached.
+
+        """
+        metadata = self._read_metadata(workspace_id)
+        if metadata is None:
+            return None
+        path = self._content_path(workspace_id, metadata["digest"])
+        if not path.exists():
+            return None
+        self.hits += 1
+        return self._load(workspace_id, metadata["digest"], path)
+
+    def add_workspace(
+        self,
+        workspace_id: int,
+        content: bytes,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Workspace:
+        """
+        Cache the downloaded content of a workspace and return the workspace.
+
+        If the content is identical to the cached one, the cached workspace is
+        returned without parsing it again.
+
+        Args:
+            workspace_id (int): The Structurizr workspace identifier.
+            content (bytes): The downloaded JSON document.
+            etag (str, optional): The `ETag` header of the response.
+            last_modified (str, optional): The `Last-Modified` header of the
+                response.
+
+        Returns:
+            Workspace: The hydrated workspace.
+
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        metadata = self._read_metadata(workspace_id)
+        path = self._content_path(workspace_id, digest)
+        if metadata is not None and metadata["digest"] == digest and path.exists():
+            self.hits += 1
+        else:
+            self.misses += 1
+            if metadata is not None:
+                self._remove(workspace_id, metadata["digest"])
+            path.write_bytes(content)
+        self._write_metadata(
+            workspace_id,
+            {"digest": digest, "etag": etag, "last_modified": last_modified},
+        )
+        workspace = self._load(workspace_id, digest, path, content)
+        self._evict()
+        return workspace
+
+    def get_fingerprint(self, workspace_id: int) -> Optional[str]:
+        """Return the fingerprint of the last upload of a workspace or `None`."""
+        try:
+            return json.loads(self._fingerprint_path(workspace_id).read_text())[
+                "fingerprint"
+            ]
+        except FileNotFoundError:
+            return None
+
+    def set_fingerprint(self, workspace_id: int, fingerprint: str) -> None:
+        """Store the fingerprint of the last upload of a workspace."""
+        self._fingerprint_path(workspace_id).write_text(
+            json.dumps({"fingerprint": fingerprint})
+        )
+
+    def clear(self) -> None:
+        """
+        Remove all cached workspaces and their metadata.
+
+        The fingerprints of uploaded workspaces are kept, such that unchanged
+        workspaces are still not uploaded again.
+
+        """
+        for pattern in ("workspace-*-*.json", "workspace-*.meta.json"):
+            for path in self.directory.glob(pattern):
+                path.unlink()
+        self._workspaces.clear()
+
+    def _load(
+        self,
+        workspace_id: int,
+        digest: str,
+        path: Path,
+        content: Optional[bytes] = None,
+    ) -> Workspace:
+        """Return the cached workspace, hydrating it only if it is not in memory."""
+        # Mark the entry as recently used.
+        os.utime(path)
+        cached_digest, workspace = self._workspaces.get(workspace_id, (None, None))
+        if cached_digest != digest:
+            workspace = Workspace.loads(
+                path.read_bytes() if content is None else content
+            )
+            self._workspaces[workspace_id] = digest, workspace
+        return workspace
+
+    def _evict(self) -> None:
+        """Remove the least recently used workspaces until the cache fits."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("workspace-*-*.json"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            _, workspace_id, digest = path.stem.split("-")
+            logger.debug("Evicting workspace %s from the cache.", workspace_id)
+            self._remove(int(workspace_id), digest)
+            total -= size
+
+    def _remove(self, workspace_id: int, digest: str) -> None:
+        """Remove a cached workspace."""
+        try:
+            self._content_path(workspace_id, digest).unlink()
+        except FileNotFoundError:
+            pass
+        metadata = self._read_metadata(workspace_id)
+        if metadata is not None and metadata["digest"] == digest:
+            self._metadata_path(workspace_id).unlink()
+            self._workspaces.pop(workspace_id, None)
+
+    def _content_path(self, workspace_id: int, digest: str) -> Path:
+        """Return the path of the cached content of a workspace."""
+        return self.directory / f"workspace-{workspace_id}-{digest}.json"
+
+    def _metadata_path(self, workspace_id: int) -> Path:
+        """Return the path of the metadata of a cached workspace."""
+        return self.directory / f"workspace-{workspace_id}.meta.json"
+
+    def _fingerprint_path(self, workspace_id: int) -> Path:
+        """Return the path of the fingerprint of the last upload of a workspace."""
+        return self.directory / f"workspace-{workspace_id}.published.json"
+
+    def _read_metadata(self, workspace_id: int) -> Optional[Dict[str, str]]:
+        """Return the metadata of a cached workspace or `None`."""
+        try:
+            return json.loads(self._metadata_path(workspace_id).read_text())
+        except FileNotFoundError:
+            return None
+
+    def _write_metadata(self, workspace_id: int, metadata: Dict[str, str]) -> None:
+        """Store the metadata of a cached workspace."""
+        self._metadata_path(workspace_id).write_text(json.dumps(metadata))
@@ -16,12 +16,58 @@
 """Provide a customized base model."""
 
 
+from collections import deque
+from enum import Enum
+from functools import lru_cache
+from types import GeneratorType
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
 from pydantic import BaseModel as BaseModel_
+from pydantic import ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+from . import json_backend
 
 
 __all__ = ("BaseModel",)
 
 
+ModelT = TypeVar("ModelT", bound="BaseModel")
+
+# Field types whose JSON representation can be used as is.
+PLAIN_TYPES = (str, int, float, bool, Any)
+
+# Ways in which a field value is constructed without validation, see
+# `BaseModel.parse_obj_trusted`.
+PLAIN = "plain"
+MODEL = "model"
+ENUM = "enum"
+VALIDATE = "validate"
+
+# Default values of these types can be shared between instances.
+IMMUTABLE_TYPES = (type(None), str, int, float, bool, tuple, frozenset, Enum)
+MUTABLE_DEFAULT = object()
+
+# Collections that pydantic accepts for list fields.
+SEQUENCE_TYPES = (list, tuple, set, frozenset, deque, GeneratorType)
+
+# The options of `pydantic.BaseModel._get_value` that `BaseModel.json` implies.
+JSON_VALUE_OPTIONS = {
+    "to_dict": True,
+    "by_alias": True,
+    "include": None,
+    "exclude": None,
+    "exclude_unset": False,
+    "exclude_defaults": True,
+    "exclude_none": False,
+}
+
+# Marks a missing attribute or a value that cannot be serialized directly.
+UNDEFINED = object()
+
+
 class BaseModel(BaseModel_):
     """Define a customized base model."""
 
@@ -31,6 +77,199 @@ class BaseModel(BaseModel_):
         anystr_strip_whitespace = True
         allow_population_by_field_name = True
         orm_mode = True
+        json_loads = json_backend.loads
+
+    @classmethod
+    def load_obj(
+        cls: Type[ModelT], obj: Dict[str, Any], *, validate: bool = True
+    ) -> ModelT:
+        """
+        Create a model from a (nested) dictionary, validating it unless trusted.
+
+        Args:
+            obj (dict): The parsed JSON object, with keys by alias or field name.
+            validate (bool, optional): If `False` then the object is trusted to be
+                valid, see `BaseModel.parse_obj_trusted`.
+
+        Returns:
+            BaseModel: A new instance of this class.
+
+        """
+        return cls.parse_obj(obj) if validate else cls.parse_obj_trusted(obj)
+
+    @classmethod
+    def parse_obj_trusted(cls: Type[ModelT], obj: Dict[str, Any]) -> ModelT:
+        """
+        Create a model from a (nested) dictionary without validating it.
+
+        Only use this for data that are known to be valid, for example, workspaces
+        previously written by `Workspace.dump`. Nested models and enumerations are
+        constructed recursively and `pre` validators (such as splitting
+        comma-separated tags) are applied, but there is no type coercion and no
+        whitespace stripping. Fields of any other type (e.g. dates, URLs, or colors)
+        are still validated.
+
+        Args:
+            obj (dict): The parsed JSON object, with keys by alias or field name.
+
+        Returns:
+            BaseModel: A new instance of this class.
+
+        See Also:
+            pydantic.BaseModel.construct
+
+        """
+        values = {}
+        fields_set = set()
+        for field, kind, default in _trusted_fields(cls):
+            if field.alias in obj:
+                value = obj[field.alias]
+            elif field.name in obj:
+                value = obj[field.name]
+            else:
+                values[field.name] = (
+                    field.get_default() if default is MUTABLE_DEFAULT else default
+                )
+                continue
+            for validator in field.pre_validators or ():
+                value = validator(cls, value, values, field, cls.__config__)
+            if value is None or kind == PLAIN:
+                pass
+            elif kind == MODEL:
+                if field.shape == SHAPE_SINGLETON:
+                    value = field.type_.parse_obj_trusted(value)
+                else:
+                    value = [field.type_.parse_obj_trusted(item) for item in value]
+            elif kind == ENUM:
+                if field.shape == SHAPE_SINGLETON:
+                    value = field.type_(value)
+                else:
+                    value = [field.type_(item) for item in value]
+            else:
+                value, errors = field.validate(value, values, loc=field.alias, cls=cls)
+                if errors:
+                    raise ValidationError([errors], cls)
+            values[field.name] = value
+            fields_set.add(field.name)
+        # This is what `pydantic.BaseModel.construct` does, but without copying every
+        # default value.
+        model = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__fields_set__", fields_set)
+        model._init_private_attributes()
+        return model
+
+    @classmethod
+    def json_from_orm(
+        cls, obj: Any, *, update: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> str:
+        """
+        Serialize an arbitrary class instance as JSON according to this model.
+
+        The result is identical to `cls.from_orm(obj).json(**kwargs)` but the
+        attributes of the given object (and of nested objects) are written directly,
+        without constructing the intermediate tree of models. Values that cannot be
+        written as they are, for example, URLs or colors, are still validated. The
+        JSON is written by the standard library, unless another
+        `structurizr.json_backend` was selected explicitly, which may format it
+        differently.
+
+        Args:
+            obj: The (domain) object to serialize.
+            update (dict, optional): Values by field name that replace attributes of
+                the object at the top level, without validation. This is the same as
+                assigning them to the model before serializing it.
+            **kwargs: Further keyword arguments, as for `json.dumps`, are passed to
+                the JSON backend.
+
+        Returns:
+            str: The serialized object as a JSON string.
+
+        Raises:
+            pydantic.ValidationError: If the object cannot be represented by this
+                model.
+
+        See Also:
+            pydantic.BaseModel.from_orm
+            BaseModel.json
+
+        """
+        return json_backend.dumps(
+            cls._dict_from_orm(obj, update or {}),
+            default=cls.__json_encoder__,
+            **kwargs
+        )
+
+    @classmethod
+    def json_bytes_from_orm(
+        cls, obj: Any, *, update: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> bytes:
+        """
+        Serialize an arbitrary class instance as UTF-8 encoded JSON.
+
+        This avoids the copy of encoding the JSON string, for example, before
+        hashing or sending it. The arguments are the same as for
+        `BaseModel.json_from_orm`, but the bytes are written by the selected
+        `structurizr.json_backend`, by default the fastest installed library.
+
+        See Also:
+            BaseModel.json_from_orm
+            structurizr.json_backend
+
+        """
+        return json_backend.dumpb(
+            cls._dict_from_orm(obj, update or {}),
+            default=cls.__json_encoder__,
+            **kwargs
+        )
+
+    @classmethod
+    def _dict_from_orm(cls, obj: Any, update: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize the fields of an object like `BaseModel.json` would."""
+        result = {}
+        values = {}
+        for field, kind in _orm_fields(cls):
+            if field.name in update:
+                value = update[field.name]
+            else:
+                value = getattr(obj, field.alias, UNDEFINED)
+                if value is UNDEFINED and field.alt_alias:
+                    value = getattr(obj, field.name, UNDEFINED)
+                if value is UNDEFINED:
+                    if field.required:
+                        raise ValidationError(
+                            [ErrorWrapper(MissingError(), loc=field.alias)], cls
+                        )
+                    value = field.get_default()
+                else:
+                    raw = value
+                    for validator in field.pre_validators or ():
+                        value = validator(cls, value, values, field, cls.__config__)
+                    if value is None and field.allow_none:
+                        data = None
+                    elif kind == VALIDATE:
+                        data = UNDEFINED
+                    else:
+                        data = _orm_value(field, kind, value)
+                    if data is not UNDEFINED:
+                        values[field.name] = data
+                        if field.required or field.default != data:
+                            result[field.alias] = data
+                        continue
+                    value, errors = field.validate(
+                        raw, values, loc=field.alias, cls=cls
+                    )
+                    if errors:
+                        raise ValidationError([errors], cls)
+            values[field.name] = value
+            if field.required or field.default != value:
+                result[field.alias] = cls._get_value(value, **JSON_VALUE_OPTIONS)
+        return result
+
+    @classmethod
+    def _finalize_dict(cls, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Adapt the serialized fields of a nested model, e.g., to a legacy format."""
+        return obj
 
     def dict(
         self,
@@ -60,11 +299,13 @@ class BaseModel(BaseModel_):
             pydantic.BaseModel.dict
 
         """
-        return super().dict(
-            by_alias=by_alias,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-            **kwargs
+        return self._finalize_dict(
+            super().dict(
+                by_alias=by_alias,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                **kwargs
+            )
         )
 
     def json(
@@ -90,3 +331,118 @@ class BaseModel(BaseModel_):
         return super().json(
             by_alias=by_alias, exclude_defaults=exclude_defaults, **kwargs
         )
+
+
+@lru_cache(maxsize=None)
+def _trusted_fields(cls: Type[BaseModel]) -> List[Tuple[ModelField, str, Any]]:
+    """Return the fields of a model with how to construct them without validation."""
+    result = []
+    for field in cls.__fields__.values():
+        type_ = field.type_
+        if field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+            kind = PLAIN if type_ in PLAIN_TYPES else VALIDATE
+        elif type_ in PLAIN_TYPES:
+            kind = PLAIN
+        elif isinstance(type_, type) and issubclass(type_, BaseModel):
+            kind = MODEL
+        elif isinstance(type_, type) and issubclass(type_, Enum):
+            kind = ENUM
+        else:
+            kind = VALIDATE
+        default = (
+            field.default
+            if field.default_factory is None
+            and isinstance(field.default, IMMUTABLE_TYPES)
+            else MUTABLE_DEFAULT
+        )
+        result.append((field, kind, default))
+    return result
+
+
+@lru_cache(maxsize=None)
+def _orm_fields(cls: Type[BaseModel]) -> List[Tuple[ModelField, str]]:
+    """Return the fields of a model with how to serialize them from an object."""
+    config = cls.__config__
+    plain_types = (int, float, bool)
+    if not (
+        config.anystr_lower
+        or getattr(config, "anystr_upper", False)
+        or config.min_anystr_length
+        or config.max_anystr_length
+    ):
+        plain_types += (str,)
+    result = []
+    for field in cls.__fields__.values():
+        type_ = field.type_
+        if field.post_validators or any(
+            not validator.pre or validator.each_item
+            for validator in field.class_validators.values()
+        ):
+            kind = VALIDATE
+        elif field.shape == SHAPE_DICT:
+            kind = (
+                PLAIN
+                if type_ in plain_types and field.key_field.type_ in plain_types
+                else VALIDATE
+            )
+        elif field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+            kind = VALIDATE
+        elif type_ in plain_types:
+            kind = PLAIN
+        elif isinstance(type_, type) and issubclass(type_, Enum):
+            kind = ENUM
+        elif (
+            isinstance(type_, type)
+            and issubclass(type_, BaseModel)
+            and not type_.__pre_root_validators__
+            and not type_.__post_root_validators__
+            # Serialized models are only compared with their default indirectly.
+            and field.default in (None, (), [])
+        ):
+            kind = MODEL
+        else:
+            kind = VALIDATE
+        if field.shape == SHAPE_LIST and field.default not in (None, (), []):
+            kind = VALIDATE
+        result.append((field, kind))
+    return result
+
+
+def _orm_value(field: ModelField, kind: str, value: Any) -> Any:
+    """Return the JSON representation of a field value or `UNDEFINED` if unknown."""
+    if field.shape == SHAPE_SINGLETON:
+        return _orm_item(field.type_, kind, value)
+    if field.shape == SHAPE_LIST:
+        if not isinstance(value, SEQUENCE_TYPES):
+            return UNDEFINED
+        result = []
+        for item in value:
+            item = _orm_item(field.type_, kind, item)
+            if item is UNDEFINED:
+                return UNDEFINED
+            result.append(item)
+        return result
+    if type(value) is not dict:
+        return UNDEFINED
+    result = {}
+    for key, item in value.items():
+        key = _orm_item(field.key_field.type_, kind, key)
+        item = _orm_item(field.type_, kind, item)
+        if key is UNDEFINED or item is UNDEFINED:
+            return UNDEFINED
+        result[key] = item
+    return result
+
+
+def _orm_item(type_: type, kind: str, value: Any) -> Any:
+    """Return the JSON representation of a single value or `UNDEFINED` if unknown."""
+    if kind == MODEL:
+        if value is None or isinstance(value, (BaseModel_, dict)):
+            return UNDEFINED
+        return type_._finalize_dict(type_._dict_from_orm(value, {}))
+    # Only values of exactly the expected type are left unchanged by validation.
+    if type(value) is not type_:
+        return UNDEFINED
+    if type_ is str:
+        return value.strip()
+    return value
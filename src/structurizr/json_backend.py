@@ -0,0 +1,290 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Provide interchangeable JSON libraries for reading and writing workspaces.
+
+By default, the fastest installed library is used in the order orjson, ujson, and
+the standard library `json` module. The choice can be overridden with the
+environment variable `STRUCTURIZR_JSON_BACKEND` or by calling `set_json_backend`.
+
+The libraries format JSON differently, for example, orjson writes compact JSON without
+escaping non-ASCII characters. Therefore, JSON strings (as opposed to bytes) are
+written by the standard library unless a backend is selected explicitly, such that
+they are identical to those of pydantic.
+
+"""
+
+
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import ujson
+except ModuleNotFoundError:
+    ujson = None
+
+
+__all__ = (
+    "JSONBackend",
+    "StandardJSONBackend",
+    "OrjsonBackend",
+    "UjsonBackend",
+    "get_json_backend",
+    "set_json_backend",
+    "loads",
+    "dumps",
+    "dumpb",
+)
+
+
+Default = Optional[Callable[[Any], Any]]
+
+
+class JSONBackend(ABC):
+    """
+    Define the interface of a JSON library.
+
+    Keyword arguments that a library does not support are handled by the standard
+    library instead, such that all backends accept the arguments of `json.dumps`.
+
+    """
+
+    name: str = ""
+    available: bool = False
+
+    def __init__(self, **kwargs):
+        """Initialize a JSON backend, making sure that its library is installed."""
+        super().__init__(**kwargs)
+        if not self.available:
+            raise ImportError(
+                f"The JSON backend '{self.name}' requires the package '{self.name}'."
+            )
+
+    def __repr__(self) -> str:
+        """Return a string representation of this instance."""
+        return f"{type(self).__name__}()"
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parse a JSON document from a string or UTF-8 encoded bytes."""
+
+    @abstractmethod
+    def dumps(self, obj: Any, *, default: Default = None, **kwargs) -> str:
+        """Serialize an object as a JSON string."""
+
+    @abstractmethod
+    def dumpb(self, obj: Any, *, default: Default = None, **kwargs) -> bytes:
+        """Serialize an object as UTF-8 encoded JSON."""
+
+
+class StandardJSONBackend(JSONBackend):
+    """Use the `json` module of the standard library."""
+
+    name = "json"
+    available = True
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parse a JSON document from a string or UTF-8 encoded bytes."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any, *, default: Default = None, **kwargs) -> str:
+        """Serialize an object as a JSON string."""
+        return json.dumps(obj, default=default, **kwargs)
+
+    def dumpb(self, obj: Any, *, default: Default = None, **kwargs) -> bytes:
+        """Serialize an object as UTF-8 encoded JSON."""
+        return self.dumps(obj, default=default, **kwargs).encode("utf-8")
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    Use the orjson library.
+
+    orjson writes compact JSON without escaping non-ASCII characters and can only
+    indent by two spaces.
+
+    """
+
+    name = "orjson"
+    available = orjson is not None
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parse a JSON document from a string or UTF-8 encoded bytes."""
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any, *, default: Default = None, **kwargs) -> str:
+        """Serialize an object as a JSON string."""
+        return self.dumpb(obj, default=default, **kwargs).decode("utf-8")
+
+    def dumpb(
+        self,
+        obj: Any,
+        *,
+        default: Default = None,
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+        **kwargs
+    ) -> bytes:
+        """Serialize an object as UTF-8 encoded JSON."""
+        if kwargs or indent not in (None, 2):
+            return STANDARD_JSON_BACKEND.dumpb(
+                obj, default=default, indent=indent, sort_keys=sort_keys, **kwargs
+            )
+        # Dates are left to the `default` function, such that pydantic's encoders
+        # apply just like with the standard library.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+
+
+class UjsonBackend(JSONBackend):
+    """Use the ujson library (version 5 or later)."""
+
+    name = "ujson"
+    available = ujson is not None
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parse a JSON document from a string or UTF-8 encoded bytes."""
+        return ujson.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        default: Default = None,
+        indent: Optional[int] = None,
+        sort_keys: bool = False,
+        ensure_ascii: bool = True,
+        **kwargs
+    ) -> str:
+        """Serialize an object as a JSON string."""
+        if kwargs:
+            return STANDARD_JSON_BACKEND.dumps(
+                obj,
+                default=default,
+                indent=indent,
+                sort_keys=sort_keys,
+                ensure_ascii=ensure_ascii,
+                **kwargs
+            )
+        return ujson.dumps(
+            obj,
+            default=default,
+            indent=indent or 0,
+            sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+            escape_forward_slashes=False,
+        )
+
+    def dumpb(self, obj: Any, *, default: Default = None, **kwargs) -> bytes:
+        """Serialize an object as UTF-8 encoded JSON."""
+        return self.dumps(obj, default=default, **kwargs).encode("utf-8")
+
+
+STANDARD_JSON_BACKEND = StandardJSONBackend()
+
+# Known backends by name in the order of preference.
+JSON_BACKENDS: Dict[str, Type[JSONBackend]] = {
+    backend.name: backend
+    for backend in (OrjsonBackend, UjsonBackend, StandardJSONBackend)
+}
+
+# The backend selected explicitly by name, instance, or environment variable.
+_json_backend: Optional[JSONBackend] = None
+_fastest_json_backend: Optional[JSONBackend] = None
+
+
+def get_json_backend() -> JSONBackend:
+    """Return the JSON backend in use, selecting one on first use."""
+    global _fastest_json_backend
+    if _json_backend is not None:
+        return _json_backend
+    name = os.environ.get("STRUCTURIZR_JSON_BACKEND")
+    if name:
+        return set_json_backend(name)
+    if _fastest_json_backend is None:
+        _fastest_json_backend = next(
+            cls for cls in JSON_BACKENDS.values() if cls.available
+        )()
+    return _fastest_json_backend
+
+
+def set_json_backend(backend: Union[str, JSONBackend, None] = None) -> JSONBackend:
+    """
+    Select the JSON library used for reading and writing workspaces.
+
+    Args:
+        backend (str or JSONBackend, optional): Either the name of a known backend
+            ('orjson', 'ujson', or 'json'), a backend instance, or `None` to select the
+            fastest installed library for all but JSON strings again.
+
+    Returns:
+        JSONBackend: The newly selected backend.
+
+    Raises:
+        ValueError: If the name of the backend is unknown.
+        ImportError: If the library of the backend is not installed.
+
+    """
+    global _json_backend
+    if backend is None:
+        _json_backend = None
+        return get_json_backend()
+    if isinstance(backend, str):
+        try:
+            backend = JSON_BACKENDS[backend]()
+        except KeyError:
+            raise ValueError(
+                f"Unknown JSON backend '{backend}'. Please choose one of "
+                f"{', '.join(JSON_BACKENDS)}."
+            ) from None
+    _json_backend = backend
+    return backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document with the selected backend."""
+    return get_json_backend().loads(data)
+
+
+def dumps(obj: Any, *, default: Default = None, **kwargs) -> str:
+    """
+    Serialize an object as a JSON string with the selected backend.
+
+    Unless a backend was selected explicitly, the standard library is used, such that
+    the string is formatted exactly like by `json.dumps`.
+
+    """
+    backend = get_json_backend()
+    if _json_backend is None:
+        backend = STANDARD_JSON_BACKEND
+    return backend.dumps(obj, default=default, **kwargs)
+
+
+def dumpb(obj: Any, *, default: Default = None, **kwargs) -> bytes:
+    """Serialize an object as UTF-8 encoded JSON with the selected backend."""
+    return get_json_backend().dumpb(obj, default=default, **kwargs)
@@ -15,7 +15,7 @@
 
 """Provide a container model."""
 
-from typing import TYPE_CHECKING, Iterable, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from pydantic import Field
 
@@ -97,14 +97,15 @@ class Container(StaticStructureElement):
         super().__init__(**kwargs)
         self.parent = parent
         self.technology = technology
-        self._components = set(components)
+        # Components by their (unique) names.
+        self._components: Dict[str, Component] = {c.name: c for c in components}
 
         self.tags.add(Tags.CONTAINER)
 
     @property
     def components(self) -> Iterable[Component]:
         """Return read-only list of child components."""
-        return list(self._components)
+        return list(self._components.values())
 
     @property
     def child_elements(self) -> Iterable[Component]:
@@ -140,10 +141,11 @@ class Container(StaticStructureElement):
         """Add a newly constructed component to this container."""
         # TODO: once we move past python 3.6 change to proper return type via
         # __future__.annotations
-        if component in self.components:
+        existing = self._components.get(component.name)
+        if existing is component:
             return self
 
-        if self.get_component_with_name(component.name):
+        if existing is not None:
             raise ValueError(
                 f"Component with name {component.name} already exists in {self}."
             )
@@ -155,7 +157,7 @@ class Container(StaticStructureElement):
                 f"Component with name {component.name} already has parent "
                 f"{component.parent}. Cannot add to {self}."
             )
-        self._components.add(component)
+        self._components[component.name] = component
         if self.has_model:
             model = self.model
             model += component
@@ -163,7 +165,4 @@ class Container(StaticStructureElement):
 
     def get_component_with_name(self, name: str) -> Component:
         """Return a matching `Component` or None if not found."""
-        for component in self.components:
-            if component.name == name:
-                return component
-        return None
+        return self._components.get(name)
@@ -15,7 +15,8 @@
 
 """Provide a deployment node model."""
 
-from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
 
 from pydantic import Field
 
@@ -111,16 +112,21 @@ class DeploymentNode(DeploymentElement):
         self.parent = parent
         self.technology = technology
         self.instances = instances
-        self._children = set(children)
-        self._container_instances = set(container_instances)
-        self._software_system_instances = set(software_system_instances)
+        # Child deployment nodes by their (unique) names.
+        self._children: Dict[str, "DeploymentNode"] = {c.name: c for c in children}
+        self._container_instances = set()
+        self._software_system_instances = set()
+        # The highest instance ID of each container and software system on this node.
+        self._instance_ids: Dict[Element, int] = {}
+        for instance in chain(container_instances, software_system_instances):
+            self._add_instance(instance)
         self._infrastructure_nodes = set(infrastructure_nodes)
         self.tags.add(Tags.DEPLOYMENT_NODE)
 
     @property
     def children(self) -> Iterable["DeploymentNode"]:
         """Return read-only list of child nodes."""
-        return list(self._children)
+        return list(self._children.values())
 
     @property
     def child_elements(self) -> Iterable[Element]:
@@ -169,6 +175,10 @@ class DeploymentNode(DeploymentElement):
         self._add_child_deployment_node(node)
         return node
 
+    def get_deployment_node_with_name(self, name: str) -> Optional["DeploymentNode"]:
+        """Return the child deployment node with the given name, or None."""
+        return self._children.get(name)
+
     def add_container(
         self, container: Container, *, replicate_relationships: bool = True
     ) -> ContainerInstance:
@@ -179,26 +189,17 @@ class DeploymentNode(DeploymentElement):
             container(Container): the Container to add an instance of.
             replicate_relationships: True if relationships should be replicated between
                                      the element instances in the same deployment
-                                     environment, False otherwise.
+                                     environment, False otherwise.  When adding many
+                                     instances, it is much faster to replicate once
+                                     with `Model.replicate_element_relationships`.
         """
-        instance_id = (
-            max(
-                [
-                    c.instance_id
-                    for c in self.container_instances
-                    if c.container is container
-                ],
-                default=0,
-            )
-            + 1
-        )
         instance = ContainerInstance(
             container=container,
-            instance_id=instance_id,
+            instance_id=self._instance_ids.get(container, 0) + 1,
             environment=self.environment,
             parent=self,
         )
-        self._container_instances.add(instance)
+        self._add_instance(instance)
         model = self.model
         model += instance
         if replicate_relationships:
@@ -215,26 +216,17 @@ class DeploymentNode(DeploymentElement):
             software_system(SoftwareSystem): the SoftwareSystem to add an instance of.
             replicate_relationships: True if relationships should be replicated between
                                      the element instances in the same deployment
-                                     environment, False otherwise.
+                                     environment, False otherwise.  When adding many
+                                     instances, it is much faster to replicate once
+                                     with `Model.replicate_element_relationships`.
         """
-        instance_id = (
-            max(
-                [
-                    s.instance_id
-                    for s in self.software_system_instances
-                    if s.software_system is software_system
-                ],
-                default=0,
-            )
-            + 1
-        )
         instance = SoftwareSystemInstance(
             software_system=software_system,
-            instance_id=instance_id,
+            instance_id=self._instance_ids.get(software_system, 0) + 1,
             environment=self.environment,
             parent=self,
         )
-        self._software_system_instances.add(instance)
+        self._add_instance(instance)
         model = self.model
         model += instance
         if replicate_relationships:
@@ -278,18 +270,39 @@ class DeploymentNode(DeploymentElement):
             **kwargs,
         )
 
+    def _add_instance(
+        self, instance: Union[ContainerInstance, SoftwareSystemInstance]
+    ) -> None:
+        """Add an instance to this node and keep track of its instance ID."""
+        if isinstance(instance, ContainerInstance):
+            self._container_instances.add(instance)
+        else:
+            self._software_system_instances.add(instance)
+        element = instance.element
+        self._instance_ids[element] = max(
+            self._instance_ids.get(element, 0), instance.instance_id
+        )
+
     def _add_infrastructure_node(self, infra_node: InfrastructureNode):
         """Add a new infrastructure node."""
+        if infra_node.parent is None:
+            infra_node.parent = self
+        elif infra_node.parent is not self:
+            raise ValueError(
+                f"InfrastructureNode with name '{infra_node.name}' already has parent "
+                f"{infra_node.parent}. Cannot add to {self}."
+            )
         self._infrastructure_nodes.add(infra_node)
         model = self.model
         model += infra_node
 
     def _add_child_deployment_node(self, node: "DeploymentNode"):
         """Add a newly constructed child deployment node to this node."""
-        if node in self._children:
+        existing = self._children.get(node.name)
+        if existing is node:
             return self
 
-        if any(node.name == child.name for child in self.children):
+        if existing is not None:
             raise ValueError(
                 f"A deployment node with the name '{node.name}' already "
                 f"exists in node '{self.name}'."
@@ -309,7 +322,7 @@ class DeploymentNode(DeploymentElement):
                 f"({node.environment}) from its parent ({self.environment})."
             )
 
-        self._children.add(node)
+        self._children[node.name] = node
         if self.has_model:
             model = self.model
             model += node
@@ -336,14 +349,14 @@ class DeploymentNode(DeploymentElement):
             instance = ContainerInstance.hydrate(
                 instance_io, container=container, parent=node
             )
-            node._container_instances.add(instance)
+            node._add_instance(instance)
 
         for instance_io in deployment_node_io.software_system_instances:
             system = model.get_element(instance_io.software_system_id)
             instance = SoftwareSystemInstance.hydrate(
                 instance_io, system=system, parent=node
             )
-            node._software_system_instances.add(instance)
+            node._add_instance(instance)
 
         for infra_node_io in deployment_node_io.infrastructure_nodes:
             infra_node = InfrastructureNode.hydrate(infra_node_io, parent=node)
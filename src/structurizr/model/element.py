@@ -17,6 +17,7 @@
 
 
 from abc import ABC, abstractmethod
+from itertools import chain
 from typing import Iterable, Iterator, List, Optional
 
 from pydantic import Field, HttpUrl
@@ -90,21 +91,18 @@ class Element(ModelRefMixin, ModelItem, ABC):
 
     def get_relationships(self) -> Iterator[Relationship]:
         """Return a Iterator over all relationships involving this element."""
-        return (
-            r
-            for r in self.get_model().get_relationships()
-            if self is r.source or self is r.destination
+        return chain(
+            self.get_efferent_relationships(),
+            (r for r in self.get_afferent_relationships() if self is not r.source),
         )
 
     def get_efferent_relationships(self) -> Iterator[Relationship]:
         """Return a Iterator over all outgoing relationships involving this element."""
-        return (r for r in self.get_model().get_relationships() if self is r.source)
+        return self.get_model().get_efferent_relationships(self)
 
     def get_afferent_relationships(self) -> Iterator[Relationship]:
         """Return a Iterator over all incoming relationships involving this element."""
-        return (
-            r for r in self.get_model().get_relationships() if self is r.destination
-        )
+        return self.get_model().get_afferent_relationships(self)
 
     def add_relationship(
         self,
@@ -23,7 +23,7 @@ being to do nothing.
 """
 
 from itertools import product
-from typing import List
+from typing import Tuple
 
 from .element import Element
 from .relationship import Relationship
@@ -42,16 +42,7 @@ def create_implied_relationships_unless_any_exist(relationship: Relationship):
     This strategy creates implied relationships between all valid combinations of the
     parent elements, unless any relationship already exists between them.
     """
-    source = relationship.source
-    destination = relationship.destination
-    ancestor_pairs = product(_get_ancestors(source), _get_ancestors(destination))
-    for new_source, new_destination in ancestor_pairs:
-        if _implied_relationship_is_allowed(new_source, new_destination):
-            if not any(
-                r.destination is new_destination
-                for r in new_source.get_efferent_relationships()
-            ):
-                _clone_relationship(relationship, new_source, new_destination)
+    _create_implied_relationships(relationship, same_description=False)
 
 
 def create_implied_relationships_unless_same_exists(relationship: Relationship):
@@ -62,17 +53,26 @@ def create_implied_relationships_unless_same_exists(relationship: Relationship):
     parent elements, unless any relationship already exists between them which has the
     same description as the original.
     """
-    source = relationship.source
-    destination = relationship.destination
-    ancestor_pairs = product(_get_ancestors(source), _get_ancestors(destination))
-    for new_source, new_destination in ancestor_pairs:
-        if _implied_relationship_is_allowed(new_source, new_destination):
-            if not any(
-                r.destination is new_destination
-                and r.description == relationship.description
-                for r in new_source.get_efferent_relationships()
-            ):
-                _clone_relationship(relationship, new_source, new_destination)
+    _create_implied_relationships(relationship, same_description=True)
+
+
+def _create_implied_relationships(relationship: Relationship, same_description: bool):
+    """Create the relationships implied by one between the ancestors of its ends."""
+    model = relationship.source.get_model()
+    source_ancestors = _get_ancestors(relationship.source)
+    destination_ancestors = _get_ancestors(relationship.destination)
+    for new_source, new_destination in product(source_ancestors, destination_ancestors):
+        if not _implied_relationship_is_allowed(new_source, new_destination):
+            continue
+        # Descriptions can change after a relationship was added, so they are compared
+        # only among the (few) relationships between the same elements.
+        existing = model.get_efferent_relationships_with(new_source, new_destination)
+        if same_description:
+            exists = any(r.description == relationship.description for r in existing)
+        else:
+            exists = next(existing, None) is not None
+        if not exists:
+            _clone_relationship(relationship, new_source, new_destination)
 
 
 def _implied_relationship_is_allowed(source: Element, destination: Element):
@@ -83,20 +83,26 @@ def _implied_relationship_is_allowed(source: Element, destination: Element):
     return True
 
 
-def _get_ancestors(element: Element) -> List[Element]:
+def _get_ancestors(element: Element) -> Tuple[Element, ...]:
     """Get the ancestors of an element, including itself."""
-    result = []
-    current = element
-    while current is not None:
-        result.append(current)
-        current = None if isinstance(current, SoftwareSystem) else current.parent
+    cache = element.get_model()._ancestors
+    try:
+        return cache[element]
+    except KeyError:
+        pass
+    parent = (
+        None
+        if isinstance(element, SoftwareSystem)
+        else getattr(element, "parent", None)
+    )
+    result = (element,) if parent is None else (element,) + _get_ancestors(parent)
+    cache[element] = result
     return result
 
 
 def _clone_relationship(
     relationship: Relationship, new_source: Element, new_destination: Element
 ) -> Relationship:
-    print(f"{new_source.name}->{new_destination.name}")
     return new_source.add_relationship(
         destination=new_destination,
         description=relationship.description,
@@ -17,12 +17,26 @@
 
 
 import logging
-from typing import Callable, Iterable, List, Optional, Set, ValuesView
+from itertools import chain
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    ValuesView,
+)
 
 from pydantic import Field
 
 from ..abstract_base import AbstractBase
 from ..base_model import BaseModel
+from .deployment_element import DEFAULT_DEPLOYMENT_ENVIRONMENT
 from .deployment_node import DeploymentNode, DeploymentNodeIO
 from .element import Element
 from .enterprise import Enterprise, EnterpriseIO
@@ -33,6 +47,7 @@ from .person import Person, PersonIO
 from .relationship import Relationship
 from .sequential_integer_id_generator import SequentialIntegerIDGenerator
 from .software_system import SoftwareSystem, SoftwareSystemIO
+from .static_structure_element_instance import StaticStructureElementInstance
 
 
 __all__ = ("ModelIO", "Model")
@@ -111,35 +126,48 @@ class Model(AbstractBase):
         # TODO: simply iterate attributes
         self._elements_by_id = {}
         self._relationships_by_id = {}
+        # Adjacency of every element to its outgoing and incoming relationships, in
+        # the order in which the relationships were added to the model.
+        self._efferent_relationships: Dict[Element, List[Relationship]] = {}
+        self._afferent_relationships: Dict[Element, List[Relationship]] = {}
+        self._relationships_by_endpoints: Dict[
+            Tuple[Element, Element], List[Relationship]
+        ] = {}
+        # Ancestor chains of elements as used by the implied relationship strategies.
+        # Since the parent of an element never changes, entries never become stale.
+        self._ancestors: Dict[Element, Tuple[Element, ...]] = {}
+        # Instances of containers and software systems by their deployment environment
+        # and the element that they are an instance of.
+        self._element_instances: Dict[
+            str, Dict[Element, List[StaticStructureElementInstance]]
+        ] = {}
+        # Registries of the top-level elements by their (unique) names.
+        self._people_by_name: Dict[str, Person] = {}
+        self._software_systems_by_name: Dict[str, SoftwareSystem] = {}
+        self._deployment_nodes_by_name: Dict[Tuple[str, str], DeploymentNode] = {}
         self._id_generator = SequentialIntegerIDGenerator()
 
     def __contains__(self, element: Element):
         """Return True if the element is in the model."""
-        return element in self.get_elements()
+        return self._elements_by_id.get(element.id) is element
 
     @property
     def software_systems(self) -> Set[SoftwareSystem]:
         """Return the software systems in the model."""
-        return {
-            element
-            for element in self.get_elements()
-            if isinstance(element, SoftwareSystem)
-        }
+        return set(self._software_systems_by_name.values())
 
     @property
     def people(self) -> Set[Person]:
         """Return the people in the model."""
-        return {
-            element for element in self.get_elements() if isinstance(element, Person)
-        }
+        return set(self._people_by_name.values())
 
     @property
     def deployment_nodes(self) -> Set[DeploymentNode]:
         """Return the *top level* deployment nodes in the model."""
         return {
-            element
-            for element in self.get_elements()
-            if isinstance(element, DeploymentNode) and element.parent is None
+            node
+            for node in self._deployment_nodes_by_name.values()
+            if node.parent is None
         }
 
     @classmethod
@@ -161,15 +189,18 @@ class Model(AbstractBase):
         for deployment_node_io in model_io.deployment_nodes:
             model += DeploymentNode.hydrate(deployment_node_io, model=model)
 
-        for element in model.get_elements():
+        model._hydrate_relationships()
+        return model
+
+    def _hydrate_relationships(self) -> None:
+        """Resolve the endpoints of all hydrated element relationships."""
+        for element in self.get_elements():
             for relationship in element.relationships:
-                relationship.source = model.get_element(relationship.source_id)
-                relationship.destination = model.get_element(
+                relationship.source = self.get_element(relationship.source_id)
+                relationship.destination = self.get_element(
                     relationship.destination_id
                 )
-                model.add_relationship(relationship, create_implied_relationships=False)
-
-        return model
+                self.add_relationship(relationship, create_implied_relationships=False)
 
     def add_person(self, person=None, **kwargs) -> Person:
         """
@@ -216,25 +247,22 @@ class Model(AbstractBase):
 
     def __iadd__(self, element: Element) -> "Model":
         """Add a newly constructed element to the model."""
-        if element in self.get_elements():
+        if element in self:
             return self
         if isinstance(element, Person):
-            if any(element.name == p.name for p in self.people):
+            if element.name in self._people_by_name:
                 raise ValueError(
                     f"A person with the name '{element.name}' already exists in the "
                     f"model."
                 )
         elif isinstance(element, SoftwareSystem):
-            if any(element.name == s.name for s in self.software_systems):
+            if element.name in self._software_systems_by_name:
                 raise ValueError(
                     f"A software system with the name '{element.name}' already "
                     f"exists in the model."
                 )
         elif isinstance(element, DeploymentNode):
-            if any(
-                element.name == d.name and element.environment == d.environment
-                for d in self.deployment_nodes
-            ):
+            if (element.name, element.environment) in self._deployment_nodes_by_name:
                 raise ValueError(
                     f"A deployment node with the name '{element.name}' already "
                     f"exists in environment '{element.environment}' of the model."
@@ -343,6 +371,136 @@ class Model(AbstractBase):
         """Return an iterator over all relationships contained in this model."""
         return self._relationships_by_id.values()
 
+    def get_efferent_relationships(self, element: Element) -> Iterator[Relationship]:
+        """Return an iterator over all relationships with the given source."""
+        return iter(self._efferent_relationships.get(element, ()))
+
+    def get_afferent_relationships(self, element: Element) -> Iterator[Relationship]:
+        """Return an iterator over all relationships with the given destination."""
+        return iter(self._afferent_relationships.get(element, ()))
+
+    def get_efferent_relationships_with(
+        self, source: Element, destination: Element
+    ) -> Iterator[Relationship]:
+        """Return an iterator over all relationships from a source to a destination."""
+        return iter(self._relationships_by_endpoints.get((source, destination), ()))
+
+    def get_neighbours(
+        self,
+        element: Element,
+        element_type: Union[Type[Element], Tuple[Type[Element], ...]] = Element,
+        *,
+        depth: int = 1,
+    ) -> List[Element]:
+        """
+        Return the elements connected to an element by relationships.
+
+        Relationships are followed in both directions.  Only elements of the given
+        type(s) are returned and followed further.
+
+        Args:
+            element (Element): The element whose neighbourhood to return.
+            element_type (type or tuple of types, optional): The permitted types of
+                neighbours (default all elements).
+            depth (int, optional): The maximum number of relationships between the
+                element and a neighbour (default 1, the nearest neighbours).
+
+        Returns:
+            list: The neighbours in order of their distance, excluding the element.
+
+        Raises:
+            ValueError: When the depth is less than one.
+
+        """
+        if depth < 1:
+            raise ValueError(f"The depth must be at least one, not {depth}.")
+        seen = {element}
+        neighbours = []
+        frontier = [element]
+        for _ in range(depth):
+            next_frontier = []
+            for current in frontier:
+                efferent = self._efferent_relationships.get(current, ())
+                afferent = self._afferent_relationships.get(current, ())
+                for neighbour in chain(
+                    (r.destination for r in efferent), (r.source for r in afferent)
+                ):
+                    if neighbour not in seen and isinstance(neighbour, element_type):
+                        seen.add(neighbour)
+                        next_frontier.append(neighbour)
+            if not next_frontier:
+                break
+            neighbours.extend(next_frontier)
+            frontier = next_frontier
+        return neighbours
+
+    def create_implied_relationships(
+        self, strategy: Optional[Callable[[Relationship], None]] = None
+    ) -> None:
+        """
+        Apply an implied relationship strategy to all relationships at once.
+
+        This is useful after adding many relationships with
+        `create_implied_relationships=False`, or after loading a workspace. Unlike
+        when relationships are added one by one, all existing relationships are
+        taken into account when deciding whether an implied relationship is needed.
+        Relationships that are implied during this pass do not imply any others.
+
+        Args:
+            strategy (callable, optional): The implied relationship strategy to
+                apply. Defaults to the `implied_relationship_strategy` of this model.
+                See `implied_relationship_strategies.py` for details.
+
+        """
+        if strategy is None:
+            strategy = self.implied_relationship_strategy
+        for relationship in list(self._relationships_by_id.values()):
+            strategy(relationship)
+
+    def get_element_instances(
+        self, element: Element, environment: Optional[str] = None
+    ) -> List[StaticStructureElementInstance]:
+        """
+        Return the deployment instances of a container or software system.
+
+        Args:
+            element (Element): The container or software system.
+            environment (str, optional): Only return instances in this deployment
+                environment. By default, instances in all environments are returned.
+
+        Returns:
+            list: The instances in the order in which they were added to the model.
+
+        """
+        if environment is not None:
+            return list(self._element_instances.get(environment, {}).get(element, ()))
+        return [
+            instance
+            for instances in self._element_instances.values()
+            for instance in instances.get(element, ())
+        ]
+
+    def replicate_element_relationships(
+        self, environment: str = DEFAULT_DEPLOYMENT_ENVIRONMENT
+    ) -> None:
+        """
+        Replicate element relationships between all instances in an environment.
+
+        This is the batch equivalent of calling
+        `StaticStructureElementInstance.replicate_element_relationships` for every
+        container and software system instance in the environment.  It is intended
+        for building large deployment environments, where instances are first added
+        with `replicate_relationships=False`.  Relationships that were already
+        replicated are not duplicated.
+
+        Args:
+            environment (str, optional): The name of the deployment environment.
+
+        """
+        for instances in list(self._element_instances.get(environment, {}).values()):
+            for instance in instances:
+                instance._replicate_efferent_relationships()
+
     def get_elements(self) -> ValuesView[Element]:
         """Return an iterator over all elements contained in this model."""
         return self._elements_by_id.values()
@@ -363,6 +521,17 @@ class Model(AbstractBase):
         ):
             raise ValueError(f"The element {element} has an existing ID.")
         self._elements_by_id[element.id] = element
+        if isinstance(element, Person):
+            self._people_by_name[element.name] = element
+        elif isinstance(element, SoftwareSystem):
+            self._software_systems_by_name[element.name] = element
+        elif isinstance(element, DeploymentNode) and element.parent is None:
+            key = (element.name, element.environment)
+            self._deployment_nodes_by_name[key] = element
+        elif isinstance(element, StaticStructureElementInstance):
+            self._element_instances.setdefault(element.environment, {}).setdefault(
+                element.element, []
+            ).append(element)
         element.set_model(self)
         self._id_generator.found(element.id)
         for child in element.child_elements:
@@ -371,7 +540,7 @@ class Model(AbstractBase):
     def _add_relationship(
         self, relationship: Relationship, create_implied_relationships: bool
     ):
-        if relationship in self.get_relationships():
+        if self._relationships_by_id.get(relationship.id) is relationship:
             return
         if not relationship.id:
             relationship.id = self._id_generator.generate_id()
@@ -394,5 +563,17 @@ class Model(AbstractBase):
             self.implied_relationship_strategy(relationship)
 
     def _add_relationship_to_internal_structures(self, relationship: Relationship):
+        if self._relationships_by_id.get(relationship.id) is relationship:
+            # Already registered through `Element.add_relationship`.
+            return
         self._relationships_by_id[relationship.id] = relationship
+        self._efferent_relationships.setdefault(relationship.source, []).append(
+            relationship
+        )
+        self._afferent_relationships.setdefault(relationship.destination, []).append(
+            relationship
+        )
+        self._relationships_by_endpoints.setdefault(
+            (relationship.source, relationship.destination), []
+        ).append(relationship)
         self._id_generator.found(relationship.id)
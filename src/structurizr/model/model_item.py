@@ -54,9 +54,9 @@ class ModelItemIO(BaseModel, ABC):
             return tags.split(",")
         return list(tags)
 
-    def dict(self, **kwargs) -> dict:
+    @classmethod
+    def _finalize_dict(cls, obj: dict) -> dict:
         """Map this IO into a dictionary suitable for serialisation."""
-        obj = super().dict(**kwargs)
         if "tags" in obj:
             obj["tags"] = ",".join(obj["tags"])
         return obj
@@ -16,7 +16,7 @@
 """Provide a software system element model."""
 
 
-from typing import Iterable, List, Set
+from typing import Dict, Iterable, List
 
 from pydantic import Field
 
@@ -62,7 +62,8 @@ class SoftwareSystem(StaticStructureElement):
         """Initialise a new SoftwareSystem."""
         super().__init__(**kwargs)
         self.location = location
-        self._containers: Set[Container] = set()
+        # Containers by their (unique) names.
+        self._containers: Dict[str, Container] = {}
 
         # TODO: canonical_name
         # TODO: parent
@@ -73,7 +74,7 @@ class SoftwareSystem(StaticStructureElement):
     @property
     def containers(self) -> Iterable[Container]:
         """Return read-only list of child containers."""
-        return list(self._containers)
+        return list(self._containers.values())
 
     @property
     def child_elements(self) -> Iterable[Container]:
@@ -94,10 +95,11 @@ class SoftwareSystem(StaticStructureElement):
         """Add a new container to this system and register with its model."""
         # TODO: once we move past python 3.6 change to proper return type via
         # __future__.annotations
-        if container in self._containers:
+        existing = self._containers.get(container.name)
+        if existing is container:
             return self
 
-        if self.get_container_with_name(container.name):
+        if existing is not None:
             raise ValueError(
                 f"Container with name {container.name} already exists for {self}."
             )
@@ -109,7 +111,7 @@ class SoftwareSystem(StaticStructureElement):
                 f"Container with name {container.name} already has parent "
                 f"{container.parent}. Cannot add to {self}."
             )
-        self._containers.add(container)
+        self._containers[container.name] = container
         if self.has_model:
             model = self.model
             model += container
@@ -117,7 +119,7 @@ class SoftwareSystem(StaticStructureElement):
 
     def get_container_with_name(self, name: str) -> Container:
         """Return the container with the given name, or None."""
-        return next((c for c in self._containers if c.name == name), None)
+        return self._containers.get(name)
 
     @classmethod
     def hydrate(cls, software_system_io: SoftwareSystemIO) -> "SoftwareSystem":
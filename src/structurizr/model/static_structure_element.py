@@ -17,7 +17,7 @@
 
 
 from abc import ABC
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from .element import Element
 from .groupable_element import GroupableElement, GroupableElementIO
@@ -25,6 +25,7 @@ from .groupable_element import GroupableElement, GroupableElementIO
 
 if TYPE_CHECKING:  # pragma: no cover
     from .relationship import Relationship
+    from .static_structure_element_instance import StaticStructureElementInstance
 
 
 __all__ = ("StaticStructureElementIO", "StaticStructureElement")
@@ -51,6 +52,13 @@ class StaticStructureElement(GroupableElement, ABC):
 
     """
 
+    @property
+    def instances(self) -> List["StaticStructureElementInstance"]:
+        """Return the deployment instances of this element in all environments."""
+        if not self.has_model:
+            return []
+        return self.model.get_element_instances(self)
+
     def uses(
         self,
         destination: Element,
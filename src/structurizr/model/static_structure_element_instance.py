@@ -17,13 +17,14 @@
 
 
 from abc import ABC
-from typing import TYPE_CHECKING, Iterable, List, Optional, Set
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from pydantic import Field
 
 from ..mixin.childless_mixin import ChildlessMixin
 from .deployment_element import DeploymentElement, DeploymentElementIO
 from .http_health_check import HTTPHealthCheck, HTTPHealthCheckIO
+from .relationship import Relationship
 from .static_structure_element import StaticStructureElement
 
 
@@ -72,35 +73,39 @@ class StaticStructureElementInstance(ChildlessMixin, DeploymentElement, ABC):
         sets up the equivalent relationships between the corresponding instances in
         the same environment.
         """
-        # Find all the element instances in the same deployment environment
-        element_instances: Set[StaticStructureElementInstance] = {
-            e
-            for e in self.model.get_elements()
-            if isinstance(e, StaticStructureElementInstance)
-            and e.environment == self.environment
-        }
-
-        for other_element_instance in element_instances:
-            other_element = other_element_instance.element
-
-            for relationship in self.element.relationships:
-                if relationship.destination is other_element:
-                    self.add_relationship(
-                        destination=other_element_instance,
-                        description=relationship.description,
-                        technology=relationship.technology,
-                        interaction_style=relationship.interaction_style,
-                        linked_relationship_id=relationship.id,
-                    ).tags.clear()
-            for relationship in other_element.relationships:
-                if relationship.destination is self.element:
-                    other_element_instance.add_relationship(
-                        destination=self,
-                        description=relationship.description,
-                        technology=relationship.technology,
-                        interaction_style=relationship.interaction_style,
-                        linked_relationship_id=relationship.id,
-                    ).tags.clear()
+        self._replicate_efferent_relationships()
+        instances = self.model._element_instances.get(self.environment, {})
+        for relationship in self.model.get_afferent_relationships(self.element):
+            for other in instances.get(relationship.source, ()):
+                # Relationships of the element with itself are covered above.
+                if other is not self:
+                    other._replicate_relationship(relationship, self)
+
+    def _replicate_efferent_relationships(self) -> None:
+        """Replicate the relationships from the element of this instance."""
+        instances = self.model._element_instances.get(self.environment, {})
+        for relationship in self.model.get_efferent_relationships(self.element):
+            for other in instances.get(relationship.destination, ()):
+                self._replicate_relationship(relationship, other)
+
+    def _replicate_relationship(
+        self,
+        relationship: Relationship,
+        destination: "StaticStructureElementInstance",
+    ) -> None:
+        """Replicate an element relationship to a destination unless it exists."""
+        if any(
+            r.linked_relationship_id == relationship.id
+            for r in self.model.get_efferent_relationships_with(self, destination)
+        ):
+            return
+        self.add_relationship(
+            destination=destination,
+            description=relationship.description,
+            technology=relationship.technology,
+            interaction_style=relationship.interaction_style,
+            linked_relationship_id=relationship.id,
+        ).tags.clear()
 
     @classmethod
     def hydrate_arguments(cls, instance_io: StaticStructureElementInstanceIO) -> dict:
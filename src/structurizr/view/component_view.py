@@ -116,17 +116,16 @@ class ComponentView(StaticView):
 
     def add_all_containers(self) -> None:
         """Add all other containers in the software system to this view."""
-        for container in self.software_system.containers:
-            self.add(container)
+        self.add_many(self.software_system.containers)
 
     def add_all_components(self) -> None:
         """Add all components in the container to this view."""
-        for component in self.container.components:
-            self.add(component)
+        self.add_many(self.container.components)
 
-    def add_nearest_neighbours(self, element: Element, _=None) -> None:
+    def add_nearest_neighbours(
+        self, element: Element, _=None, *, depth: int = 1
+    ) -> None:
         """Add neighbouring people, software systems, containers and components."""
-        super().add_nearest_neighbours(element, SoftwareSystem)
-        super().add_nearest_neighbours(element, Person)
-        super().add_nearest_neighbours(element, Container)
-        super().add_nearest_neighbours(element, Component)
+        super().add_nearest_neighbours(
+            element, (SoftwareSystem, Person, Container, Component), depth=depth
+        )
@@ -100,11 +100,12 @@ class ContainerView(StaticView):
 
     def add_all_containers(self) -> None:
         """Add all containers within the software system in scope to this view."""
-        for container in self.software_system.containers:
-            self.add(container)
+        self.add_many(self.software_system.containers)
 
-    def add_nearest_neighbours(self, element: Element, _=None) -> None:
+    def add_nearest_neighbours(
+        self, element: Element, _=None, *, depth: int = 1
+    ) -> None:
         """Add all people, software systems and containers that neighbor an element."""
-        super().add_nearest_neighbours(element, SoftwareSystem)
-        super().add_nearest_neighbours(element, Person)
-        super().add_nearest_neighbours(element, Container)
+        super().add_nearest_neighbours(
+            element, (SoftwareSystem, Person, Container), depth=depth
+        )
@@ -16,7 +16,8 @@
 Used to show the mapping of container instances to deployment nodes.
 """
 
-from typing import Iterable, List, Optional, Union
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Set, Union
 
 from ..mixin.model_ref_mixin import ModelRefMixin
 from ..model.container_instance import ContainerInstance
@@ -65,6 +66,10 @@ class DeploymentView(ModelRefMixin, View):
         super().__init__(**kwargs)
         self._environment = environment
         self._animations = [] if animations is None else list(animations)
+        # The IDs of all elements shown in the animation steps so far.
+        self._animated_element_ids: Set[str] = set().union(
+            *(step.elements for step in self._animations)
+        )
 
     @property
     def environment(self):
@@ -119,16 +124,24 @@ class DeploymentView(ModelRefMixin, View):
         ],
     ):
         """Remove the given item from this view."""
+        self.remove_many((item,))
+
+    def remove_many(self, items: Iterable[DeploymentElement]) -> None:
+        """Remove the given items, including the contents of nodes, from this view."""
+        super().remove_many(chain.from_iterable(map(self._get_descendants, items)))
+
+    @classmethod
+    def _get_descendants(cls, item: DeploymentElement) -> Iterator[DeploymentElement]:
+        """Yield the contents of a deployment node recursively, then the node."""
         if isinstance(item, DeploymentNode):
-            child_items = (
+            for child in (
                 item.container_instances
                 + item.software_system_instances
                 + item.infrastructure_nodes
                 + item.children
-            )
-            for child in child_items:
-                self.remove(child)
-        self._remove_element(item)
+            ):
+                yield from cls._get_descendants(child)
+        yield item
 
     def _add_node_children(
         self, deployment_node: DeploymentNode, add_relationships: bool
@@ -180,13 +193,11 @@ class DeploymentView(ModelRefMixin, View):
                 + "infrastructure nodes must be specified"
             )
 
-        element_ids_in_previous_steps = set()
-        for step in self.animations:
-            element_ids_in_previous_steps = element_ids_in_previous_steps.union(
-                step.elements
-            )
-
+        # Elements of this step are added as well, such that relationships between
+        # them are included below.  Nothing is added if the step ends up empty.
+        element_ids_in_previous_steps = self._animated_element_ids
         element_ids_in_this_step = set()
+        elements_in_this_step = []
         relationship_ids_in_this_step = set()
 
         for element in element_instances:
@@ -196,27 +207,34 @@ class DeploymentView(ModelRefMixin, View):
             ):
                 element_ids_in_previous_steps.add(element.id)
                 element_ids_in_this_step.add(element.id)
+                elements_in_this_step.append(element)
 
                 deployment_node = self._find_deployment_node(element)
                 while deployment_node is not None:
                     if deployment_node.id not in element_ids_in_previous_steps:
                         element_ids_in_previous_steps.add(deployment_node.id)
                         element_ids_in_this_step.add(deployment_node.id)
+                        elements_in_this_step.append(deployment_node)
                     deployment_node = deployment_node.parent
 
         if element_ids_in_this_step == set():
             raise ValueError("None of the specified instances exist in this view.")
 
-        for relationship_view in self.relationship_views:
-            relationship = relationship_view.relationship
-            if (
-                relationship.source.id in element_ids_in_this_step
-                and relationship.destination.id in element_ids_in_previous_steps
-            ) or (
-                relationship.destination.id in element_ids_in_this_step
-                and relationship.source.id in element_ids_in_previous_steps
-            ):
-                relationship_ids_in_this_step.add(relationship.id)
+        # Only the relationships of the elements in this step can be new.
+        for element in elements_in_this_step:
+            model = element.model
+            for relationship in model.get_efferent_relationships(element):
+                if (
+                    relationship.destination.id in element_ids_in_previous_steps
+                    and relationship.id in self._relationship_views_by_id
+                ):
+                    relationship_ids_in_this_step.add(relationship.id)
+            for relationship in model.get_afferent_relationships(element):
+                if (
+                    relationship.source.id in element_ids_in_previous_steps
+                    and relationship.id in self._relationship_views_by_id
+                ):
+                    relationship_ids_in_this_step.add(relationship.id)
 
         self._animations.append(
             Animation(
@@ -226,18 +244,14 @@ class DeploymentView(ModelRefMixin, View):
             )
         )
 
-    def _find_deployment_node(self, element: DeploymentElement) -> DeploymentNode:
-        all_deployment_nodes = [
-            e for e in self.model.get_elements() if isinstance(e, DeploymentNode)
-        ]
-        for node in all_deployment_nodes:
-            if (
-                element in node.container_instances
-                or element in node.software_system_instances
-                or element in node.infrastructure_nodes
-            ):
-                return node
-        return None
+    @staticmethod
+    def _find_deployment_node(
+        element: DeploymentElement,
+    ) -> Optional[DeploymentNode]:
+        """Return the deployment node that hosts an instance or infrastructure node."""
+        if isinstance(element, DeploymentNode):
+            return None
+        return getattr(element, "parent", None)
 
     @property
     def animations(self) -> Iterable[Animation]:
@@ -17,9 +17,9 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Dict, Iterable, List, Optional, Type, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
 
-from ..model import Container, Element, Person, SoftwareSystem
+from ..model import Element, Person, SoftwareSystem
 from .animation import Animation, AnimationIO
 from .view import View, ViewIO
 
@@ -90,34 +90,56 @@ class StaticView(View, ABC):
         """
         self._add_element(element, add_relationships)
 
+    def add_many(
+        self,
+        elements: Iterable[Element],
+        add_relationships: bool = True,
+    ) -> None:
+        """
+        Add the given elements to this view.
+
+        This is equivalent to adding the elements one by one, but the relationships
+        are added in a single pass once all elements are in the view.
+
+        Args:
+            elements (iterable of Element): The elements to add to this view.
+            add_relationships (bool, optional): Whether to include all of the static
+                elements' relationships with other elements (default `True`).
+
+        """
+        self._add_elements(elements, add_relationships)
+
     def add_all_people(self) -> None:
         """Add all people in the model to this view."""
-        for person in self.model.people:
-            self.add(person)
+        self.add_many(self.model.people)
 
     def add_all_software_systems(self) -> None:
         """Add all software systems in the model to this view."""
-        for system in self.model.software_systems:
-            self.add(system)
+        self.add_many(self.model.software_systems)
 
     def add_nearest_neighbours(
         self,
         element: Element,
-        element_type: Union[Type[Person], Type[SoftwareSystem], Type[Container]],
+        element_type: Union[Type[Element], Tuple[Type[Element], ...]],
+        *,
+        depth: int = 1,
     ) -> None:
-        """Add all permitted elements from a model to this view."""
-        self._add_element(element, False)
-
-        # TODO(ilaif): @midnighter - Should we move to @property instead
-        #  of get_X()? More pythonic.
-        # (midnighter): Probably yes.
-        for relationship in self.model.get_relationships():
-            if relationship.source == element and isinstance(
-                relationship.destination, element_type
-            ):
-                self._add_element(relationship.destination, add_relationships=True)
-
-            if relationship.destination == element and isinstance(
-                relationship.source, element_type
-            ):
-                self._add_element(relationship.source, add_relationships=True)
+        """
+        Add an element and its neighbours of the given type(s) to this view.
+
+        Args:
+            element (Element): The element whose neighbours to add.
+            element_type (type or tuple of types): The permitted types of neighbours,
+                for example, `SoftwareSystem` or `(Person, SoftwareSystem)`.
+            depth (int, optional): The maximum number of relationships between the
+                element and a neighbour (default 1).
+
+        See Also:
+            Model.get_neighbours
+
+        """
+        # The element itself is included for its relationships with itself.
+        self._add_elements(
+            [element, *self.model.get_neighbours(element, element_type, depth=depth)],
+            add_relationships=True,
+        )
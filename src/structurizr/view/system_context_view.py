@@ -62,10 +62,9 @@ class SystemContextView(StaticView):
         self.add_all_software_systems()
         self.add_all_people()
 
-    def add_nearest_neighbours(self, element: Element):
+    def add_nearest_neighbours(self, element: Element, *, depth: int = 1):
         """Add all softare systems and people directly connected to the element."""
-        super().add_nearest_neighbours(element, SoftwareSystem)
-        super().add_nearest_neighbours(element, Person)
+        super().add_nearest_neighbours(element, (SoftwareSystem, Person), depth=depth)
 
     @classmethod
     def hydrate(
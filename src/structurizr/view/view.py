@@ -16,7 +16,8 @@
 """Provide a superclass for all views."""
 
 
-from typing import Any, Dict, Iterable, List, Optional, Set
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
 from pydantic import Field
 
@@ -80,8 +81,15 @@ class View(AbstractView):
         self.software_system_id = software_system.id if software_system else None
         self.paper_size = paper_size
         self.automatic_layout = automatic_layout
-        self.element_views: Set[ElementView] = set(element_views)
-        self._relationship_views: Set[RelationshipView] = set(relationship_views)
+        self._element_views: Dict[str, ElementView] = {
+            view.id: view for view in element_views
+        }
+        self._relationship_views: Set[RelationshipView] = set()
+        # The same relationship may be shown more than once, e.g. as a request and a
+        # response in a dynamic view, hence a list of views per relationship ID.
+        self._relationship_views_by_id: Dict[str, List[RelationshipView]] = {}
+        for relationship_view in relationship_views:
+            self._add_relationship_view(relationship_view)
 
         # TODO
         self.layout_merge_strategy = layout_merge_strategy
@@ -107,10 +115,27 @@ class View(AbstractView):
         """Return the `Model` for this view."""
         return self.software_system.get_model()
 
+    @property
+    def element_views(self) -> Iterable[ElementView]:
+        """
+        Return the element views contained by this view.
+
+        The views are returned as a read-only set; please use the methods of the view
+        for adding or removing elements.
+
+        """
+        return frozenset(self._element_views.values())
+
     @property
     def relationship_views(self) -> Iterable[RelationshipView]:
-        """Return the relationship views contained by this view."""
-        return set(self._relationship_views)
+        """
+        Return the relationship views contained by this view.
+
+        The views are returned as a read-only set; please use the methods of the view
+        for adding or removing relationships.
+
+        """
+        return frozenset(self._relationship_views)
 
     def _add_element(self, element: Element, add_relationships: bool) -> ElementView:
         """
@@ -130,11 +155,32 @@ class View(AbstractView):
         view = self.find_element_view(element=element)
         if view is None:
             view = ElementView(element=element)
-            self.element_views.add(view)
+            self._element_views[view.id] = view
+            viewset = self._viewset()
+            if viewset is not None:
+                viewset._add_element_view(self, view.id)
         if add_relationships:
             self._add_relationships(element)
         return view
 
+    def _add_elements(
+        self, elements: Iterable[Element], add_relationships: bool
+    ) -> None:
+        """
+        Add many elements to this view, followed by their relationships at once.
+
+        Args:
+            elements (iterable of Element): The elements to add to the view.
+            add_relationships (bool): Whether to include all of the elements'
+                relationships with other elements.
+
+        """
+        elements = list(elements)
+        for element in elements:
+            self._add_element(element, add_relationships=False)
+        if add_relationships:
+            self._add_relationships(*elements)
+
     def _remove_element(self, element: Element) -> None:
         """
         Remove the given element from this view.
@@ -143,22 +189,68 @@ class View(AbstractView):
             element (Element): The element to remove from the view.
 
         """
-        if element not in self.model:
-            raise RuntimeError(
-                f"The element {element} does not exist in the model associated with "
-                f"this view."
-            )
-        self.element_views.add(ElementView(id=element.id))
-        for element_view in list(self.element_views):  # Copy as modifying as we go
-            if element_view.id == element.id:
-                self.element_views.remove(element_view)
+        self._remove_elements((element,))
+
+    def _remove_elements(self, elements: Iterable[Element]) -> None:
+        """
+        Remove the given elements and their relationships from this view.
+
+        Only the relationships of the elements themselves are visited rather than
+        every relationship view.
 
-        for relationship_view in list(self._relationship_views):
+        Args:
+            elements (iterable of Element): The elements to remove from the view.
+
+        """
+        model = self.model
+        viewset = self._viewset()
+        for element in elements:
+            if element not in model:
+                raise RuntimeError(
+                    f"The element {element} does not exist in the model associated "
+                    f"with this view."
+                )
             if (
-                relationship_view.relationship.source.id == element.id
-                or relationship_view.relationship.destination.id == element.id
+                self._element_views.pop(element.id, None) is not None
+                and viewset is not None
             ):
-                self._relationship_views.remove(relationship_view)
+                viewset._remove_element_view(self, element.id)
+
+            for relationship in chain(
+                element.get_efferent_relationships(),
+                element.get_afferent_relationships(),
+            ):
+                for relationship_view in list(
+                    self._relationship_views_by_id.get(relationship.id, ())
+                ):
+                    self._remove_relationship_view(relationship_view)
+
+    def remove_many(self, elements: Iterable[Element]) -> None:
+        """
+        Remove the given elements and their relationships from this view.
+
+        Args:
+            elements (iterable of Element): The elements to remove from the view.
+
+        """
+        self._remove_elements(elements)
+
+    def remove_where(self, predicate: Callable[[Element], bool]) -> None:
+        """
+        Remove all elements that satisfy a condition from this view.
+
+        Args:
+            predicate (callable): A function that takes an element in this view and
+                returns `True` if the element should be removed.
+
+        """
+        self.remove_many(
+            [
+                element_view.element
+                for element_view in list(self._element_views.values())
+                if predicate(element_view.element)
+            ]
+        )
 
     def _add_relationship(
         self,
@@ -187,30 +279,55 @@ class View(AbstractView):
                     order=order,
                     response=response,
                 )
-                self._relationship_views.add(view)
+                self._add_relationship_view(view)
             return view
 
-    def _add_relationships(self, element: Element) -> None:
+    def _add_relationships(self, *elements: Element) -> None:
         """
-        Add all relationships involving the given element to this view.
+        Add all relationships involving the given elements to this view.
 
         Args:
-            element (Element): The model element.
+            *elements (Element): The model elements.
 
         """
-        elements: Set[str] = {v.id for v in self.element_views}
-
-        for relationship in element.get_efferent_relationships():
-            if relationship.destination.id in elements:
-                self._relationship_views.add(
-                    RelationshipView(relationship=relationship)
-                )
+        in_view = self._element_views
+        # Relationships among the given elements are visited as efferent ones only.
+        given = {element.id for element in elements}
+
+        for element in elements:
+            for relationship in element.get_efferent_relationships():
+                if (
+                    relationship.destination.id in in_view
+                    and relationship.id not in self._relationship_views_by_id
+                ):
+                    self._add_relationship_view(
+                        RelationshipView(relationship=relationship)
+                    )
+
+            for relationship in element.get_afferent_relationships():
+                if (
+                    relationship.source.id in in_view
+                    and relationship.source.id not in given
+                    and relationship.id not in self._relationship_views_by_id
+                ):
+                    self._add_relationship_view(
+                        RelationshipView(relationship=relationship)
+                    )
+
+    def _add_relationship_view(self, relationship_view: RelationshipView) -> None:
+        """Add a relationship view to this view and its index."""
+        self._relationship_views.add(relationship_view)
+        self._relationship_views_by_id.setdefault(relationship_view.id, []).append(
+            relationship_view
+        )
 
-        for relationship in element.get_afferent_relationships():
-            if relationship.source.id in elements:
-                self._relationship_views.add(
-                    RelationshipView(relationship=relationship)
-                )
+    def _remove_relationship_view(self, relationship_view: RelationshipView) -> None:
+        """Remove a relationship view from this view and its index."""
+        self._relationship_views.remove(relationship_view)
+        views = self._relationship_views_by_id[relationship_view.id]
+        views.remove(relationship_view)
+        if not views:
+            del self._relationship_views_by_id[relationship_view.id]
 
     def copy_layout_information_from(self, source: "View") -> None:
         """Copy the layout information from another view, including child views."""
@@ -245,9 +362,7 @@ class View(AbstractView):
         element: Optional[Element] = None,
     ) -> Optional[ElementView]:
         """Find a child element view matching a given element."""
-        return next(
-            (view for view in self.element_views if view.element.id == element.id), None
-        )
+        return self._element_views.get(element.id)
 
     def find_relationship_view(
         self,
@@ -266,25 +381,26 @@ class View(AbstractView):
                           relationship
             response:     find a child view with matching response indicator.
         """
-        for view in self._relationship_views:
+        candidates = (
+            self._relationship_views
+            if relationship is None
+            else self._relationship_views_by_id.get(relationship.id, ())
+        )
+        for view in candidates:
+            if response is not None and view.response != response:
+                continue
             rel = view.relationship
             if (
-                (relationship is None or rel.id == relationship.id)
-                and (
-                    description is None
-                    or view.description == description
-                    or (view.description is None and rel.description == description)
-                )
-                and (response is None or view.response == response)
+                description is None
+                or view.description == description
+                or (view.description is None and rel.description == description)
             ):
                 return view
 
     def check_parent_and_children_not_in_view(self, element: Element) -> None:
         """Ensure that an element can't be added if parent or children are in view."""
-        for view in self.element_views:
-            if view.element in element.child_elements:
-                raise ValueError(f"A child of {element.name} is already in this view.")
-            if view.element is getattr(element, "parent", None):
-                raise ValueError(
-                    f"The parent of {element.name} is already in this view."
-                )
+        if any(self.is_element_in_view(child) for child in element.child_elements):
+            raise ValueError(f"A child of {element.name} is already in this view.")
+        parent = getattr(element, "parent", None)
+        if parent is not None and self.is_element_in_view(parent):
+            raise ValueError(f"The parent of {element.name} is already in this view.")
@@ -16,15 +16,27 @@
 """Provide a set of views onto a software architecture model."""
 
 
+from functools import partial
 from itertools import chain
-from typing import TYPE_CHECKING, Iterable, List, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pydantic import Field
 
 from ..abstract_base import AbstractBase
 from ..base_model import BaseModel
 from ..mixin import ModelRefMixin
-from .abstract_view import AbstractView
+from .abstract_view import AbstractView, AbstractViewIO
 from .component_view import ComponentView, ComponentViewIO
 from .configuration import Configuration, ConfigurationIO
 from .container_view import ContainerView, ContainerViewIO
@@ -37,13 +49,35 @@ from .view import View
 
 
 if TYPE_CHECKING:
-    from ..model import Model  # pragma: no cover
+    from ..model import Element, Model  # pragma: no cover
 
 
 __all__ = ("ViewSet", "ViewSetIO")
 
 T = TypeVar("T")
 
+VIEW_TYPES = (
+    SystemLandscapeView,
+    SystemContextView,
+    ContainerView,
+    ComponentView,
+    DeploymentView,
+    DynamicView,
+    FilteredView,
+)
+
+# The view collections of a view set by field name, together with the types of their
+# views and IOs. Filtered views come last, since they refer to the other views.
+VIEW_COLLECTIONS = (
+    ("system_landscape_views", SystemLandscapeView, SystemLandscapeViewIO),
+    ("system_context_views", SystemContextView, SystemContextViewIO),
+    ("container_views", ContainerView, ContainerViewIO),
+    ("component_views", ComponentView, ComponentViewIO),
+    ("deployment_views", DeploymentView, DeploymentViewIO),
+    ("dynamic_views", DynamicView, DynamicViewIO),
+    ("filtered_views", FilteredView, FilteredViewIO),
+)
+
 
 class ViewSetIO(BaseModel):
     """
@@ -102,9 +136,25 @@ class ViewSet(ModelRefMixin, AbstractBase):
             dynamic_views,
             filtered_views,
         )
-        self._views = {view.key: view for view in all_views}
+        self._views: Dict[str, AbstractView] = {}
+        # Registries of views by their type and by the ID of the software system or
+        # container in their scope, each keyed by view key.
+        self._typed_views: Dict[Type[AbstractView], Dict[str, AbstractView]] = {
+            klass: {} for klass in VIEW_TYPES
+        }
+        self._scoped_views: Dict[str, Dict[str, AbstractView]] = {}
+        # The views that contain an element, by element ID and then view key.
+        self._element_views: Dict[str, Dict[str, View]] = {}
+        # Lazily loaded views that have not been hydrated yet, by key, with their
+        # type and a function that hydrates them.
+        self._pending_views: Dict[
+            str, Tuple[Type[AbstractView], Callable[[], AbstractView]]
+        ] = {}
+        for view in all_views:
+            self._add_view(view)
         self.configuration = Configuration() if configuration is None else configuration
-        self.set_model(model)
+        if model is not None:
+            self.set_model(model)
 
     @property
     def system_landscape_views(self) -> Iterable[SystemLandscapeView]:
@@ -144,80 +194,137 @@ class ViewSet(ModelRefMixin, AbstractBase):
     @property
     def views(self) -> Iterable[AbstractView]:
         """Return all the views in this ViewSet."""
+        self._hydrate_pending_views()
         return self._views.values()
 
     @classmethod
-    def hydrate(cls, views: ViewSetIO, model: "Model") -> "ViewSet":
-        """Hydrate a new ViewSet instance from its IO."""
-        system_landscape_views = []
-        for view_io in views.system_landscape_views:
-            view = SystemLandscapeView.hydrate(view_io, model=model)
-            cls._hydrate_view(view, model=model)
-            system_landscape_views.append(view)
+    def hydrate(
+        cls, views: ViewSetIO, model: "Model", *, lazy: bool = False
+    ) -> "ViewSet":
+        """
+        Hydrate a new ViewSet instance from its IO.
 
-        system_context_views = []
-        for view_io in views.system_context_views:
-            software_system = model.get_software_system_with_id(
-                view_io.software_system_id
-            )
-            view = SystemContextView.hydrate(view_io, software_system=software_system)
-            cls._hydrate_view(view, model=model)
-            system_context_views.append(view)
+        Args:
+            views (ViewSetIO): The IO of the view set.
+            model (Model): The hydrated model that the views refer to.
+            lazy (bool, optional): If `True` then each view is only hydrated when it
+                is first accessed, for example, by key or through one of the typed
+                view properties.
+
+        """
+        result = cls(
+            model=model,
+            configuration=Configuration.hydrate(views.configuration),
+        )
+        # TODO:
+        # enterprise_context_views: Iterable[EnterpriseContextView] = (),
+        for name, view_type, _ in VIEW_COLLECTIONS:
+            for view_io in getattr(views, name):
+                if lazy:
+                    result._pending_views[view_io.key] = (
+                        view_type,
+                        partial(result._hydrate_view_io, view_type, view_io, model),
+                    )
+                else:
+                    result._add_view(result._hydrate_view_io(view_type, view_io, model))
+        return result
+
+    @classmethod
+    def load_lazily(
+        cls,
+        obj: Dict[str, Any],
+        model: Callable[[], "Model"],
+        *,
+        validate: bool = True,
+    ) -> "ViewSet":
+        """
+        Create a ViewSet whose views are parsed and hydrated on first access.
+
+        Only the configuration is parsed immediately. Every other view is parsed
+        from its JSON object and hydrated when it is first accessed, like with
+        `ViewSet.hydrate(..., lazy=True)`.
+
+        Args:
+            obj (dict): The parsed JSON object of the view set.
+            model (callable): A function returning the model that the views refer
+                to, which is only called once a view is hydrated or the model is
+                otherwise needed.
+            validate (bool, optional): If `False` then the views are trusted to be
+                valid, see `BaseModel.parse_obj_trusted`.
 
-        container_views = []
-        for view_io in views.container_views:
+        """
+        aliases = {ViewSetIO.__fields__[name].alias for name, *_ in VIEW_COLLECTIONS}
+        views = ViewSetIO.load_obj(
+            {key: value for key, value in obj.items() if key not in aliases},
+            validate=validate,
+        )
+        result = cls(
+            model=None, configuration=Configuration.hydrate(views.configuration)
+        )
+        # The mixin only requires a callable returning the model.
+        result._model = model
+        for name, view_type, io_class in VIEW_COLLECTIONS:
+            for view_obj in obj.get(ViewSetIO.__fields__[name].alias) or ():
+                load = partial(
+                    result._load_view, view_type, io_class, view_obj, validate
+                )
+                if "key" in view_obj:
+                    result._pending_views[view_obj["key"]] = (view_type, load)
+                else:
+                    # Let parsing report the missing key.
+                    result._add_view(load())
+        return result
+
+    def _load_view(
+        self,
+        view_type: Type[AbstractView],
+        io_class: Type[AbstractViewIO],
+        obj: Dict[str, Any],
+        validate: bool,
+    ) -> AbstractView:
+        """Parse and hydrate a single view from its JSON object."""
+        view_io = io_class.load_obj(obj, validate=validate)
+        return self._hydrate_view_io(view_type, view_io, self.model)
+
+    def _hydrate_view_io(
+        self, view_type: Type[AbstractView], view_io: AbstractViewIO, model: "Model"
+    ) -> AbstractView:
+        """Hydrate a single view from its IO, resolving its references."""
+        if view_type is SystemLandscapeView:
+            view = SystemLandscapeView.hydrate(view_io, model=model)
+        elif view_type is SystemContextView or view_type is ContainerView:
             software_system = model.get_software_system_with_id(
-                id=view_io.software_system_id,
+                view_io.software_system_id
             )
-            view = ContainerView.hydrate(view_io, software_system=software_system)
-            cls._hydrate_view(view, model=model)
-            container_views.append(view)
-
-        component_views = []
-        for view_io in views.component_views:
+            view = view_type.hydrate(view_io, software_system=software_system)
+        elif view_type is ComponentView:
             container = model.get_element(view_io.container_id)
             view = ComponentView.hydrate(view_io, container=container)
-            cls._hydrate_view(view, model=model)
-            component_views.append(view)
-
-        deployment_views = []
-        for view_io in views.deployment_views:
+        elif view_type is DeploymentView:
             view = DeploymentView.hydrate(view_io)
-            cls._hydrate_view(view, model=model)
-            deployment_views.append(view)
-
-        dynamic_views = []
-        for view_io in views.dynamic_views:
+        elif view_type is DynamicView:
             element = (
                 model.get_element(view_io.element_id) if view_io.element_id else None
             )
             view = DynamicView.hydrate(view_io, element=element)
-            cls._hydrate_view(view, model=model)
-            dynamic_views.append(view)
-
-        filtered_views = [
-            FilteredView.hydrate(view_io) for view_io in views.filtered_views
-        ]
-
-        result = cls(
-            model=model,
-            # TODO:
-            # enterprise_context_views: Iterable[EnterpriseContextView] = (),
-            system_landscape_views=system_landscape_views,
-            system_context_views=system_context_views,
-            container_views=container_views,
-            component_views=component_views,
-            deployment_views=deployment_views,
-            dynamic_views=dynamic_views,
-            filtered_views=filtered_views,
-            configuration=Configuration.hydrate(views.configuration),
-        )
-
-        # Patch up filtered views
-        for filtered_view in result.filtered_views:
-            filtered_view.view = result[filtered_view.base_view_key]
-
-        return result
+        else:
+            view = FilteredView.hydrate(view_io)
+            view.view = self[view.base_view_key]
+            return view
+        self._hydrate_view(view, model=model)
+        return view
+
+    def _hydrate_pending_view(self, key: str) -> None:
+        """Hydrate a view that was loaded lazily and register it."""
+        _, hydrate = self._pending_views.pop(key)
+        self._add_view(hydrate())
+
+    def _hydrate_pending_views(self, klass: Type[AbstractView] = AbstractView) -> None:
+        """Hydrate all views of the given type that were loaded lazily."""
+        for key, (view_type, _) in list(self._pending_views.items()):
+            # Filtered views may already have hydrated the view they refer to.
+            if key in self._pending_views and issubclass(view_type, klass):
+                self._hydrate_pending_view(key)
 
     @classmethod
     def _hydrate_view(cls, view: View, model: "Model") -> None:
@@ -229,8 +336,38 @@ class ViewSet(ModelRefMixin, AbstractBase):
                 relationship_view.id
             )
 
-    def _add_view(self, view: View) -> None:
+    def _add_view(self, view: AbstractView) -> None:
         self._views[view.key] = view
+        for klass, views in self._typed_views.items():
+            if isinstance(view, klass):
+                views[view.key] = view
+        scope_id = self._get_scope_id(view)
+        if scope_id:
+            self._scoped_views.setdefault(scope_id, {})[view.key] = view
+        view.set_viewset(self)
+        if isinstance(view, View):
+            for element_view in view.element_views:
+                self._add_element_view(view, element_view.id)
+
+    def _add_element_view(self, view: View, element_id: str) -> None:
+        """Record that a view contains an element."""
+        self._element_views.setdefault(element_id, {})[view.key] = view
+
+    def _remove_element_view(self, view: View, element_id: str) -> None:
+        """Record that a view no longer contains an element."""
+        views = self._element_views.get(element_id, {})
+        views.pop(view.key, None)
+        if not views:
+            self._element_views.pop(element_id, None)
+
+    @staticmethod
+    def _get_scope_id(view: AbstractView) -> Optional[str]:
+        """Return the ID of the software system or container in scope of a view."""
+        if isinstance(view, ComponentView):
+            return view.container_id
+        if isinstance(view, DynamicView):
+            return view.element_id
+        return getattr(view, "software_system_id", None)
 
     def create_system_landscape_view(
         self, system_landscape_view: Optional[SystemLandscapeView] = None, **kwargs
@@ -355,12 +492,55 @@ class ViewSet(ModelRefMixin, AbstractBase):
         self._add_view(filtered_view)
         return filtered_view
 
+    def get_scoped_views(
+        self, element: "Element", view_type: Optional[Type[T]] = None
+    ) -> List[T]:
+        """
+        Return the views whose scope is the given software system or container.
+
+        The scope of system context, container and deployment views is their software
+        system, that of component views their container, and that of dynamic views
+        their element.
+
+        Args:
+            element (Element): The software system or container in scope.
+            view_type (type, optional): Only return views of this type, for example,
+                `ContainerView`.
+
+        Returns:
+            list: The views in the order in which they were added.
+
+        """
+        self._hydrate_pending_views()
+        views = self._scoped_views.get(element.id, {}).values()
+        if view_type is None:
+            return list(views)
+        return [view for view in views if isinstance(view, view_type)]
+
+    def get_views_with_element(self, element: "Element") -> List[View]:
+        """
+        Return the views that contain the given element.
+
+        Args:
+            element (Element): The model element.
+
+        Returns:
+            list: The views in the order in which they first showed the element.
+
+        """
+        self._hydrate_pending_views()
+        return list(self._element_views.get(element.id, {}).values())
+
     def get_view(self, key: str) -> Optional[AbstractView]:
         """Return the view with the given key, or None."""
+        if key in self._pending_views:
+            self._hydrate_pending_view(key)
         return self._views.get(key)
 
     def __getitem__(self, key: str) -> AbstractView:
         """Return the view with the given key or raise a KeyError."""
+        if key in self._pending_views:
+            self._hydrate_pending_view(key)
         return self._views[key]
 
     def copy_layout_information_from(self, source: "ViewSet") -> None:
@@ -378,8 +558,10 @@ class ViewSet(ModelRefMixin, AbstractBase):
     def _ensure_key_is_specific_and_unique(self, key: str) -> None:
         if key is None or key == "":
             raise ValueError("A key must be specified.")
-        if key in self._views:
+        if key in self._views or key in self._pending_views:
             raise ValueError(f"View already exists in workspace with key '{key}'.")
 
-    def _get_typed_views(self, klass: T) -> Iterable[T]:
-        return (view for view in self._views.values() if isinstance(view, klass))
+    def _get_typed_views(self, klass: Type[T]) -> Iterable[T]:
+        if self._pending_views:
+            self._hydrate_pending_views(klass)
+        return list(self._typed_views[klass].values())
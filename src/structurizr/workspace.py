@@ -19,20 +19,92 @@
 import gzip
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from pydantic import Field
 from pydantic.types import StrBytes
 
 from .abstract_base import AbstractBase
 from .base_model import BaseModel
-from .model import Model, ModelIO
+from .json_backend import loads as json_loads
+from .model import (
+    Enterprise,
+    EnterpriseIO,
+    Model,
+    ModelIO,
+    Person,
+    PersonIO,
+    SoftwareSystem,
+    SoftwareSystemIO,
+)
+from .model.deployment_node import DeploymentNode, DeploymentNodeIO
 from .view import ViewSet, ViewSetIO
 
 
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
+
+
 __all__ = ("WorkspaceIO", "Workspace")
 
 
+T = TypeVar("T")
+
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
+# Prefixes (in `ijson` notation) of the model parts that are hydrated one by one when
+# streaming a workspace.
+ENTERPRISE_PREFIX = "model.enterprise"
+PERSON_PREFIX = "model.people.item"
+SOFTWARE_SYSTEM_PREFIX = "model.softwareSystems.item"
+DEPLOYMENT_NODE_PREFIX = "model.deploymentNodes.item"
+
+# Options of `pydantic.BaseModel.json` that are not supported by
+# `BaseModel.json_from_orm`.
+PYDANTIC_JSON_OPTIONS = frozenset(
+    (
+        "include",
+        "exclude",
+        "by_alias",
+        "skip_defaults",
+        "exclude_unset",
+        "exclude_defaults",
+        "exclude_none",
+        "encoder",
+        "models_as_dict",
+    )
+)
+
+
+class _LazySection(Generic[T]):
+    """Load a section of a workspace once, on first access."""
+
+    def __init__(self, load: Callable[[], T]) -> None:
+        """Initialize a lazy section from a function that loads it."""
+        self._load = load
+        self._value: Optional[T] = None
+
+    def __call__(self) -> T:
+        """Return the section, loading it and releasing its source if necessary."""
+        if self._load is not None:
+            self._value = self._load()
+            self._load = None
+        return self._value
+
+
 class WorkspaceIO(BaseModel):
     """
     Represent a Structurizr workspace.
@@ -180,6 +252,8 @@ class Workspace(AbstractBase):
 
         """
         super().__init__(**kwargs)
+        # Sections of a lazily loaded workspace that have not been accessed yet.
+        self._sections: Dict[str, _LazySection] = {}
         self.id = id
         self.name = name
         self.description = description
@@ -194,25 +268,171 @@ class Workspace(AbstractBase):
         self.documentation = documentation
         self.configuration = configuration
 
+    @property
+    def model(self) -> Model:
+        """Return the software architecture model, loading it on first access."""
+        if "model" in self._sections:
+            # Keep the section until it loads, such that errors are raised again.
+            self._model = self._sections["model"]()
+            del self._sections["model"]
+        return self._model
+
+    @model.setter
+    def model(self, model: Model) -> None:
+        """Set the software architecture model."""
+        self._sections.pop("model", None)
+        self._model = model
+
+    @property
+    def views(self) -> ViewSet:
+        """Return the set of views, loading it on first access."""
+        if "views" in self._sections:
+            # Keep the section until it loads, such that errors are raised again.
+            self._views = self._sections["views"]()
+            del self._sections["views"]
+        return self._views
+
+    @views.setter
+    def views(self, views: ViewSet) -> None:
+        """Set the set of views."""
+        self._sections.pop("views", None)
+        self._views = views
+
     @classmethod
-    def load(cls, filename: Union[str, Path]) -> "Workspace":
-        """Load a workspace from a JSON file (which may optionally be gzipped)."""
+    def load(
+        cls,
+        filename: Union[str, Path],
+        *,
+        stream: bool = False,
+        validate: bool = True,
+        lazy: bool = False,
+    ) -> "Workspace":
+        """
+        Load a workspace from a JSON file (which may optionally be gzipped).
+
+        Args:
+            filename: filename to read from.
+            stream: if `True` then parse the file incrementally and hydrate the model
+                element by element as it is read, rather than reading the whole
+                document into memory first. This keeps the peak memory usage low for
+                very large workspaces and requires the optional `ijson` package.
+            validate: if `False` then skip validation of trusted input, see
+                `Workspace.loads`.
+            lazy: if `True` then defer hydration until first access, see
+                `Workspace.loads`.
+        """
         filename = Path(filename)
+        if stream:
+            with filename.open("rb") as handle:
+                is_gzipped = handle.read(2) == GZIP_MAGIC_NUMBER
+            with gzip.open(filename) if is_gzipped else filename.open("rb") as handle:
+                return cls._load_stream(handle, validate=validate, lazy=lazy)
         try:
-            with gzip.open(filename, "rt") as handle:
-                return cls.loads(handle.read())
+            with gzip.open(filename) as handle:
+                return cls.loads(handle.read(), validate=validate, lazy=lazy)
         except FileNotFoundError as error:
             raise error
         except OSError:
-            with filename.open() as handle:
-                return cls.loads(handle.read())
+            with filename.open("rb") as handle:
+                return cls.loads(handle.read(), validate=validate, lazy=lazy)
 
     @classmethod
-    def loads(cls, json: StrBytes) -> "Workspace":
-        """Load a workspace from a JSON string or bytes."""
-        ws_io = WorkspaceIO.parse_raw(json)
+    def _load_stream(
+        cls, handle: BinaryIO, *, validate: bool, lazy: bool
+    ) -> "Workspace":
+        """Load a workspace by incrementally parsing a binary JSON file handle."""
+        if ijson is None:
+            raise ImportError(
+                "Streaming a workspace requires the optional dependency 'ijson'. "
+                "Please install it, for example, with "
+                "`pip install structurizr-python[streaming]`."
+            )
+
+        model = Model()
+        # Deployment nodes refer to containers and software systems, which may not
+        # all have been seen yet, so they are hydrated at the end of the model.
+        deployment_node_ios = []
+        attributes = {}
+        for prefix, obj in _iter_workspace_sections(handle):
+            if prefix == ENTERPRISE_PREFIX:
+                enterprise_io = EnterpriseIO.load_obj(obj, validate=validate)
+                model.enterprise = Enterprise.hydrate(enterprise_io)
+            elif prefix == PERSON_PREFIX:
+                model += Person.hydrate(PersonIO.load_obj(obj, validate=validate))
+            elif prefix == SOFTWARE_SYSTEM_PREFIX:
+                software_system_io = SoftwareSystemIO.load_obj(obj, validate=validate)
+                model += SoftwareSystem.hydrate(software_system_io)
+            elif prefix == DEPLOYMENT_NODE_PREFIX:
+                deployment_node_ios.append(
+                    DeploymentNodeIO.load_obj(obj, validate=validate)
+                )
+            else:
+                attributes[prefix] = obj
+        for deployment_node_io in deployment_node_ios:
+            model += DeploymentNode.hydrate(deployment_node_io, model=model)
+        model._hydrate_relationships()
+
+        workspace_io = WorkspaceIO.load_obj(attributes, validate=validate)
+        return cls(
+            **cls.hydrate_arguments(workspace_io),
+            model=model,
+            views=ViewSet.hydrate(views=workspace_io.views, model=model, lazy=lazy)
+            if workspace_io.views is not None
+            else None,
+        )
+
+    @classmethod
+    def loads(
+        cls, json: StrBytes, *, validate: bool = True, lazy: bool = False
+    ) -> "Workspace":
+        """
+        Load a workspace from a JSON string or bytes.
+
+        Args:
+            json: the JSON document.
+            validate: if `False` then the document is trusted to be valid, for example,
+                because it was written by `Workspace.dump`, and is hydrated without
+                any pydantic validation. This is considerably faster for large
+                workspaces but invalid input may lead to obscure errors.
+            lazy: if `True` then the model and each view are only parsed and
+                hydrated when they are first accessed. This is much faster for tools
+                that only read a part of a large workspace, for example, only the
+                model or only the view configuration. Validation errors in those
+                parts are also only raised on first access.
+        """
+        if lazy:
+            return cls._load_lazily(json_loads(json), validate=validate)
+        if validate:
+            ws_io = WorkspaceIO.parse_raw(json)
+        else:
+            ws_io = WorkspaceIO.parse_obj_trusted(json_loads(json))
         return cls.hydrate(ws_io)
 
+    @classmethod
+    def _load_lazily(cls, obj: Dict[str, Any], *, validate: bool) -> "Workspace":
+        """Load a workspace whose sections are parsed and hydrated on first access."""
+        model_obj = obj.pop("model", None)
+        views_obj = obj.pop("views", None)
+        workspace = cls(
+            **cls.hydrate_arguments(WorkspaceIO.load_obj(obj, validate=validate))
+        )
+        if model_obj is None:
+            workspace._sections["model"] = _LazySection(Model)
+        else:
+            workspace._sections["model"] = _LazySection(
+                lambda: Model.hydrate(ModelIO.load_obj(model_obj, validate=validate))
+            )
+        # The views refer to the model of the workspace when they are hydrated, which
+        # may have been replaced in the meantime.
+        model = _LazySection(lambda: workspace.model)
+        if views_obj is None:
+            workspace._sections["views"] = _LazySection(lambda: ViewSet(model=model()))
+        else:
+            workspace._sections["views"] = _LazySection(
+                lambda: ViewSet.load_lazily(views_obj, model, validate=validate)
+            )
+        return workspace
+
     def dump(
         self,
         filename: Union[str, Path],
@@ -226,6 +446,9 @@ class Workspace(AbstractBase):
 
         By default, filenames ending with `.gz` will be zipped and anything else won't,
         however this can be overridden by explicitly passing the `zip` argument.
+        The file is written by the fastest installed JSON library, unless another one
+        is chosen with `structurizr.json_backend.set_json_backend`, so its formatting
+        may differ from `dumps`.
 
         Arguments:
             filename: filename to write to.
@@ -236,8 +459,12 @@ class Workspace(AbstractBase):
         filename = Path(filename)
         if zip is None:
             zip = str(filename).endswith(".gz")
-        with gzip.open(filename, "wt") if zip else filename.open("wt") as handle:
-            handle.write(self.dumps(indent=indent, **kwargs))
+        if PYDANTIC_JSON_OPTIONS.isdisjoint(kwargs):
+            content = WorkspaceIO.json_bytes_from_orm(self, indent=indent, **kwargs)
+        else:
+            content = self.dumps(indent=indent, **kwargs).encode("utf-8")
+        with gzip.open(filename, "wb") if zip else filename.open("wb") as handle:
+            handle.write(content)
 
     def dumps(self, indent: Optional[int] = None, **kwargs):
         """
@@ -246,26 +473,72 @@ class Workspace(AbstractBase):
         Args:
             indent (int): if specified then pretty-print the JSON with given indent.
             kwargs: other arguments to pass through to `json.dumps()`.
+
+        The string is written by the standard library, unless another JSON library
+        is chosen with `structurizr.json_backend.set_json_backend`.
         """
+        if PYDANTIC_JSON_OPTIONS.isdisjoint(kwargs):
+            return WorkspaceIO.json_from_orm(self, indent=indent, **kwargs)
         return WorkspaceIO.from_orm(self).json(indent=indent, **kwargs)
 
     @classmethod
-    def hydrate(cls, workspace_io: WorkspaceIO) -> "Workspace":
+    def hydrate(cls, workspace_io: WorkspaceIO, *, lazy: bool = False) -> "Workspace":
         """Create a new instance of Workspace from its IO."""
         model = Model.hydrate(workspace_io.model)
-        views = ViewSet.hydrate(views=workspace_io.views, model=model)
+        views = ViewSet.hydrate(views=workspace_io.views, model=model, lazy=lazy)
 
         return cls(
-            id=workspace_io.id,
-            name=workspace_io.name,
-            description=workspace_io.description,
-            version=workspace_io.version,
-            revision=workspace_io.revision,
-            thumbnail=workspace_io.thumbnail,
-            last_modified_date=workspace_io.last_modified_date,
-            last_modified_user=workspace_io.last_modified_user,
-            last_modified_agent=workspace_io.last_modified_agent,
+            **cls.hydrate_arguments(workspace_io),
             model=model,
             views=views,
-            # documentation=Documentation.hydrate(workspace_io.documentation),
         )
+
+    @classmethod
+    def hydrate_arguments(cls, workspace_io: WorkspaceIO) -> Dict[str, Any]:
+        """Hydrate a WorkspaceIO into the constructor arguments other than sections."""
+        return {
+            "id": workspace_io.id,
+            "name": workspace_io.name,
+            "description": workspace_io.description,
+            "version": workspace_io.version,
+            "revision": workspace_io.revision,
+            "thumbnail": workspace_io.thumbnail,
+            "last_modified_date": workspace_io.last_modified_date,
+            "last_modified_user": workspace_io.last_modified_user,
+            "last_modified_agent": workspace_io.last_modified_agent,
+            # "documentation": Documentation.hydrate(workspace_io.documentation),
+        }
+
+
+def _iter_workspace_sections(handle: BinaryIO) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally parse a workspace JSON document.
+
+    Yield pairs of `ijson` prefix and parsed object for every top-level member of the
+    workspace except the model. The model itself is never built as a whole, instead
+    its enterprise and each of its people, software systems and deployment nodes are
+    yielded separately.
+    """
+    model_prefixes = {
+        ENTERPRISE_PREFIX,
+        PERSON_PREFIX,
+        SOFTWARE_SYSTEM_PREFIX,
+        DEPLOYMENT_NODE_PREFIX,
+    }
+    events = ijson.parse(handle, use_float=True)
+    for prefix, event, value in events:
+        if event == "map_key":
+            continue
+        is_top_level = prefix not in ("", "model") and "." not in prefix
+        if not (is_top_level or prefix in model_prefixes):
+            continue
+        if event in ("start_map", "start_array"):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            for inner_prefix, inner_event, inner_value in events:
+                builder.event(inner_event, inner_value)
+                if inner_prefix == prefix and inner_event in ("end_map", "end_array"):
+                    break
+            yield prefix, builder.value
+        else:
+            yield prefix, value
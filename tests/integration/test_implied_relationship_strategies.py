@@ -154,3 +154,70 @@ def test_cloning_to_implied_relationship_copies_attributes_across():
     assert new_rel.technology == "tech1"
     assert new_rel.tags == rel.tags
     assert new_rel.properties == rel.properties
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        create_unless_any_exist,
+        create_unless_same_exists,
+    ],
+)
+def test_implied_relationships_from_people(strategy, capsys):
+    """Ensure people, which have no parent, can be the source of relationships."""
+    model = Model(implied_relationship_strategy=strategy)
+    person = model.add_person(name="person")
+    system = model.add_software_system(name="system")
+    container = system.add_container(name="container", description="test")
+
+    person.uses(container, "Uses")
+
+    assert {r.destination for r in person.get_relationships()} == {container, system}
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        create_unless_any_exist,
+        create_unless_same_exists,
+    ],
+)
+def test_create_implied_relationships_in_batch(strategy):
+    """Ensure applying a strategy to the whole model implies the same relationships."""
+
+    def build(create_implied_relationships: bool) -> Model:
+        model = Model(implied_relationship_strategy=strategy)
+        system1 = model.add_software_system(name="system1")
+        container1 = system1.add_container(name="container1", description="test")
+        component1 = container1.add_component(name="component1", description="test")
+        system2 = model.add_software_system(name="system2")
+        container2 = system2.add_container(name="container2", description="test")
+        system3 = model.add_software_system(name="system3")
+        component1.uses(
+            container2,
+            "Uses",
+            create_implied_relationships=create_implied_relationships,
+        )
+        container1.uses(
+            system3,
+            "Reads from",
+            create_implied_relationships=create_implied_relationships,
+        )
+        return model
+
+    def summary(model: Model):
+        return sorted(
+            (r.source.name, r.destination.name, r.description)
+            for r in model.get_relationships()
+        )
+
+    expected = build(create_implied_relationships=True)
+    actual = build(create_implied_relationships=False)
+    assert len(actual.get_relationships()) == 2
+
+    actual.create_implied_relationships()
+    assert summary(actual) == summary(expected)
+    # Applying the strategy again finds all implied relationships present.
+    actual.create_implied_relationships()
+    assert summary(actual) == summary(expected)
@@ -19,7 +19,7 @@
 import pytest
 
 from structurizr.model import Person, SoftwareSystem
-from structurizr.model.model import Model
+from structurizr.model.model import Model, ModelIO
 
 
 @pytest.fixture(scope="function")
@@ -80,3 +80,37 @@ def test_add_software_system(attributes: dict, model: Model):
     assert len(model.software_systems) == 1
     for attr, expected in attributes.items():
         assert getattr(software_system, attr) == expected
+
+
+def test_element_instances(model: Model):
+    """Expect that instances of an element are found across environments."""
+    system = model.add_software_system(name="System")
+    container = system.add_container(name="Container")
+    live = model.add_deployment_node(name="Node", environment="Live")
+    test = model.add_deployment_node(name="Node", environment="Test")
+    instance1 = live.add_container(container)
+    instance2 = live.add_container(container)
+    instance3 = test.add_container(container)
+    system_instance = test.add_software_system(system)
+
+    assert container.instances == [instance1, instance2, instance3]
+    assert system.instances == [system_instance]
+    assert model.get_element_instances(container, "Test") == [instance3]
+    assert model.get_element_instances(container, "Other") == []
+    assert [i.instance_id for i in container.instances] == [1, 2, 1]
+
+
+def test_element_instances_after_hydration(model: Model):
+    """Expect that hydrated instances are indexed and numbered on from their IDs."""
+    system = model.add_software_system(name="System")
+    container = system.add_container(name="Container")
+    node = model.add_deployment_node(name="Node")
+    node.add_container(container)
+    node.add_container(container)
+
+    new_model = Model.hydrate(ModelIO.from_orm(model))
+    new_container = new_model.get_element(container.id)
+    new_node = next(iter(new_model.deployment_nodes))
+
+    assert len(new_container.instances) == 2
+    assert new_node.add_container(new_container).instance_id == 3
@@ -143,3 +143,74 @@ def test_not_replicating_doesnt_add_relationships(empty_model: Model):
     assert container_instance1.relationships == set()
     assert container_instance2.relationships == set()
     assert container_instance3.relationships == set()
+
+
+def _replicated(model: Model, environment: str) -> set:
+    """Summarize the replicated relationships between instances in an environment."""
+    return {
+        (
+            r.source.element.name,
+            r.source.instance_id,
+            r.destination.element.name,
+            r.destination.instance_id,
+            r.linked_relationship_id,
+        )
+        for r in model.get_relationships()
+        if r.linked_relationship_id and r.source.environment == environment
+    }
+
+
+def _build_deployment(batch: bool) -> Model:
+    """Build a model with two deployment environments of repeated instances."""
+    model = Model()
+    system = model.add_software_system("System")
+    web = system.add_container("Web")
+    api = system.add_container("API")
+    database = system.add_container("Database")
+    web.uses(api, "Calls")
+    api.uses(database, "Reads")
+    api.uses(api, "Calls itself")
+    database.uses(web, "Notifies")
+
+    node = model.add_deployment_node("Node", environment="Live")
+    for container in (web, api, api, database, database, web):
+        node.add_container(container, replicate_relationships=not batch)
+    other = model.add_deployment_node("Other", environment="Test")
+    other.add_container(web, replicate_relationships=not batch)
+    other.add_container(api, replicate_relationships=not batch)
+    if batch:
+        model.replicate_element_relationships("Live")
+        model.replicate_element_relationships("Test")
+    return model
+
+
+def test_batch_replication_matches_incremental():
+    """Expect replicating a whole environment at once to equal doing it per instance."""
+    incremental = _build_deployment(batch=False)
+    batch = _build_deployment(batch=True)
+
+    # Every instance is linked to every instance of the related element, including
+    # the two API instances to each other and to themselves.
+    assert len(_replicated(incremental, "Live")) == 4 + 4 + 4 + 4
+    assert len(_replicated(incremental, "Test")) == 1 + 1
+    for environment in ("Live", "Test"):
+        assert _replicated(batch, environment) == _replicated(incremental, environment)
+
+
+def test_batch_replication_does_not_duplicate(empty_model: Model):
+    """Expect that replicating an environment again adds no relationships."""
+    model = empty_model
+    system = model.add_software_system("System")
+    web = system.add_container("Web")
+    api = system.add_container("API")
+    web.uses(api, "Calls")
+    node = model.add_deployment_node("Node")
+    web_instance = node.add_container(web)
+    api_instance = node.add_container(api)
+    count = len(model.get_relationships())
+
+    model.replicate_element_relationships()
+
+    assert len(model.get_relationships()) == count
+    assert len(web_instance.relationships) == 1
+    assert next(iter(web_instance.relationships)).destination is api_instance
@@ -0,0 +1,52 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure that workspace fingerprints are stable between processes."""
+
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+DEFINITIONS = Path(__file__).parent / "data" / "workspace_definition"
+
+SCRIPT = """
+import sys
+
+from structurizr import Workspace
+from structurizr.api.base_structurizr_client import BaseStructurizrClient
+
+workspace = Workspace.load(sys.argv[1])
+print(BaseStructurizrClient._workspace_fingerprint(workspace))
+"""
+
+
+@pytest.mark.parametrize("filename", ["FinancialRiskSystem.json", "BigBank.json"])
+def test_fingerprint_is_stable_between_processes(filename):
+    """Expect the same fingerprint although sets are iterated in another order."""
+    fingerprints = set()
+    for seed in range(1, 4):
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT, str(DEFINITIONS / filename)],
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            check=True,
+            stdout=subprocess.PIPE,
+        )
+        fingerprints.add(result.stdout)
+    assert len(fingerprints) == 1
@@ -23,7 +23,8 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from structurizr import Workspace, WorkspaceIO
+from structurizr import Workspace, WorkspaceIO, json_backend
+from structurizr.json_backend import StandardJSONBackend
 
 
 DEFINITIONS = Path(__file__).parent / "data" / "workspace_definition"
@@ -164,3 +165,116 @@ def test_load_unknown_file_raises_file_not_found():
     """Test that attempting to load a non-existent file raises FileNotFound."""
     with pytest.raises(FileNotFoundError):
         Workspace.load("foobar.json")
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["Trivial.json", "GettingStarted.json", "FinancialRiskSystem.json", "BigBank.json"],
+)
+@pytest.mark.parametrize("zip", [False, True])
+def test_stream_workspace(filename, zip, tmp_path: Path):
+    """Expect that streaming a workspace yields the same as loading it at once."""
+    pytest.importorskip("ijson")
+    expected = Workspace.load(DEFINITIONS / filename)
+    filepath = tmp_path / filename
+    expected.dump(filepath, zip=zip)
+
+    actual = Workspace.load(filepath, stream=True)
+
+    assert _normalize(json.loads(actual.dumps())) == _normalize(
+        json.loads(expected.dumps())
+    )
+
+
+def _normalize(obj):
+    """Sort all lists in a JSON object, since many collections are unordered sets."""
+    if isinstance(obj, dict):
+        return {key: _normalize(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return sorted(
+            (_normalize(value) for value in obj),
+            key=lambda value: json.dumps(value, sort_keys=True),
+        )
+    return obj
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["Trivial.json", "GettingStarted.json", "FinancialRiskSystem.json", "BigBank.json"],
+)
+def test_load_trusted_workspace(filename):
+    """Expect that skipping validation yields the same as validating a workspace."""
+    path = DEFINITIONS / filename
+    expected = WorkspaceIO.from_orm(Workspace.load(path))
+    actual = WorkspaceIO.from_orm(Workspace.load(path, validate=False))
+    assert _normalize(json.loads(actual.json())) == _normalize(
+        json.loads(expected.json())
+    )
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["Trivial.json", "GettingStarted.json", "FinancialRiskSystem.json", "BigBank.json"],
+)
+def test_dumps_matches_from_orm(filename, monkeypatch):
+    """Expect direct serialization to be identical to that via `WorkspaceIO`."""
+    monkeypatch.setattr(json_backend, "_json_backend", StandardJSONBackend())
+    workspace = Workspace.load(DEFINITIONS / filename)
+    assert workspace.dumps(indent=2) == WorkspaceIO.from_orm(workspace).json(indent=2)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["Trivial.json", "GettingStarted.json", "FinancialRiskSystem.json", "BigBank.json"],
+)
+def test_load_lazy_workspace(filename):
+    """Expect that lazily hydrating views yields the same as hydrating eagerly."""
+    path = DEFINITIONS / filename
+    expected = Workspace.load(path)
+    actual = Workspace.load(path, lazy=True)
+    assert _normalize(json.loads(actual.dumps())) == _normalize(
+        json.loads(expected.dumps())
+    )
+
+
+def test_lazy_workspace_sections():
+    """Expect that the sections of a lazy workspace are loaded on first access."""
+    path = DEFINITIONS / "BigBank.json"
+    workspace = Workspace.load(path, lazy=True)
+    assert set(workspace._sections) == {"model", "views"}
+
+    styles = workspace.views.configuration.styles
+    assert len(styles.elements) > 0
+    assert set(workspace._sections) == {"model"}
+    assert len(workspace.views._pending_views) > 0
+
+    view = workspace.views["SystemContext"]
+    assert view.software_system.model is workspace.model
+    assert workspace.model.get_element(view.software_system.id) is view.software_system
+
+
+def test_lazy_workspace_views_use_replaced_model():
+    """Expect that lazy views refer to the model assigned before their loading."""
+    path = DEFINITIONS / "BigBank.json"
+    workspace = Workspace.load(path, lazy=True)
+    model = Workspace.load(path).model
+    workspace.model = model
+
+    view = workspace.views["SystemContext"]
+    assert view.software_system.model is model
+    assert model.get_element(view.software_system.id) is view.software_system
+
+
+def test_lazy_workspace_validates_on_access():
+    """Expect that a lazy workspace reports invalid sections on first access."""
+    obj = json.loads((DEFINITIONS / "GettingStarted.json").read_text())
+    obj["model"]["people"][0]["location"] = "Nowhere"
+    workspace = Workspace.loads(json.dumps(obj), lazy=True)
+    assert workspace.name == obj["name"]
+    with pytest.raises(ValidationError):
+        workspace.model
+    # An invalid section must not look like an empty one afterwards.
+    with pytest.raises(ValidationError):
+        workspace.model
+    with pytest.raises(ValidationError):
+        workspace.views["SystemContext"]
@@ -0,0 +1,53 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide fixtures shared by the tests of the Structurizr clients."""
+
+
+from collections import namedtuple
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+
+MockSettings = namedtuple(
+    "MockSettings",
+    "url workspace_id api_key api_secret user agent workspace_archive_location",
+)
+
+
+@pytest.fixture(scope="module")
+def mock_settings() -> MockSettings:
+    """Provide standardized settings."""
+    return MockSettings(
+        url="https://api.structurizr.com",
+        workspace_id=19,
+        api_key="7f4e4edc-f61c-4ff2-97c9-ea4bc2a7c98c",
+        api_secret="ae140655-da7c-4a8d-9467-5a7d9792fca0",
+        user="astley@localhost",
+        agent="structurizr-python/1.0.0",
+        workspace_archive_location=Path("."),
+    )
+
+
+@pytest.fixture(scope="module")
+def make_settings(mock_settings: MockSettings) -> Callable[..., MockSettings]:
+    """Provide a factory of standardized settings that do not archive by default."""
+
+    def make_settings(**kwargs) -> MockSettings:
+        return mock_settings._replace(**{"workspace_archive_location": None, **kwargs})
+
+    return make_settings
@@ -0,0 +1,198 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behaviour of the asynchronous Structurizr client."""
+
+
+import asyncio
+from typing import List
+
+import pytest
+from httpx import Request, Response
+from pytest_mock import MockerFixture
+
+from structurizr.api.async_structurizr_client import (
+    AsyncStructurizrClient,
+    gather_limited,
+)
+from structurizr.api.structurizr_client import StructurizrClient
+from structurizr.api.structurizr_client_exception import StructurizrClientException
+from structurizr.workspace import Workspace
+
+
+@pytest.fixture(scope="module")
+def settings(make_settings):
+    """Provide standardized settings without archiving."""
+    return make_settings()
+
+
+@pytest.fixture(scope="function")
+def client(settings) -> AsyncStructurizrClient:
+    """Provide a client instance with the mock settings."""
+    return AsyncStructurizrClient(settings=settings)
+
+
+def run(coroutine):
+    """Run a coroutine to completion in a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def fake_send(requests: List[Request], content: bytes):
+    """Return a coroutine function recording requests and answering them."""
+
+    async def send(request: Request) -> Response:
+        requests.append(request)
+        return Response(200, content=content, request=request)
+
+    return send
+
+
+def test_repr(client):
+    """Expect the correct client string representation."""
+    assert (
+        repr(client)
+        == "AsyncStructurizrClient(url=https://api.structurizr.com, workspace_id=19)"
+    )
+
+
+def test_add_headers_match_synchronous_client(
+    client: AsyncStructurizrClient, settings, mocker: MockerFixture
+):
+    """Expect the same signature as the synchronous client."""
+    sync_client = StructurizrClient(settings=settings)
+    for instance in (client, sync_client):
+        mocker.patch.object(instance, "_number_once", return_value="1529225966174")
+    request = client._build_lock_request("PUT")
+    expected = sync_client._build_lock_request("PUT")
+    assert request.url == expected.url
+    assert request.headers["X-Authorization"] == expected.headers["X-Authorization"]
+
+
+def test_get_workspace(client: AsyncStructurizrClient, mocker: MockerFixture):
+    """Expect that a workspace is retrieved and loaded."""
+    requests: List[Request] = []
+    content = Workspace(name="Remote", description="", id=19).dumps().encode("utf-8")
+    mocker.patch.object(client._client, "send", new=fake_send(requests, content))
+    workspace = run(client.get_workspace())
+    assert workspace.name == "Remote"
+    assert requests[0].method == "GET"
+    assert requests[0].url.path == "/workspace/19"
+    assert "X-Authorization" in requests[0].headers
+
+
+def test_get_workspace_handles_error_responses(
+    client: AsyncStructurizrClient, mocker: MockerFixture
+):
+    """Test that response code other than 200 raise an exception."""
+
+    async def send(request: Request) -> Response:
+        return Response(403)
+
+    mocker.patch.object(client._client, "send", new=send)
+    with pytest.raises(
+        StructurizrClientException,
+        match="Failed .* workspace 19.\nResponse 403 - Forbidden",
+    ):
+        run(client.get_workspace())
+
+
+def test_put_workspace(client: AsyncStructurizrClient, mocker: MockerFixture):
+    """Expect that a workspace is merged with the remote one and uploaded."""
+    requests: List[Request] = []
+    content = Workspace(name="Remote", description="", id=19).dumps().encode("utf-8")
+    mocker.patch.object(client._client, "send", new=fake_send(requests, content))
+    run(client.put_workspace(Workspace(name="Local", description="", id=19)))
+    assert [request.method for request in requests] == ["GET", "PUT"]
+    assert b'"name":"Local"' in requests[1].read().replace(b" ", b"")
+    assert requests[1].headers["Content-Type"] == "application/json; charset=UTF-8"
+
+
+def test_locking_and_unlocking(client: AsyncStructurizrClient, mocker: MockerFixture):
+    """Ensure that using the lock context manager locks and unlocks."""
+    requests: List[Request] = []
+    content = b'{"success": true, "message": "OK"}'
+    mocker.patch.object(client._client, "send", new=fake_send(requests, content))
+
+    async def main():
+        async with client.lock() as locked_client:
+            assert locked_client is client
+
+    run(main())
+    assert [(request.method, request.url.path) for request in requests] == [
+        ("PUT", "/workspace/19/lock"),
+        ("DELETE", "/workspace/19/lock"),
+    ]
+
+
+def test_failed_lock_raises_exception(
+    client: AsyncStructurizrClient, mocker: MockerFixture
+):
+    """Check failing to lock raises an exception."""
+    requests: List[Request] = []
+    content = b'{"success": false, "message": "The workspace is already locked"}'
+    mocker.patch.object(client._client, "send", new=fake_send(requests, content))
+
+    async def main():
+        async with client.lock():
+            pass
+
+    with pytest.raises(StructurizrClientException, match="Failed to lock"):
+        run(main())
+
+
+def test_failed_lock_on_free_plan_doesnt_attempt_unlock(
+    client: AsyncStructurizrClient, mocker: MockerFixture
+):
+    """Check that if lock failed because on free plan then unlock isn't called."""
+    requests: List[Request] = []
+    content = b'{"success": false, "message": "Cannot lock on free plan"}'
+    mocker.patch.object(client._client, "send", new=fake_send(requests, content))
+
+    async def main():
+        assert await client.lock_workspace()
+        async with client.lock():
+            pass
+
+    run(main())
+    assert len(requests) == 2
+    assert all(request.method == "PUT" for request in requests)
+
+
+def test_gather_limited():
+    """Expect that no more than the limit of operations run at the same time."""
+    running = 0
+    most = 0
+
+    async def operation(index: int) -> int:
+        nonlocal running, most
+        running += 1
+        most = max(most, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return index
+
+    assert run(gather_limited((operation(i) for i in range(20)), limit=3)) == list(
+        range(20)
+    )
+    assert most == 3
+    assert run(gather_limited([operation(i) for i in range(5)], limit=None)) == list(
+        range(5)
+    )
+    with pytest.raises(ValueError):
+        run(gather_limited([], limit=0))
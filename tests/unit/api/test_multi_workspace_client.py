@@ -0,0 +1,170 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behaviour of the multi-workspace Structurizr client."""
+
+from pathlib import Path
+from typing import List
+
+import httpx
+import pytest
+from httpx import Request, Response
+from pytest_mock import MockerFixture
+
+from structurizr.api.multi_workspace_client import MultiWorkspaceClient
+from structurizr.api.structurizr_client import StructurizrClient
+from structurizr.api.workspace_cache import WorkspaceCache
+from structurizr.workspace import Workspace
+
+
+@pytest.fixture(scope="function")
+def clients() -> MultiWorkspaceClient:
+    """Provide a multi-workspace client."""
+    with MultiWorkspaceClient(max_connections=4) as clients:
+        yield clients
+
+
+def test_clients_share_connection_pool(clients: MultiWorkspaceClient, make_settings):
+    """Expect that the clients of all workspaces use the same HTTP client."""
+    first = clients.get_client(make_settings(workspace_id=1))
+    second = clients.get_client(make_settings(workspace_id=2))
+    assert first._client is clients._client
+    assert second._client is clients._client
+    first.close()
+    assert not clients._client.is_closed
+
+
+def test_pool_limits(clients: MultiWorkspaceClient):
+    """Expect that the limits are configured through the httpx API."""
+    limits = clients._limits(4, 2, 5.0)
+    assert limits.max_connections == 4
+    assert limits.max_keepalive_connections == 2
+
+
+def test_keepalive_expiry():
+    """Expect a custom keep-alive expiry to be applied or rejected, not ignored."""
+    try:
+        limits = MultiWorkspaceClient._limits(4, 2, 30.0)
+    except ValueError:
+        assert not hasattr(httpx.Limits(), "keepalive_expiry")
+    else:
+        assert limits.keepalive_expiry == 30.0
+
+
+def test_requests_use_absolute_urls(clients: MultiWorkspaceClient, make_settings):
+    """Expect that requests go to the host and path of each workspace."""
+    client = clients.get_client(
+        make_settings(workspace_id=3, url="http://on-prem:8080/api/")
+    )
+    request = client._build_lock_request("PUT")
+    assert request.url.host == "on-prem"
+    assert request.url.port == 8080
+    assert request.url.path == "/api/workspace/3/lock"
+    assert request.headers["User-Agent"] == "structurizr-python/1.0.0"
+
+
+def test_get_workspaces(
+    clients: MultiWorkspaceClient, make_settings, mocker: MockerFixture
+):
+    """Expect that many workspaces are retrieved in order."""
+    requests: List[Request] = []
+
+    def fake_send(request: Request):
+        requests.append(request)
+        workspace_id = int(Path(request.url.path).name)
+        workspace = Workspace(name=f"Remote {workspace_id}", description="")
+        return Response(200, content=workspace.dumps().encode("utf-8"))
+
+    mocker.patch.object(clients._client, "send", new=fake_send)
+    workspaces = clients.get_workspaces(make_settings(workspace_id=i) for i in (5, 3))
+    assert [workspace.name for workspace in workspaces] == ["Remote 5", "Remote 3"]
+    assert [request.url.path for request in requests] == [
+        "/workspace/5",
+        "/workspace/3",
+    ]
+
+
+@pytest.mark.parametrize("lock", [True, False])
+def test_put_workspaces(
+    clients: MultiWorkspaceClient, make_settings, mocker: MockerFixture, lock
+):
+    """Expect that many workspaces are updated, locking them if requested."""
+    requests: List[Request] = []
+
+    def fake_send(request: Request):
+        requests.append(request)
+        if request.method == "GET":
+            content = Workspace(name="Remote", description="").dumps()
+        else:
+            content = '{"success": true, "message": "OK"}'
+        return Response(200, content=content.encode("utf-8"), request=request)
+
+    mocker.patch.object(clients._client, "send", new=fake_send)
+    uploaded = clients.put_workspaces(
+        (
+            (
+                make_settings(workspace_id=i),
+                Workspace(name="Local", description="", id=i),
+            )
+            for i in (1, 2)
+        ),
+        lock=lock,
+    )
+    assert uploaded == 2
+    methods = ["PUT", "GET", "PUT", "DELETE"] if lock else ["GET", "PUT"]
+    assert [request.method for request in requests] == methods * 2
+    assert not clients._client.is_closed
+
+
+def test_put_unchanged_workspaces(tmp_path: Path, make_settings, mocker: MockerFixture):
+    """Expect that unchanged workspaces are neither locked nor uploaded."""
+    requests: List[Request] = []
+
+    def fake_send(request: Request):
+        requests.append(request)
+        if request.method == "GET":
+            content = Workspace(name="Remote", description="").dumps()
+        else:
+            content = '{"success": true, "message": "OK"}'
+        return Response(200, content=content.encode("utf-8"), request=request)
+
+    workspaces = [
+        (make_settings(workspace_id=i), Workspace(name="Local", description="", id=i))
+        for i in (1, 2)
+    ]
+    fingerprinted: List[int] = []
+    workspace_fingerprint = StructurizrClient._workspace_fingerprint
+
+    def fake_fingerprint(workspace: Workspace) -> str:
+        fingerprinted.append(workspace.id)
+        return workspace_fingerprint(workspace)
+
+    mocker.patch.object(
+        StructurizrClient, "_workspace_fingerprint", new=staticmethod(fake_fingerprint)
+    )
+    with MultiWorkspaceClient(cache=WorkspaceCache(tmp_path)) as clients:
+        mocker.patch.object(clients._client, "send", new=fake_send)
+        assert clients.put_workspaces(workspaces) == 2
+        requests.clear()
+        workspaces[1][1].name = "Changed"
+        assert clients.put_workspaces(workspaces) == 1
+    # Each workspace is fingerprinted once per call.
+    assert fingerprinted == [1, 2, 1, 2]
+    assert [request.url.path for request in requests] == [
+        "/workspace/2/lock",
+        "/workspace/2",
+        "/workspace/2",
+        "/workspace/2/lock",
+    ]
@@ -16,7 +16,7 @@
 """Ensure the expected behaviour of the Structurizr client."""
 
 
-from collections import namedtuple
+import gzip
 from datetime import datetime
 from gzip import GzipFile
 from pathlib import Path
@@ -32,26 +32,6 @@ from structurizr.api.structurizr_client_exception import StructurizrClientExcept
 from structurizr.workspace import Workspace
 
 
-MockSettings = namedtuple(
-    "MockSettings",
-    "url workspace_id api_key api_secret user agent workspace_archive_location",
-)
-
-
-@pytest.fixture(scope="module")
-def mock_settings():
-    """Provide standardized settings."""
-    return MockSettings(
-        url="https://api.structurizr.com",
-        workspace_id=19,
-        api_key="7f4e4edc-f61c-4ff2-97c9-ea4bc2a7c98c",
-        api_secret="ae140655-da7c-4a8d-9467-5a7d9792fca0",
-        user="astley@localhost",
-        agent="structurizr-python/1.0.0",
-        workspace_archive_location=Path("."),
-    )
-
-
 @pytest.fixture(scope="function")
 def client(mock_settings) -> StructurizrClient:
     """Provide a client instance with the mock settings."""
@@ -79,7 +59,13 @@ def test_repr(client):
 
 
 @pytest.mark.parametrize(
-    "content, expected", [("", "d41d8cd98f00b204e9800998ecf8427e")]
+    "content, expected",
+    [
+        ("", "d41d8cd98f00b204e9800998ecf8427e"),
+        (b"", "d41d8cd98f00b204e9800998ecf8427e"),
+        ("Hello", "8b1a9953c4611296a827abf8c47804d7"),
+        (b"Hello", "8b1a9953c4611296a827abf8c47804d7"),
+    ],
 )
 def test_md5(client, content, expected):
     """
@@ -111,24 +97,21 @@ def test_archive_workspace(client, mocker):
     )
     mocked_open = mocker.mock_open(mock=mocker.Mock(spec_set=GzipFile))
     mocker.patch("gzip.open", mocked_open)
-    client._archive_workspace('{"mock_key":"mock_value"}')
+    client._archive_workspace(b'{"mock_key":"mock_value"}')
     mocked_filename.assert_called_once()
-    mocked_open.assert_called_once_with(Path("structurizr-19-time.json.gz"), mode="wt")
+    mocked_open.assert_called_once_with(Path("structurizr-19-time.json.gz"), mode="wb")
     mocked_handle = mocked_open()
-    mocked_handle.write.assert_called_once_with('{"mock_key":"mock_value"}')
+    mocked_handle.write.assert_called_once_with(b'{"mock_key":"mock_value"}')
 
 
-def test_suppressing_archive(mock_settings, mocker):
+def test_suppressing_archive(make_settings, mocker):
     """Test that when the archive location is None then no archive is written."""
-    old_settings = mock_settings._asdict()
-    old_settings["workspace_archive_location"] = None
-    new_mock_settings = MockSettings(**old_settings)
-    client = StructurizrClient(settings=new_mock_settings)
+    client = StructurizrClient(settings=make_settings(workspace_archive_location=None))
 
     mocked_open = mocker.mock_open(mock=mocker.Mock(spec_set=GzipFile))
     mocker.patch("gzip.open", mocked_open)
 
-    client._archive_workspace('{"mock_key":"mock_value"}')
+    client._archive_workspace(b'{"mock_key":"mock_value"}')
     assert not mocked_open.called
 
 
@@ -189,6 +172,36 @@ def test_put_workspace_handles_error_responses(
         client.put_workspace(workspace)
 
 
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_put_compressed_workspace(mock_settings, mocker: MockerFixture, encoding: str):
+    """Expect that compressed uploads are signed with the hash of the sent body."""
+    if encoding == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        decompress = zstandard.ZstdDecompressor().decompress
+    else:
+        decompress = gzip.decompress
+    client = StructurizrClient(settings=mock_settings)
+    client.request_encoding = encoding
+    client.merge_from_remote = False
+    requests: List[Request] = []
+
+    def fake_send(request: Request):
+        requests.append(request)
+        return Response(
+            200, content=b'{"success": true, "message": "OK"}', request=request
+        )
+
+    mocker.patch.object(client._client, "send", new=fake_send)
+    workspace = Workspace(name="Workspace 1", description="", id=19)
+    client.put_workspace(workspace)
+    request = requests[0]
+    body = request.read()
+    assert request.headers["Content-Encoding"] == encoding
+    assert request.headers["Content-Length"] == str(len(body))
+    assert request.headers["Content-MD5"] == client._base64_str(client._md5(body))
+    assert Workspace.loads(decompress(body)).name == "Workspace 1"
+
+
 def test_locking_and_unlocking(client: StructurizrClient, mocker: MockerFixture):
     """Ensure that using the client in a with block locks and unlocks."""
     requests: List[Request] = []
@@ -177,3 +177,13 @@ def test_init_from_dotenv(dotenv, archive_location):
     assert settings.user == "astley@localhost"
     assert settings.agent == "structurizr-python/1.0.0"
     assert str(settings.workspace_archive_location) == archive_location
+
+
+def test_request_encoding(mock_structurizr_env, monkeypatch):
+    """Expect that only supported request encodings are accepted."""
+    assert StructurizrClientSettings().request_encoding is None
+    monkeypatch.setenv("STRUCTURIZR_REQUEST_ENCODING", "gzip")
+    assert StructurizrClientSettings().request_encoding == "gzip"
+    monkeypatch.setenv("STRUCTURIZR_REQUEST_ENCODING", "brotli")
+    with pytest.raises(ValidationError, match="Unknown request encoding 'brotli'"):
+        StructurizrClientSettings()
@@ -0,0 +1,201 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behaviour of the workspace cache."""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+import pytest
+from httpx import Request, Response
+from pytest_mock import MockerFixture
+
+from structurizr import json_backend
+from structurizr.api.structurizr_client import StructurizrClient
+from structurizr.api.workspace_cache import WorkspaceCache
+from structurizr.json_backend import JSON_BACKENDS, set_json_backend
+from structurizr.workspace import Workspace
+
+
+def content(name: str) -> bytes:
+    """Return the JSON document of a workspace with the given name."""
+    return Workspace(name=name, description="").dumps().encode("utf-8")
+
+
+@pytest.fixture(scope="function")
+def cache(tmp_path: Path) -> WorkspaceCache:
+    """Provide an empty workspace cache."""
+    return WorkspaceCache(tmp_path / "cache")
+
+
+@pytest.fixture(scope="function")
+def client(cache: WorkspaceCache, make_settings) -> StructurizrClient:
+    """Provide a client with a workspace cache."""
+    client = StructurizrClient(settings=make_settings(), cache=cache)
+    yield client
+    client.close()
+
+
+def test_add_workspace(cache: WorkspaceCache):
+    """Expect that new content is a miss and identical content a hit."""
+    first = cache.add_workspace(1, content("First"), etag='"a"')
+    assert first.name == "First"
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache.get_validators(1) == {"If-None-Match": '"a"'}
+
+    assert cache.add_workspace(1, content("First")) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get_validators(1) == {}
+
+    second = cache.add_workspace(1, content("Second"))
+    assert second.name == "Second"
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(list(cache.directory.glob("workspace-1-*.json"))) == 1
+
+
+def test_get_workspace(cache: WorkspaceCache):
+    """Expect that cached workspaces are loaded from memory or from disk."""
+    assert cache.get_workspace(2) is None
+    workspace = cache.add_workspace(2, content("Cached"))
+    assert cache.get_workspace(2) is workspace
+
+    other = WorkspaceCache(cache.directory)
+    assert other.get_workspace(2).name == "Cached"
+    assert (other.hits, other.misses) == (1, 0)
+
+
+def test_evict_least_recently_used(cache: WorkspaceCache):
+    """Expect that the least recently used workspaces are evicted first."""
+    cache.add_workspace(1, content("First"))
+    cache.add_workspace(2, content("Second"))
+    # Pretend that the first workspace was used long ago.
+    for path in cache.directory.glob("workspace-1-*.json"):
+        os.utime(path, (0, 0))
+    cache.max_size = len(content("Second")) + len(content("Third"))
+    cache.add_workspace(3, content("Third"))
+    assert cache.get_workspace(1) is None
+    assert cache.get_workspace(2).name == "Second"
+    assert cache.get_workspace(3).name == "Third"
+
+
+def test_clear(cache: WorkspaceCache):
+    """Expect that clearing the cache removes all but the upload fingerprints."""
+    cache.add_workspace(1, content("First"), etag='"a"')
+    cache.set_fingerprint(1, "abc")
+    cache.clear()
+    assert [path.name for path in cache.directory.iterdir()] == [
+        "workspace-1.published.json"
+    ]
+    assert cache.get_workspace(1) is None
+    assert cache.get_validators(1) == {}
+    assert cache.get_fingerprint(1) == "abc"
+
+
+def test_conditional_get_workspace(client: StructurizrClient, mocker: MockerFixture):
+    """Expect that the client serves unmodified workspaces from its cache."""
+    requests: List[Request] = []
+
+    def fake_send(request: Request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(304, request=request)
+        return Response(
+            200,
+            content=content("Remote"),
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 18 Oct 2021 10:00:00 GMT"},
+            request=request,
+        )
+
+    mocker.patch.object(client._client, "send", new=fake_send)
+    first = client.get_workspace()
+    second = client.get_workspace()
+    assert second is first
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-Modified-Since"] == "Mon, 18 Oct 2021 10:00:00 GMT"
+    assert (client.cache.hits, client.cache.misses) == (1, 1)
+
+
+def test_fingerprint(cache: WorkspaceCache):
+    """Expect that the fingerprint of the last upload is stored per workspace."""
+    assert cache.get_fingerprint(4) is None
+    cache.set_fingerprint(4, "abc")
+    assert cache.get_fingerprint(4) == "abc"
+    assert cache.get_fingerprint(5) is None
+
+
+def test_workspace_fingerprint_ignores_volatile_fields():
+    """Expect that fingerprints depend on the content but not on volatile fields."""
+    workspace = Workspace(name="Local", description="", id=19)
+    system = workspace.model.add_software_system(name="System")
+    for i in range(5):
+        workspace.model.add_person(name=f"User {i}").uses(system, "Uses")
+    expected = StructurizrClient._workspace_fingerprint(workspace)
+
+    workspace.last_modified_date = datetime.now(timezone.utc)
+    workspace.last_modified_agent = "structurizr-python/1.0.0"
+    workspace.thumbnail = "data:image/png;base64,"
+    assert StructurizrClient._workspace_fingerprint(workspace) == expected
+
+    workspace.model.add_person(name="User 5")
+    assert StructurizrClient._workspace_fingerprint(workspace) != expected
+
+
+def test_workspace_fingerprint_keeps_style_order():
+    """Expect that the order of styles, unlike the order of elements, matters."""
+    workspace = Workspace(name="Local", description="", id=19)
+    workspace.views.configuration.styles.add_element_style(tag="Person")
+    workspace.views.configuration.styles.add_element_style(tag="Element")
+    expected = StructurizrClient._workspace_fingerprint(workspace)
+
+    workspace.views.configuration.styles.elements.reverse()
+    assert StructurizrClient._workspace_fingerprint(workspace) != expected
+
+
+@pytest.mark.parametrize(
+    "name", [name for name, cls in JSON_BACKENDS.items() if cls.available]
+)
+def test_workspace_fingerprint_ignores_json_backend(name: str, monkeypatch):
+    """Expect that fingerprints do not depend on the JSON backend in use."""
+    workspace = Workspace(name="Local", description="Ünïcödé", id=19)
+    workspace.model.add_software_system(name="System", description="1.0")
+    monkeypatch.setattr(json_backend, "_json_backend", None)
+    set_json_backend("json")
+    expected = StructurizrClient._workspace_fingerprint(workspace)
+    set_json_backend(name)
+    assert StructurizrClient._workspace_fingerprint(workspace) == expected
+
+
+def test_put_unchanged_workspace(client: StructurizrClient, mocker: MockerFixture):
+    """Expect that uploading an unchanged workspace is skipped unless forced."""
+    requests: List[Request] = []
+
+    def fake_send(request: Request):
+        requests.append(request)
+        if request.method == "GET":
+            return Response(200, content=content("Remote"), request=request)
+        return Response(
+            200, content=b'{"success": true, "message": "OK"}', request=request
+        )
+
+    mocker.patch.object(client._client, "send", new=fake_send)
+    workspace = Workspace(name="Local", description="", id=19)
+    assert client.put_workspace(workspace)
+    assert not client.put_workspace(workspace)
+    assert client.put_workspace(workspace, force=True)
+    workspace.name = "Changed"
+    assert client.put_workspace(workspace)
+    assert [request.method for request in requests] == ["GET", "PUT"] * 3
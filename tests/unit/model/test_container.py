@@ -106,6 +106,14 @@ def test_container_adding_component_with_same_name_fails(
         empty_container += Component(name="Component")
 
 
+def test_container_get_component_with_name(model_with_container: MockModel):
+    """Test getting components by name."""
+    empty_container = model_with_container.empty_container
+    component = empty_container.add_component(name="Component")
+    assert empty_container.get_component_with_name("Component") is component
+    assert empty_container.get_component_with_name("FooBar") is None
+
+
 def test_adding_component_with_existing_parent_fails(model_with_container: MockModel):
     """Check that adding a component with a different parent fails."""
     empty_container = model_with_container.empty_container
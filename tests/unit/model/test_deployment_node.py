@@ -30,6 +30,7 @@ class MockModel:
         self.empty_node = DeploymentNode(name="Empty", environment="Live")
         self.empty_node.set_model(self)
         self.mock_element = MockElement("element")
+        self._element_instances = {}
 
     def __iadd__(self, node):
         """Simulate the model assigning IDs to new elements."""
@@ -43,9 +44,13 @@ class MockModel:
         assert id == self.mock_element.id
         return self.mock_element
 
-    def get_elements(self):
-        """Simulate get_elements."""
-        return []
+    def get_efferent_relationships(self, element):
+        """Simulate get_efferent_relationships."""
+        return iter(())
+
+    def get_afferent_relationships(self, element):
+        """Simulate get_afferent_relationships."""
+        return iter(())
 
     def add_relationship(self, **kwargs):
         """Simulate adding relationships."""
@@ -139,6 +144,14 @@ def test_deployment_node_cant_have_two_children_with_the_same_name(model_with_no
         top_node.add_deployment_node(name="child")
 
 
+def test_deployment_node_get_deployment_node_with_name(model_with_node):
+    """Test getting child nodes by name."""
+    top_node = model_with_node.empty_node
+    child = top_node.add_deployment_node(name="child")
+    assert top_node.get_deployment_node_with_name("child") is child
+    assert top_node.get_deployment_node_with_name("other") is None
+
+
 def test_deployment_node_serialization_of_recursive_nodes(model_with_node):
     """Check that nodes within nodes are handled with (de)serialisation."""
     top_node = model_with_node.empty_node
@@ -170,6 +183,20 @@ def test_deployment_node_add_container(model_with_node):
     assert instance.instance_id == 1
 
 
+def test_deployment_node_numbers_instances_per_element(model_with_node):
+    """Expect instance IDs to be counted separately for every element."""
+    node = model_with_node.empty_node
+    container1 = MockElement("container1")
+    container2 = MockElement("container2")
+
+    ids = [
+        node.add_container(container, replicate_relationships=False).instance_id
+        for container in (container1, container2, container1, container1)
+    ]
+
+    assert ids == [1, 1, 2, 3]
+
+
 def test_deployment_node_add_with_iadd(model_with_node: MockModel):
     """Test adding things to a node using += rather than add_container."""
     node = model_with_node.empty_node
@@ -194,6 +221,7 @@ def test_deployment_node_add_with_iadd(model_with_node: MockModel):
 
     child_node += infra_node
     assert infra_node in child_node.infrastructure_nodes
+    assert infra_node.parent is child_node
     assert child_node.infrastructure_nodes[0] in child_node.child_elements
 
 
@@ -189,3 +189,102 @@ def test_model_automatically_adds_child_elements(empty_model: Model):
     assert not container.has_model
     empty_model += system
     assert container.has_model
+
+
+def test_model_indexes_relationships_by_source_and_destination(empty_model: Model):
+    """Check that the relationship adjacency is kept up to date."""
+    sys1 = empty_model.add_software_system(name="sys1")
+    sys2 = empty_model.add_software_system(name="sys2")
+    sys3 = empty_model.add_software_system(name="sys3")
+    rel1 = sys1.uses(sys2)
+    rel2 = sys3.uses(sys1)
+    rel3 = sys1.uses(sys3, "Also uses")
+
+    assert list(empty_model.get_efferent_relationships(sys1)) == [rel1, rel3]
+    assert list(empty_model.get_afferent_relationships(sys1)) == [rel2]
+    assert list(empty_model.get_efferent_relationships(sys2)) == []
+    assert list(empty_model.get_afferent_relationships(sys2)) == [rel1]
+    assert list(sys1.get_relationships()) == [rel1, rel3, rel2]
+
+
+def test_model_adjacency_lists_self_references_once(empty_model: Model):
+    """Ensure that a relationship to the element itself is only reported once."""
+    sys1 = empty_model.add_software_system(name="sys1")
+    relationship = sys1.uses(sys1)
+    assert list(sys1.get_relationships()) == [relationship]
+
+
+def test_model_partitions_top_level_elements_by_type(empty_model: Model):
+    """Ensure the typed properties only return elements of their own type."""
+    person = empty_model.add_person(name="Bob")
+    system = empty_model.add_software_system(name="Bob")
+    container = system.add_container(name="Container")
+    node = empty_model.add_deployment_node(name="Bob")
+    child = node.add_deployment_node(name="Child")
+    empty_model.add_deployment_node(name="Bob", environment="Dev")
+
+    assert empty_model.people == {person}
+    assert empty_model.software_systems == {system}
+    assert node in empty_model.deployment_nodes
+    assert len(empty_model.deployment_nodes) == 2
+    assert child not in empty_model.deployment_nodes
+    assert container not in empty_model.software_systems
+
+
+def test_model_contains_only_its_own_elements(empty_model: Model):
+    """Check membership is based on identity rather than on the ID alone."""
+    system = empty_model.add_software_system(name="System")
+    impostor = SoftwareSystem(name="Impostor", id=system.id)
+    assert system in empty_model
+    assert impostor not in empty_model
+    assert SoftwareSystem(name="Other") not in empty_model
+
+
+def test_model_indexes_relationships_by_both_ends(empty_model: Model):
+    """Ensure relationships are found by their source and destination together."""
+    sys1 = empty_model.add_software_system(name="sys1")
+    sys2 = empty_model.add_software_system(name="sys2")
+    rel1 = sys1.uses(sys2, "Reads")
+    rel2 = sys1.uses(sys2, "Writes")
+    sys2.uses(sys1, "Notifies")
+
+    assert list(empty_model.get_efferent_relationships_with(sys1, sys2)) == [
+        rel1,
+        rel2,
+    ]
+    assert list(empty_model.get_efferent_relationships_with(sys1, sys1)) == []
+
+
+def test_model_get_neighbours(empty_model: Model):
+    """Test finding typed neighbours in both directions and up to a given depth."""
+    user = empty_model.add_person(name="User")
+    sys1 = empty_model.add_software_system(name="sys1")
+    sys2 = empty_model.add_software_system(name="sys2")
+    sys3 = empty_model.add_software_system(name="sys3")
+    sys4 = empty_model.add_software_system(name="sys4")
+    sys5 = empty_model.add_software_system(name="sys5")
+    user.uses(sys1)
+    user.uses(sys5)
+    sys1.uses(sys2)
+    sys3.uses(sys2)
+    sys3.uses(sys4)
+
+    assert empty_model.get_neighbours(sys1) == [sys2, user]
+    assert empty_model.get_neighbours(sys1, SoftwareSystem) == [sys2]
+    assert empty_model.get_neighbours(sys1, (Person, SoftwareSystem)) == [sys2, user]
+    # The user is not followed to sys5.
+    assert empty_model.get_neighbours(sys1, SoftwareSystem, depth=2) == [sys2, sys3]
+    assert empty_model.get_neighbours(sys1, depth=10) == [
+        sys2,
+        user,
+        sys3,
+        sys5,
+        sys4,
+    ]
+
+
+def test_model_get_neighbours_rejects_invalid_depth(empty_model: Model):
+    """Test that the depth of a neighbourhood must be positive."""
+    system = empty_model.add_software_system(name="System")
+    with pytest.raises(ValueError, match="depth must be at least one"):
+        empty_model.get_neighbours(system, depth=0)
@@ -159,3 +159,4 @@ def test_software_system_serialisation(model_with_system: MockModel):
     container = next(iter(new_system.containers))
     assert container.name == "Test"
     assert container.parent is new_system
+    assert new_system.get_container_with_name("Test") is container
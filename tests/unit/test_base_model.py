@@ -16,9 +16,89 @@
 """Ensure the expected behaviour of the base model."""
 
 
+import pytest
+from pydantic import ValidationError
+
+from structurizr import json_backend
 from structurizr.base_model import BaseModel
+from structurizr.json_backend import StandardJSONBackend
+from structurizr.model import Location, Model, ModelIO, PersonIO
 
 
 def test_base_init():
     """Expect proper initialization from arguments."""
     BaseModel()
+
+
+def test_parse_obj_trusted():
+    """Expect nested models, enumerations and pre-validators without validation."""
+    obj = {
+        "people": [
+            {
+                "id": "1",
+                "name": " Bob ",
+                "tags": "Element,Person",
+                "location": "Internal",
+            }
+        ],
+        "softwareSystems": [{"id": "2", "name": "System", "containers": []}],
+    }
+    model_io = ModelIO.parse_obj_trusted(obj)
+    person_io = model_io.people[0]
+    assert isinstance(person_io, PersonIO)
+    assert person_io.name == " Bob "  # Whitespace is not stripped.
+    assert person_io.tags == ["Element", "Person"]
+    assert person_io.location is Location.Internal
+    assert model_io.software_systems[0].name == "System"
+    assert model_io.deployment_nodes == ()
+
+
+def test_parse_obj_trusted_matches_parse_obj():
+    """Expect the same result as with validation for valid input."""
+    obj = {
+        "people": [{"id": "1", "name": "Bob", "tags": "Element,Person"}],
+        "softwareSystems": [
+            {
+                "id": "2",
+                "name": "System",
+                "url": "https://example.com",
+                "relationships": [{"id": "3", "sourceId": "2", "destinationId": "1"}],
+            }
+        ],
+    }
+    assert ModelIO.parse_obj_trusted(obj) == ModelIO.parse_obj(obj)
+
+
+def test_json_from_orm_matches_from_orm(monkeypatch):
+    """Expect the same JSON as with an intermediate model."""
+    monkeypatch.setattr(json_backend, "_json_backend", StandardJSONBackend())
+    model = Model()
+    person = model.add_person(name=" Bob ", location=Location.External)
+    person.tags.add("Customer")
+    system = model.add_software_system(name="System", url="https://example.com")
+    system.add_container(name="Web", technology="Python")
+    person.uses(system, "Uses", properties={" key ": " value "})
+    assert ModelIO.json_from_orm(model) == ModelIO.from_orm(model).json()
+
+
+def test_json_from_orm_update(monkeypatch):
+    """Expect updated values to be serialized in field order."""
+    monkeypatch.setattr(json_backend, "_json_backend", StandardJSONBackend())
+    model = Model()
+    person = model.add_person(name="Bob")
+    expected = PersonIO.from_orm(person)
+    expected.id = "42"
+    expected.location = Location.Internal
+    actual = PersonIO.json_from_orm(
+        person, update={"id": "42", "location": Location.Internal}
+    )
+    assert actual == expected.json()
+
+
+def test_json_from_orm_invalid():
+    """Expect objects that cannot be represented by a model to be rejected."""
+    model = Model()
+    person = model.add_person(name="Bob")
+    person.name = None
+    with pytest.raises(ValidationError):
+        PersonIO.json_from_orm(person)
@@ -0,0 +1,98 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behaviour of the interchangeable JSON libraries."""
+
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from structurizr import Workspace, WorkspaceIO, json_backend
+from structurizr.json_backend import (
+    JSON_BACKENDS,
+    StandardJSONBackend,
+    get_json_backend,
+    set_json_backend,
+)
+from structurizr.model import InteractionStyle
+
+
+@pytest.fixture(params=list(JSON_BACKENDS))
+def backend(request, monkeypatch):
+    """Select each installed JSON backend in turn."""
+    if not JSON_BACKENDS[request.param].available:
+        pytest.skip(f"'{request.param}' is not installed.")
+    monkeypatch.setattr(json_backend, "_json_backend", None)
+    return set_json_backend(request.param)
+
+
+def test_round_trip(backend):
+    """Expect the same values as with the standard library."""
+    obj = {"name": "Zoë", "url": "https://example.com/a", "size": [1, 2.5, None]}
+    assert json.loads(backend.dumpb(obj)) == obj
+    assert json.loads(backend.dumps(obj, indent=2)) == obj
+    assert backend.loads(json.dumps(obj)) == obj
+    assert backend.loads(json.dumps(obj).encode("utf-8")) == obj
+
+
+def test_default(backend):
+    """Expect unknown types to be passed to the `default` function."""
+    obj = {"date": datetime(2021, 6, 10, tzinfo=timezone.utc)}
+    actual = backend.dumps(obj, default=lambda value: value.isoformat())
+    assert json.loads(actual) == {"date": "2021-06-10T00:00:00+00:00"}
+
+
+def test_unsupported_arguments_fall_back(backend):
+    """Expect arguments that a library lacks to be handled by the standard library."""
+    obj = {"b": 1, "a": [1, 2]}
+    expected = json.dumps(obj, indent=4, separators=(",", " : "))
+    assert backend.dumps(obj, indent=4, separators=(",", " : ")) == expected
+
+
+def test_workspace_round_trip(backend):
+    """Expect workspaces to be written and read with the selected library."""
+    workspace = Workspace(name="Zoë's workspace", description="Ünïcode")
+    system = workspace.model.add_software_system(name="System")
+    person = workspace.model.add_person(name="User")
+    person.uses(system, "Uses", interaction_style=InteractionStyle.Asynchronous)
+    actual = Workspace.loads(workspace.dumps())
+    assert actual.name == workspace.name
+    assert actual.description == workspace.description
+    (relationship,) = actual.model.get_relationships()
+    assert relationship.interaction_style is InteractionStyle.Asynchronous
+
+
+def test_select_by_name(monkeypatch):
+    """Expect backends to be selected by name, instance, or automatically."""
+    monkeypatch.setattr(json_backend, "_json_backend", None)
+    assert isinstance(set_json_backend("json"), StandardJSONBackend)
+    backend = StandardJSONBackend()
+    assert set_json_backend(backend) is get_json_backend() is backend
+    assert set_json_backend().available
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
+
+
+def test_strings_are_standard_by_default(monkeypatch):
+    """Expect JSON strings to be formatted like by the standard library by default."""
+    monkeypatch.setattr(json_backend, "_json_backend", None)
+    monkeypatch.delenv("STRUCTURIZR_JSON_BACKEND", raising=False)
+    workspace = Workspace(name="Zoë's workspace", description="Ünïcode")
+    workspace.model.add_software_system(name="System")
+    assert workspace.dumps() == WorkspaceIO.from_orm(workspace).json()
+    obj = {"name": "Zoë", "size": [1, 2.5]}
+    assert json_backend.dumps(obj) == json.dumps(obj)
@@ -311,6 +311,34 @@ def test_add_animation_step(empty_workspace: Workspace):
     assert next(iter(web_application_instance.relationships)).id in step2.relationships
 
 
+def test_add_animation_step_after_hydration(empty_workspace: Workspace):
+    """Expect that elements of hydrated animation steps are not shown again."""
+    model = empty_workspace.model
+    software_system = model.add_software_system("Software System")
+    web_application = software_system.add_container("Web Application")
+    database = software_system.add_container("Database")
+    web_application.uses(database, "Reads from and writes to", "JDBC/HTTPS")
+    developer_laptop = model.add_deployment_node("Developer Laptop")
+    web_application_instance = developer_laptop.add_container(web_application)
+    database_instance = developer_laptop.add_container(database)
+    deployment_view = empty_workspace.views.create_deployment_view(
+        software_system=software_system, key="deployment", description="Description"
+    )
+    deployment_view += developer_laptop
+    deployment_view.add_animation(web_application_instance)
+
+    workspace = Workspace.loads(empty_workspace.dumps())
+    new_view = next(iter(workspace.views.deployment_views))
+    new_view.add_animation(
+        workspace.model.get_element(web_application_instance.id),
+        workspace.model.get_element(database_instance.id),
+    )
+
+    step2 = new_view.animations[1]
+    assert step2.elements == {database_instance.id}
+    assert len(step2.relationships) == 1
+
+
 def test_animation_ignores_containers_outside_this_view(empty_workspace: Workspace):
     """Check that containers outside this view are ignored when adding animations."""
     model = empty_workspace.model
@@ -466,6 +494,36 @@ def test_deployment_view_removing_parent_deployment_node(empty_workspace: Worksp
     assert len(deployment_view.element_views) == 0
 
 
+def test_deployment_view_removing_many(empty_workspace: Workspace):
+    """Test removing several nodes and instances, including their contents."""
+    model = empty_workspace.model
+    software_system = model.add_software_system("Software System")
+    web_application = software_system.add_container("Web Application")
+    database = software_system.add_container("Database")
+    web_application.uses(database, "Reads from and writes to")
+    node1 = model.add_deployment_node("Node 1")
+    node2 = model.add_deployment_node("Node 2")
+    child_node = node1.add_deployment_node("Child Node")
+    web_application_instance = child_node.add_container(web_application)
+    database_instance = node2.add_container(database)
+    backup_instance = node2.add_container(database)
+
+    deployment_view = empty_workspace.views.create_deployment_view(
+        software_system=software_system, key="deployment", description="Description"
+    )
+    deployment_view.add_all_deployment_nodes()
+    assert len(deployment_view.element_views) == 6
+    assert len(deployment_view.relationship_views) == 2
+
+    deployment_view.remove_many([node1, backup_instance])
+    assert {v.element for v in deployment_view.element_views} == {
+        node2,
+        database_instance,
+    }
+    assert deployment_view.relationship_views == set()
+    assert empty_workspace.views.get_views_with_element(web_application_instance) == []
+
+
 def test_deployment_view_hydration(empty_workspace: Workspace):
     """Test round-tripping via the DeploymentViewIO instance."""
     model = empty_workspace.model
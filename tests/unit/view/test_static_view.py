@@ -70,3 +70,75 @@ def test_add_nearest_neighbours_doesnt_dupe_relationships():
     # The next line should not add any new relationships
     view.add_nearest_neighbours(sys1, Person)
     assert len(view.relationship_views) == 1
+
+
+def test_add_nearest_neighbours_keeps_self_relationships():
+    """Expect the relationships of an element with itself to be added."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+    ab = sys1.uses(sys2, "ab")
+    loop = sys1.uses(sys1, "self")
+    view = DerivedView(software_system=sys1, description="")
+    view.add_nearest_neighbours(sys1, SoftwareSystem)
+    assert {v.relationship for v in view.relationship_views} == {ab, loop}
+
+
+def test_add_many():
+    """Expect adding many elements at once to equal adding them one by one."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+    sys3 = model.add_software_system(name="System 3")
+    person = model.add_person(name="Person 1")
+    sys1.uses(sys2)
+    sys2.uses(sys1)
+    sys3.uses(sys1)
+    person.uses(sys3)
+
+    view = DerivedView(software_system=sys1, description="")
+    view.add(person)
+    view.add_many([sys1, sys2, sys3])
+    expected = DerivedView(software_system=sys1, description="")
+    for element in (person, sys1, sys2, sys3):
+        expected.add(element)
+
+    assert {v.id for v in view.element_views} == {v.id for v in expected.element_views}
+    assert {v.id for v in view.relationship_views} == {
+        v.id for v in expected.relationship_views
+    }
+    assert len(view.relationship_views) == 4
+
+
+def test_add_many_without_relationships():
+    """Expect that relationships can be left out when adding many elements."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+    sys1.uses(sys2)
+
+    view = DerivedView(software_system=sys1, description="")
+    view.add_many([sys1, sys2], add_relationships=False)
+
+    assert len(view.element_views) == 2
+    assert len(view.relationship_views) == 0
+
+
+def test_add_nearest_neighbours_with_depth():
+    """Test adding neighbours of several types within two hops."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+    sys3 = model.add_software_system(name="System 3")
+    sys4 = model.add_software_system(name="System 4")
+    person = model.add_person(name="Person 1")
+    person.uses(sys1)
+    sys1.uses(sys2)
+    sys2.uses(sys3)
+    sys3.uses(sys4)
+
+    view = DerivedView(software_system=sys1, description="")
+    view.add_nearest_neighbours(sys1, (Person, SoftwareSystem), depth=2)
+
+    assert {v.element for v in view.element_views} == {person, sys1, sys2, sys3}
+    assert len(view.relationship_views) == 3
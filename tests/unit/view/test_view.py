@@ -15,6 +15,8 @@
 
 """Ensure the expected behaviour of View."""
 
+import pytest
+
 from structurizr.model import Model
 from structurizr.view.paper_size import PaperSize
 from structurizr.view.view import View, ViewIO
@@ -196,3 +198,79 @@ def test_repr():
     """Test __repr__ for views."""
     view = DerivedView(key="testkey", title="title", description="description")
     assert repr(view) == "DerivedView(key=testkey)"
+
+
+def test_element_views_are_unique_per_element():
+    """Ensure adding and removing elements keeps a single view per element."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+
+    view = DerivedView(software_system=sys1, description="")
+    element_view = view._add_element(sys1, False)
+    assert view._add_element(sys1, False) is element_view
+    view._add_element(sys2, False)
+    assert len(view.element_views) == 2
+
+    view._remove_element(sys1)
+    assert not view.is_element_in_view(sys1)
+    assert {v.element for v in view.element_views} == {sys2}
+
+
+def test_element_and_relationship_views_are_read_only():
+    """Ensure that mutating the returned views fails rather than being ignored."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+    sys1.uses(sys2)
+
+    view = DerivedView(software_system=sys1, description="")
+    view._add_elements([sys1, sys2], True)
+    with pytest.raises(AttributeError):
+        view.element_views.discard(next(iter(view.element_views)))
+    with pytest.raises(AttributeError):
+        view.relationship_views.clear()
+    assert len(view.element_views) == 2
+    assert len(view.relationship_views) == 1
+
+
+def test_adding_all_relationships_twice_doesnt_duplicate():
+    """Ensure re-adding an element's relationships doesn't duplicate their views."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+    rel = sys1.uses(sys2)
+
+    view = DerivedView(software_system=sys1, description="")
+    view._add_element(sys1, False)
+    view._add_element(sys2, True)
+    view._add_element(sys1, True)
+    assert len(view.relationship_views) == 1
+    assert view.find_relationship_view(relationship=rel) is not None
+
+    view._remove_element(sys2)
+    assert view.relationship_views == set()
+    assert view.find_relationship_view(relationship=rel) is None
+
+
+def test_remove_many():
+    """Test removing several elements and their relationships at once."""
+    model = Model()
+    sys1 = model.add_software_system(name="System 1")
+    sys2 = model.add_software_system(name="System 2")
+    sys3 = model.add_software_system(name="System 3")
+    sys1.uses(sys2)
+    sys2.uses(sys3)
+    rel3 = sys3.uses(sys1)
+
+    view = DerivedView(software_system=sys1, description="")
+    view._add_elements([sys1, sys2, sys3], True)
+    assert len(view.relationship_views) == 3
+
+    view.remove_many([sys2])
+    assert {v.element for v in view.element_views} == {sys1, sys3}
+    assert [v.relationship for v in view.relationship_views] == [rel3]
+
+    view.remove_where(lambda element: element.name.endswith("3"))
+    assert {v.element for v in view.element_views} == {sys1}
+    assert view.relationship_views == set()
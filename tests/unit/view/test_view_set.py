@@ -163,6 +163,134 @@ def test_duplicate_key_raises_error(empty_viewset):
         )
 
 
+def test_typed_views(empty_viewset):
+    """Test that views are partitioned by their type."""
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+    landscape = viewset.create_system_landscape_view(key="landscape", description="")
+    context = viewset.create_system_context_view(
+        key="context", description="", software_system=system1
+    )
+    container = viewset.create_container_view(
+        key="container", description="", software_system=system1
+    )
+
+    assert viewset.system_landscape_views == [landscape]
+    assert viewset.system_context_views == [context]
+    assert viewset.container_views == [container]
+    assert viewset.component_views == []
+
+
+def test_get_scoped_views(empty_viewset):
+    """Test finding the views of a software system or container."""
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+    system2 = viewset.model.add_software_system(name="sys2")
+    container1 = system1.add_container(name="container1")
+    context = viewset.create_system_context_view(
+        key="context", description="", software_system=system1
+    )
+    container = viewset.create_container_view(
+        key="container", description="", software_system=system1
+    )
+    component = viewset.create_component_view(
+        key="component", description="", container=container1
+    )
+    dynamic = viewset.create_dynamic_view(
+        key="dynamic", description="", element=container1
+    )
+    viewset.create_container_view(key="other", description="", software_system=system2)
+
+    assert viewset.get_scoped_views(system1) == [context, container]
+    assert viewset.get_scoped_views(system1, ContainerView) == [container]
+    assert viewset.get_scoped_views(container1) == [component, dynamic]
+    new_viewset = ViewSet.hydrate(ViewSetIO.from_orm(viewset), viewset.model)
+    assert [v.key for v in new_viewset.get_scoped_views(system1)] == [
+        "context",
+        "container",
+    ]
+
+
+def test_get_views_with_element(empty_viewset):
+    """Test finding the views that contain an element."""
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+    container1 = system1.add_container(name="container1")
+    container2 = system1.add_container(name="container2")
+    container_view = viewset.create_container_view(
+        key="container", description="", software_system=system1
+    )
+    component_view = viewset.create_component_view(
+        key="component", description="", container=container1
+    )
+    container_view.add(container1)
+    container_view.add(container2)
+    component_view.add(container2)
+
+    assert viewset.get_views_with_element(container1) == [container_view]
+    assert viewset.get_views_with_element(container2) == [
+        container_view,
+        component_view,
+    ]
+
+    component_view.remove(container2)
+    assert viewset.get_views_with_element(container2) == [container_view]
+    assert viewset.get_views_with_element(system1) == []
+
+    new_viewset = ViewSet.hydrate(ViewSetIO.from_orm(viewset), viewset.model)
+    assert [v.key for v in new_viewset.get_views_with_element(container1)] == [
+        "container"
+    ]
+    new_viewset["component"].add(container1)
+    assert [v.key for v in new_viewset.get_views_with_element(container1)] == [
+        "container",
+        "component",
+    ]
+
+
+def test_lazy_hydration(empty_viewset):
+    """Test that lazily loaded views are hydrated on first access."""
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+    container1 = system1.add_container(name="container1")
+    context = viewset.create_system_context_view(
+        key="context", description="", software_system=system1
+    )
+    container_view = viewset.create_container_view(
+        key="container", description="", software_system=system1
+    )
+    container_view.add(container1)
+    viewset.create_filtered_view(
+        key="filter",
+        view=container_view,
+        description="",
+        mode=FilterMode.Include,
+        tags=["v2"],
+    )
+    io = ViewSetIO.from_orm(viewset)
+
+    new_viewset = ViewSet.hydrate(io, viewset.model, lazy=True)
+    assert set(new_viewset._pending_views) == {"context", "container", "filter"}
+    assert new_viewset.get_view("context").key == "context"
+    assert set(new_viewset._pending_views) == {"container", "filter"}
+    # Hydrating a filtered view also hydrates the view that it refers to.
+    assert new_viewset["filter"].view is new_viewset._views["container"]
+    assert not new_viewset._pending_views
+
+    new_viewset = ViewSet.hydrate(io, viewset.model, lazy=True)
+    assert [v.key for v in new_viewset.system_context_views] == [context.key]
+    assert set(new_viewset._pending_views) == {"container", "filter"}
+    with pytest.raises(ValueError, match="View already exists"):
+        new_viewset.create_container_view(
+            key="container", description="", software_system=system1
+        )
+    assert [v.key for v in new_viewset.get_views_with_element(container1)] == [
+        "container"
+    ]
+    assert not new_viewset._pending_views
+    assert ViewSetIO.from_orm(new_viewset) == io
+
+
 def count(iterable: Iterable) -> int:
     """Count items in an iterable, as len doesn't work on generators."""
     return sum(1 for x in iterable)